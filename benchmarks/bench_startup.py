@@ -0,0 +1,115 @@
+"""
+Startup benchmark for the get-papers-list command.
+
+Measures, in fresh interpreter processes, how long it takes to import the CLI
+module and to run `--help`, and reports which heavy third-party packages were
+loaded along the way. Run from the repository root:
+
+    python benchmarks/bench_startup.py --runs 20
+
+With --max-import-ms the script exits non-zero when the median import time
+exceeds the budget, so it can guard against regressions in CI.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Packages the CLI should only load once a query actually runs
+HEAVY_MODULES = ["requests", "lxml", "bs4", "pandas", "pyarrow", "aiohttp", "asyncio", "sqlite3"]
+
+IMPORT_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import pubmed_paper_finder.cli
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy_modules": heavy}}))
+"""
+
+def measure_import(runs: int) -> Dict[str, object]:
+    """
+    Import the CLI module in `runs` fresh interpreters.
+
+    Args:
+        runs: Number of interpreter processes to start
+
+    Returns:
+        Median/min import time in milliseconds and the heavy modules loaded
+    """
+    snippet = IMPORT_SNIPPET.format(heavy=HEAVY_MODULES)
+    timings: List[float] = []
+    heavy: List[str] = []
+
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", snippet], check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output)
+        timings.append(result["seconds"] * 1000)
+        heavy = result["heavy_modules"]
+
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "min_ms": round(min(timings), 2),
+        "heavy_modules": heavy
+    }
+
+def measure_help(runs: int) -> Dict[str, float]:
+    """
+    Run `get-papers-list --help` in `runs` fresh interpreters, including interpreter startup.
+
+    Args:
+        runs: Number of processes to start
+
+    Returns:
+        Median/min wall time in milliseconds
+    """
+    timings: List[float] = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "pubmed_paper_finder.cli", "--help"],
+            check=True, capture_output=True
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "min_ms": round(min(timings), 2)
+    }
+
+def main() -> None:
+    """
+    Run the startup benchmark and print the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description="Measure get-papers-list startup time")
+    parser.add_argument("--runs", type=int, default=10, help="Number of runs per measurement (default: 10)")
+    parser.add_argument(
+        "--max-import-ms",
+        type=float,
+        help="Fail if the median CLI import time exceeds this many milliseconds"
+    )
+    args = parser.parse_args()
+
+    results = {
+        "python": sys.version.split()[0],
+        "import_cli": measure_import(args.runs),
+        "help": measure_help(args.runs)
+    }
+    print(json.dumps(results, indent=2))
+
+    if args.max_import_ms is not None and results["import_cli"]["median_ms"] > args.max_import_ms:
+        print(
+            f"CLI import took {results['import_cli']['median_ms']} ms, budget is {args.max_import_ms} ms",
+            file=sys.stderr
+        )
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
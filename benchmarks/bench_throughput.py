@@ -0,0 +1,191 @@
+"""
+Throughput benchmarks for the search → fetch → parse → classify → export pipeline.
+
+Runs against the local E-utilities stand-in in fake_eutils.py, so results are
+reproducible and need no network access. Measures:
+
+- end-to-end papers/sec through PubMedAPI, identify_non_academic_authors and export
+- time spent in PubMedAPI._parse_fetch_response per efetch batch, per parser backend
+- per-author classification rate of filters.identify_non_academic_authors
+- export time per output format
+
+Results are written as JSON so runs can be compared across versions:
+
+    python benchmarks/bench_throughput.py --papers 2000 --output results/bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_eutils import FIRST_PMID, FakeEutilsConfig, FakeEutilsServer, efetch_xml  # noqa: E402
+
+from pubmed_paper_finder.api import PubMedAPI  # noqa: E402
+from pubmed_paper_finder.filters import AffiliationCache, identify_non_academic_authors  # noqa: E402
+from pubmed_paper_finder.models import Paper  # noqa: E402
+from pubmed_paper_finder.parsers import PARSERS, parse_fetch_response  # noqa: E402
+from pubmed_paper_finder.ratelimit import RateLimiter  # noqa: E402
+from pubmed_paper_finder.utils import export_papers, export_to_csv  # noqa: E402
+
+BATCH_SIZE = 50
+
+def best_of(repeat: int, func: Callable[[], Any]) -> float:
+    """
+    Return the fastest wall time of `repeat` calls, in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def bench_end_to_end(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Search, fetch, classify and export through the fake server.
+    """
+    config = FakeEutilsConfig(
+        total_results=args.papers,
+        authors_per_paper=args.authors,
+        latency=args.latency,
+        rate_limit=args.server_rate_limit
+    )
+
+    with FakeEutilsServer(config=config) as server:
+        with PubMedAPI(
+            base_url=server.base_url,
+            max_workers=args.workers,
+            rate_limiter=RateLimiter(args.client_rate, burst=args.workers)
+        ) as api:
+            start = time.perf_counter()
+            pmids = api.search("benchmark", max_results=args.papers)
+            papers = api.fetch_papers(pmids)
+            fetched = time.perf_counter()
+            papers = identify_non_academic_authors(papers, AffiliationCache())
+            classified = time.perf_counter()
+            export_to_csv(papers)
+            end = time.perf_counter()
+
+        return {
+            "papers": len(papers),
+            "workers": args.workers,
+            "latency_s": args.latency,
+            "seconds": round(end - start, 4),
+            "papers_per_sec": round(len(papers) / (end - start), 1),
+            "fetch_seconds": round(fetched - start, 4),
+            "classify_seconds": round(classified - fetched, 4),
+            "export_seconds": round(end - classified, 4),
+            "requests": server.requests,
+            "throttled_requests": server.throttled
+        }
+
+def bench_parse(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Time PubMedAPI._parse_fetch_response on one efetch batch, per parser backend.
+    """
+    config = FakeEutilsConfig(authors_per_paper=args.authors)
+    xml_text = efetch_xml(list(range(FIRST_PMID, FIRST_PMID + BATCH_SIZE)), config)
+    results: Dict[str, Any] = {"batch_size": BATCH_SIZE, "xml_bytes": len(xml_text.encode("utf-8"))}
+
+    for parser in PARSERS:
+        api = PubMedAPI(parser=parser)
+        seconds = best_of(args.repeat, lambda: api._parse_fetch_response(xml_text))
+        api.close()
+        results[parser] = {
+            "seconds_per_batch": round(seconds, 6),
+            "papers_per_sec": round(BATCH_SIZE / seconds, 1)
+        }
+
+    return results
+
+def _synthetic_papers(count: int, authors: int) -> List[Paper]:
+    config = FakeEutilsConfig(authors_per_paper=authors)
+    papers: List[Paper] = []
+    for start in range(FIRST_PMID, FIRST_PMID + count, BATCH_SIZE):
+        end = min(start + BATCH_SIZE, FIRST_PMID + count)
+        papers.extend(parse_fetch_response(efetch_xml(list(range(start, end)), config)))
+    return papers
+
+def bench_classify(args: argparse.Namespace, papers: List[Paper]) -> Dict[str, Any]:
+    """
+    Measure the per-author classification rate, with and without the affiliation cache.
+    """
+    author_count = sum(len(paper.authors) for paper in papers)
+    uncached = best_of(args.repeat, lambda: identify_non_academic_authors(papers))
+    cached = best_of(args.repeat, lambda: identify_non_academic_authors(papers, AffiliationCache()))
+
+    return {
+        "authors": author_count,
+        "uncached_authors_per_sec": round(author_count / uncached, 1),
+        "cached_authors_per_sec": round(author_count / cached, 1)
+    }
+
+def bench_export(args: argparse.Namespace, papers: List[Paper]) -> Dict[str, Any]:
+    """
+    Time exporting classified papers in each text output format.
+    """
+    papers = identify_non_academic_authors(papers)
+    results: Dict[str, Any] = {"papers": sum(1 for paper in papers if paper.non_academic_authors)}
+
+    results["csv"] = round(best_of(args.repeat, lambda: export_to_csv(papers)), 6)
+    results["csv_pandas"] = round(best_of(args.repeat, lambda: export_to_csv(papers, engine="pandas")), 6)
+    results["jsonl"] = round(best_of(args.repeat, lambda: export_papers(papers, output_format="jsonl")), 6)
+
+    return results
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], check=True, capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main() -> None:
+    """
+    Run the benchmarks and print (or save) the results as JSON.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the PubMed paper finder pipeline")
+    parser.add_argument("--papers", type=int, default=1000, help="Number of papers (default: 1000)")
+    parser.add_argument("--authors", type=int, default=6, help="Authors per synthetic paper (default: 6)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent efetch batches (default: 4)")
+    parser.add_argument("--latency", type=float, default=0.02, help="Fake server latency in seconds (default: 0.02)")
+    parser.add_argument("--server-rate-limit", type=float, help="Requests/sec above which the fake server answers 429")
+    parser.add_argument("--client-rate", type=float, default=1000.0, help="Client rate limit in requests/sec (default: 1000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions of the micro benchmarks (default: 5)")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    papers = _synthetic_papers(args.papers, args.authors)
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform()
+        },
+        "end_to_end": bench_end_to_end(args),
+        "parse": bench_parse(args),
+        "classify": bench_classify(args, papers),
+        "export": bench_export(args, papers)
+    }
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+Local stand-in for the NCBI E-utilities used by the benchmarks.
+
+Serves synthetic esearch JSON and efetch XML with configurable latency and
+rate limiting, so the client can be measured end to end without network
+access. Articles are generated deterministically from their PubMed ID.
+
+    python benchmarks/fake_eutils.py --port 8765 --latency 0.05 --rate-limit 10
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+FIRST_PMID = 30_000_000
+
+ACADEMIC_AFFILIATIONS = [
+    "Department of Oncology, Stanford University School of Medicine, Stanford, CA, USA",
+    "Harvard Medical School, Boston, MA, USA",
+    "Institute of Pharmacology, University of Heidelberg, Heidelberg, Germany",
+    "National Institutes of Health, Bethesda, MD, USA",
+    "Karolinska Institutet, Stockholm, Sweden"
+]
+
+COMPANY_AFFILIATIONS = [
+    "Pfizer Inc., New York, NY, USA",
+    "Genentech, Inc., South San Francisco, CA, USA",
+    "Novartis Institutes for BioMedical Research, Cambridge, MA, USA",
+    "Regeneron Pharmaceuticals, Tarrytown, NY, USA",
+    "Acme Biotherapeutics Ltd, London, UK"
+]
+
+FIRST_NAMES = ["John", "Alice", "Wei", "Maria", "Ahmed", "Yuki", "Olga", "Pedro"]
+LAST_NAMES = ["Smith", "Johnson", "Zhang", "Garcia", "Khan", "Tanaka", "Ivanova", "Silva"]
+
+class FakeEutilsConfig:
+    """
+    Behaviour of the stand-in server.
+    """
+
+    def __init__(
+        self,
+        total_results: int = 10_000,
+        authors_per_paper: int = 6,
+        company_fraction: float = 0.2,
+        latency: float = 0.0,
+        rate_limit: Optional[float] = None
+    ):
+        """
+        Args:
+            total_results: Number of hits every search reports
+            authors_per_paper: Number of authors of each synthetic article
+            company_fraction: Probability that an author has a company affiliation
+            latency: Seconds added to every response
+            rate_limit: Requests per second above which 429 is returned, None for no limit
+        """
+        self.total_results = total_results
+        self.authors_per_paper = authors_per_paper
+        self.company_fraction = company_fraction
+        self.latency = latency
+        self.rate_limit = rate_limit
+
+def article_xml(pmid: int, config: FakeEutilsConfig) -> str:
+    """
+    Return the PubmedArticle element of a synthetic article.
+
+    Args:
+        pmid: PubMed ID, also used as the random seed
+        config: Server configuration
+
+    Returns:
+        XML text of one PubmedArticle
+    """
+    rng = random.Random(pmid)
+    authors = []
+    for index in range(config.authors_per_paper):
+        if rng.random() < config.company_fraction:
+            affiliation = rng.choice(COMPANY_AFFILIATIONS)
+        else:
+            affiliation = rng.choice(ACADEMIC_AFFILIATIONS)
+        last_name = rng.choice(LAST_NAMES)
+        first_name = rng.choice(FIRST_NAMES)
+        corresp = '<Identifier Source="CORRESP">yes</Identifier>' if index == 0 else ""
+        email = f" {first_name.lower()}.{last_name.lower()}@example.org" if index == 0 else ""
+        authors.append(
+            f"<Author ValidYN=\"Y\"><LastName>{last_name}</LastName><ForeName>{first_name}</ForeName>"
+            f"{corresp}<AffiliationInfo><Affiliation>{escape(affiliation)}{email}</Affiliation>"
+            f"</AffiliationInfo></Author>"
+        )
+
+    return (
+        "<PubmedArticle><MedlineCitation Status=\"MEDLINE\" Owner=\"NLM\">"
+        f"<PMID Version=\"1\">{pmid}</PMID>"
+        f"<DateRevised><Year>2024</Year><Month>{rng.randint(1, 12):02d}</Month><Day>{rng.randint(1, 28):02d}</Day></DateRevised>"
+        "<Article PubModel=\"Print\"><Journal><JournalIssue CitedMedium=\"Internet\">"
+        f"<PubDate><Year>{rng.randint(2000, 2024)}</Year><Month>{rng.randint(1, 12):02d}</Month></PubDate>"
+        "</JournalIssue></Journal>"
+        f"<ArticleTitle>Synthetic study {pmid} of target {rng.randint(1, 500)} &amp; response</ArticleTitle>"
+        f"<AuthorList CompleteYN=\"Y\">{''.join(authors)}</AuthorList>"
+        "</Article></MedlineCitation></PubmedArticle>"
+    )
+
+def efetch_xml(pmids: List[int], config: FakeEutilsConfig) -> str:
+    """
+    Return an efetch response for the given PubMed IDs.
+    """
+    articles = "".join(article_xml(pmid, config) for pmid in pmids)
+    return f"<?xml version=\"1.0\" ?>\n<PubmedArticleSet>{articles}</PubmedArticleSet>"
+
+class _RateWindow:
+    """
+    Counts requests over the last second to emulate NCBI's 429 responses.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._times: List[float] = []
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._times = [t for t in self._times if now - t < 1.0]
+            if len(self._times) >= self.rate:
+                return False
+            self._times.append(now)
+            return True
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "FakeEutilsServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        # Keep benchmark output clean
+        pass
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        self._handle(url.path, {key: values[-1] for key, values in parse_qs(url.query).items()})
+
+    def do_POST(self) -> None:
+        # Long efetch ID lists arrive as a form body
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8")
+        self._handle(urlparse(self.path).path, {key: values[-1] for key, values in parse_qs(body).items()})
+
+    def _handle(self, path: str, params: Dict[str, str]) -> None:
+        self.server.requests += 1
+
+        if self.server.rate_window and not self.server.rate_window.allow():
+            self.server.throttled += 1
+            self._send(429, "text/plain", "Too Many Requests")
+            return
+
+        if self.server.config.latency:
+            time.sleep(self.server.config.latency)
+
+        if path.endswith("/esearch.fcgi"):
+            status, content_type, body = self.server.esearch(params)
+        elif path.endswith("/efetch.fcgi"):
+            status, content_type, body = self.server.efetch(params)
+        else:
+            status, content_type, body = 404, "text/plain", "Not Found"
+
+        self._send(status, content_type, body)
+
+    def _send(self, status: int, content_type: str, body: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+class FakeEutilsServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server answering esearch and efetch requests with synthetic data.
+    """
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, config: Optional[FakeEutilsConfig] = None):
+        """
+        Args:
+            port: Port to listen on, 0 for any free port
+            config: Server behaviour, defaults to FakeEutilsConfig()
+        """
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.config = config or FakeEutilsConfig()
+        self.rate_window = _RateWindow(self.config.rate_limit) if self.config.rate_limit else None
+        self.requests = 0
+        self.throttled = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        E-utilities base URL to pass to PubMedAPI(base_url=...).
+        """
+        return f"http://127.0.0.1:{self.server_address[1]}/entrez/eutils"
+
+    def __enter__(self) -> "FakeEutilsServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def esearch(self, params: Dict[str, str]) -> Tuple[int, str, str]:
+        total = self.config.total_results
+        if params.get("usehistory") == "y":
+            result = {"count": str(total), "retmax": "0", "idlist": [], "webenv": "FAKE_WEBENV", "querykey": "1"}
+        else:
+            retmax = min(int(params.get("retmax", 20)), total)
+            idlist = [str(FIRST_PMID + i) for i in range(retmax)]
+            result = {"count": str(total), "retmax": str(retmax), "idlist": idlist}
+        return 200, "application/json", json.dumps({"esearchresult": result})
+
+    def efetch(self, params: Dict[str, str]) -> Tuple[int, str, str]:
+        if "id" in params:
+            pmids = [int(pmid) for pmid in params["id"].split(",") if pmid]
+        else:
+            retstart = int(params.get("retstart", 0))
+            retmax = int(params.get("retmax", 20))
+            end = min(retstart + retmax, self.config.total_results)
+            pmids = [FIRST_PMID + i for i in range(retstart, end)]
+        return 200, "text/xml", efetch_xml(pmids, self.config)
+
+def main() -> None:
+    """
+    Run the stand-in server until interrupted.
+    """
+    parser = argparse.ArgumentParser(description="Local fake NCBI E-utilities server")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument("--total-results", type=int, default=10_000, help="Hits reported by every search")
+    parser.add_argument("--authors", type=int, default=6, help="Authors per synthetic article")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--rate-limit", type=float, help="Requests per second before answering 429")
+    args = parser.parse_args()
+
+    config = FakeEutilsConfig(
+        total_results=args.total_results,
+        authors_per_paper=args.authors,
+        latency=args.latency,
+        rate_limit=args.rate_limit
+    )
+    server = FakeEutilsServer(args.port, config)
+    print(f"Serving fake E-utilities at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Asyncio client for the PubMed E-utilities API.
+
+Requires the optional `aiohttp` dependency (`pip install pubmed-paper-finder[async]`).
+"""
+
+import asyncio
+import json
+import logging
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+import aiohttp
+
+from .api import FETCH_BATCH_SIZE, RETRY_STATUSES, PubMedAPI
+from .models import Paper
+from .parsers import parse_fetch_response
+from .ratelimit import RateLimiter, ncbi_rate_limit
+
+logger = logging.getLogger(__name__)
+
+class AsyncPubMedAPI:
+    """
+    Asyncio counterpart of PubMedAPI with the same search/fetch_papers surface.
+
+    All requests go through one pooled aiohttp session and one rate limiter, so
+    any number of concurrent calls stays within the NCBI request limits.
+    """
+    SEARCH_URL = PubMedAPI.SEARCH_URL
+    FETCH_URL = PubMedAPI.FETCH_URL
+
+    def __init__(
+        self,
+        email: str = "your.email@example.com",
+        tool: str = "pubmed-paper-finder",
+        api_key: Optional[str] = None,
+        max_concurrency: int = 4,
+        pool_size: int = 10,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        timeout: Optional[float] = 30.0,
+        base_url: Optional[str] = None,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5
+    ):
+        """
+        Initialize the async PubMed API client.
+
+        Args:
+            email: Email to include in API requests (NCBI recommendation)
+            tool: Tool name to include in API requests (NCBI recommendation)
+            api_key: NCBI API key, raises the allowed request rate from 3 to 10 per second
+            max_concurrency: Number of efetch batches to keep in flight at once;
+                iter_papers buffers at most twice as many
+            pool_size: Maximum number of pooled connections
+            rate_limiter: Rate limiter shared by all requests, defaults to the NCBI limit
+            session: Existing aiohttp session to use instead of creating one
+            timeout: Total timeout for each request in seconds, None for no timeout
+            base_url: E-utilities base URL, e.g. a local stand-in server for benchmarks
+            max_retries: Number of retries on connection errors, timeouts, 429 and 5xx responses
+            backoff_factor: Exponential backoff factor between retries, in seconds
+        """
+        self.email = email
+        self.tool = tool
+        self.api_key = api_key
+        self.max_concurrency = max(1, max_concurrency)
+        self.pool_size = pool_size
+        self.rate_limiter = rate_limiter or RateLimiter(ncbi_rate_limit(api_key))
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_retries = max(0, max_retries)
+        self.backoff_factor = backoff_factor
+
+        if base_url:
+            base_url = base_url.rstrip("/")
+            self.SEARCH_URL = f"{base_url}/esearch.fcgi"
+            self.FETCH_URL = f"{base_url}/efetch.fcgi"
+
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self) -> "AsyncPubMedAPI":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the HTTP session if this client created it.
+        """
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the pooled session, creating it inside the running event loop.
+        """
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._owns_session = True
+        return self._session
+
+    def _base_params(self) -> Dict[str, Any]:
+        """
+        Return the parameters NCBI expects on every E-utilities request.
+        """
+        params: Dict[str, Any] = {
+            "db": "pubmed",
+            "tool": self.tool,
+            "email": self.email
+        }
+        if self.api_key:
+            params["api_key"] = self.api_key
+        return params
+
+    async def _get(self, url: str, params: Dict[str, Any]) -> str:
+        """
+        Issue a rate-limited GET request and return the response body.
+
+        Connection errors, timeouts, 429 and 5xx responses are retried with
+        exponential backoff (or the server's Retry-After), each attempt going
+        through the rate limiter like the sync client's requests.
+        """
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire_async()
+            delay = self.backoff_factor * 2 ** attempt
+            try:
+                # Passed per request too, so a session given by the caller gets the same timeout
+                async with self._get_session().get(url, params=params, timeout=self.timeout) as response:
+                    if response.status not in RETRY_STATUSES or attempt >= self.max_retries:
+                        response.raise_for_status()
+                        return await response.text()
+                    retry_after = response.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        delay = max(delay, float(retry_after))
+                    logger.debug(f"Request to {url} returned {response.status}, retrying in {delay:.1f}s")
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                logger.debug(f"Request to {url} failed ({e!r}), retrying in {delay:.1f}s")
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def search(self, query: str, max_results: int = 100) -> List[str]:
+        """
+        Search for papers matching the query and return PubMed IDs.
+
+        Args:
+            query: The search query in PubMed syntax
+            max_results: Maximum number of results to return
+
+        Returns:
+            List of PubMed IDs matching the query
+        """
+        logger.debug(f"Searching PubMed with query: {query}")
+
+        params = self._base_params()
+        params.update({
+            "term": query,
+            "retmax": max_results,
+            "retmode": "json"
+        })
+
+        data = json.loads(await self._get(self.SEARCH_URL, params))
+
+        pmids = data.get("esearchresult", {}).get("idlist", [])
+        logger.debug(f"Found {len(pmids)} papers matching the query")
+
+        return pmids
+
+    async def fetch_papers(self, pmids: List[str]) -> List[Paper]:
+        """
+        Fetch detailed information for a list of PubMed IDs.
+
+        Args:
+            pmids: List of PubMed IDs to fetch
+
+        Returns:
+            List of Paper objects in the same order as the PubMed IDs
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(*(
+            self._fetch_batch(batch, semaphore) for batch in self._batches(pmids)
+        ))
+
+        all_papers: List[Paper] = []
+        for papers in results:
+            all_papers.extend(papers)
+
+        return all_papers
+
+    async def iter_papers(self, pmids: List[str]) -> AsyncIterator[Paper]:
+        """
+        Fetch papers and yield them as soon as each batch has been parsed.
+
+        Batches complete in any order, so papers are not yielded in PMID order.
+        At most twice max_concurrency batches are scheduled or waiting to be
+        consumed at a time; the next batch is scheduled as one is consumed, so
+        memory stays bounded however many PubMed IDs are given.
+
+        Args:
+            pmids: List of PubMed IDs to fetch
+
+        Yields:
+            Paper objects with detailed information
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        batches = iter(self._batches(pmids))
+        pending: Set["asyncio.Future[List[Paper]]"] = {
+            asyncio.ensure_future(self._fetch_batch(batch, semaphore))
+            for batch in islice(batches, self.max_concurrency * 2)
+        }
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    # Replace the consumed batch to keep the window full
+                    for batch in islice(batches, 1):
+                        pending.add(asyncio.ensure_future(self._fetch_batch(batch, semaphore)))
+                    for paper in task.result():
+                        yield paper
+        finally:
+            for task in pending:
+                task.cancel()
+
+    @staticmethod
+    def _batches(pmids: List[str], batch_size: int = FETCH_BATCH_SIZE) -> List[List[str]]:
+        """
+        Split PubMed IDs into efetch batches.
+        """
+        return [pmids[i:i+batch_size] for i in range(0, len(pmids), batch_size)]
+
+    async def _fetch_batch(self, batch_pmids: List[str], semaphore: asyncio.Semaphore) -> List[Paper]:
+        """
+        Fetch and parse a single efetch batch.
+
+        Args:
+            batch_pmids: PubMed IDs to fetch in one request
+            semaphore: Semaphore bounding the number of batches in flight
+
+        Returns:
+            List of Paper objects parsed from the response
+        """
+        params = self._base_params()
+        params.update({
+            "id": ",".join(batch_pmids),
+            "retmode": "xml"
+        })
+
+        async with semaphore:
+            logger.debug(f"Fetching details for batch of {len(batch_pmids)} papers")
+            xml_text = await self._get(self.FETCH_URL, params)
+
+        # Parse off the event loop so other requests keep flowing
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, parse_fetch_response, xml_text)
@@ -1,15 +1,42 @@
 import logging
 import time
-from typing import Dict, List, Optional, Any, Iterator
-from datetime import datetime
-import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any, Iterator, Tuple
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .models import Paper, Author
+from .batching import FETCH_BATCH_SIZE, AdaptiveBatchSizer
+from .cache import ArticleCache, SearchCache
+from .metrics import Metrics
+from .models import Paper
+from .parsers import PARSERS, parse_fetch_response
+from .ratelimit import RateLimiter, ncbi_rate_limit
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Number of PubMed IDs looked up in the article cache at once
+CACHE_LOOKUP_CHUNK_SIZE = 5000
+
+# Batches with more PubMed IDs than this are sent to efetch as a POST form,
+# as NCBI recommends for long ID lists
+POST_THRESHOLD = 200
+
+@dataclass
+class SearchHistory:
+    """
+    Handle to a search result set stored on the NCBI history server.
+    """
+    webenv: str
+    query_key: str
+    count: int
+
 class PubMedAPI:
     """
     Client for interacting with the PubMed API to search and fetch paper details.
@@ -19,47 +46,413 @@ class PubMedAPI:
     FETCH_URL = f"{BASE_URL}/efetch.fcgi"
     SUMMARY_URL = f"{BASE_URL}/esummary.fcgi"
     
-    def __init__(self, email: str = "your.email@example.com", tool: str = "pubmed-paper-finder"):
+    def __init__(
+        self,
+        email: str = "your.email@example.com",
+        tool: str = "pubmed-paper-finder",
+        api_key: Optional[str] = None,
+        max_workers: int = 1,
+        rate_limiter: Optional[RateLimiter] = None,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        timeout: Optional[float] = 30.0,
+        session: Optional[requests.Session] = None,
+        parser: str = "lxml",
+        cache: Optional[ArticleCache] = None,
+        base_url: Optional[str] = None,
+        metrics: Optional[Metrics] = None,
+        search_cache: Optional[SearchCache] = None,
+        batch_sizer: Optional[AdaptiveBatchSizer] = None
+    ):
         """
         Initialize the PubMed API client.
         
         Args:
             email: Email to include in API requests (NCBI recommendation)
             tool: Tool name to include in API requests (NCBI recommendation)
+            api_key: NCBI API key, raises the allowed request rate from 3 to 10 per second
+            max_workers: Number of efetch batches to keep in flight at once
+            rate_limiter: Rate limiter shared by all requests, defaults to the NCBI limit
+            pool_size: Maximum number of pooled keep-alive connections
+            max_retries: Number of retries on connection errors, timeouts, 429 and 5xx responses
+            backoff_factor: Exponential backoff factor between retries, in seconds
+            timeout: Timeout for each request in seconds
+            session: Existing requests session to use instead of creating one
+            parser: XML parser backend, "lxml" (streaming) or "bs4" (BeautifulSoup)
+            cache: Article cache consulted before efetch
+            base_url: E-utilities base URL, e.g. a local stand-in server for benchmarks
+            metrics: Metrics recording request, timing and cache statistics
+            search_cache: Cache of esearch results consulted by search
+            batch_sizer: Sizes the efetch batches, defaults to adaptive sizing
+                starting at FETCH_BATCH_SIZE
         """
         self.email = email
         self.tool = tool
+        self.api_key = api_key
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = rate_limiter or RateLimiter(ncbi_rate_limit(api_key))
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown parser {parser!r}, expected one of {PARSERS}")
+        
+        if base_url:
+            base_url = base_url.rstrip("/")
+            self.SEARCH_URL = f"{base_url}/esearch.fcgi"
+            self.FETCH_URL = f"{base_url}/efetch.fcgi"
+            self.SUMMARY_URL = f"{base_url}/esummary.fcgi"
+        
+        self.timeout = timeout
+        self.max_retries = max(0, max_retries)
+        self.backoff_factor = backoff_factor
+        self.parser = parser
+        self.cache = cache
+        self.search_cache = search_cache
+        self.batch_sizer = batch_sizer or AdaptiveBatchSizer()
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.session = session or self._create_session(
+            pool_size=max(pool_size, self.max_workers),
+            max_retries=max_retries,
+            backoff_factor=backoff_factor
+        )
+    
+    def __enter__(self) -> "PubMedAPI":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and its pooled connections.
+        """
+        self.session.close()
+    
+    @staticmethod
+    def _create_session(pool_size: int, max_retries: int, backoff_factor: float) -> requests.Session:
+        """
+        Create a session with a keep-alive connection pool, connection retries and
+        gzip negotiation.
+        
+        Args:
+            pool_size: Maximum number of pooled connections per host
+            max_retries: Number of retries on failed connection attempts
+            backoff_factor: Exponential backoff factor between retries, in seconds
+            
+        Returns:
+            Configured requests session
+        """
+        # urllib3 only retries connection attempts, which never reached NCBI;
+        # timeouts, 429 and 5xx responses are retried by _request, through the
+        # rate limiter. efetch POST requests are idempotent reads, so they are
+        # retried too
+        retry = Retry(
+            total=max_retries,
+            read=False,
+            status_forcelist=(),
+            backoff_factor=backoff_factor,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"}
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        return session
+    
+    def _get(self, url: str, params: Dict[str, Any]) -> requests.Response:
+        """
+        Issue a rate-limited GET request on the pooled session.
+        
+        Args:
+            url: E-utilities endpoint URL
+            params: Query parameters
+            
+        Returns:
+            The successful response
+        """
+        return self._request("GET", url, params)[0]
+    
+    def _request(
+        self,
+        method: str,
+        url: str,
+        params: Dict[str, Any],
+        retry_statuses: Tuple[int, ...] = RETRY_STATUSES,
+        retry_timeouts: bool = True
+    ) -> Tuple[requests.Response, float]:
+        """
+        Issue a rate-limited request on the pooled session, retrying transient errors.
+        
+        Every attempt waits for the rate limiter, so retries of rate-limited or
+        failed requests stay within the NCBI request limits.
+        
+        Args:
+            method: "GET" (parameters in the query string) or "POST" (form body)
+            url: E-utilities endpoint URL
+            params: Request parameters
+            retry_statuses: Response statuses retried, up to max_retries times
+            retry_timeouts: Whether timeouts are retried
+            
+        Returns:
+            The successful response, and the seconds spent on the HTTP exchange
+            of the last attempt (excluding the rate-limit wait)
+        """
+        attempt = 0
+        while True:
+            # Wait for the rate limiter rather than sleeping a fixed time between requests
+            waited = self.rate_limiter.acquire()
+            self.metrics.increment("rate_limit_wait_seconds", waited)
+            retryable = attempt < self.max_retries
+            delay = self.backoff_factor * 2 ** attempt
+            
+            start = time.perf_counter()
+            try:
+                with self.metrics.stage("esearch" if url == self.SEARCH_URL else "efetch"):
+                    if method == "POST":
+                        response = self.session.post(url, data=params, timeout=self.timeout)
+                    else:
+                        response = self.session.get(url, params=params, timeout=self.timeout)
+                    self.metrics.increment("requests")
+                    
+                    if not (retryable and response.status_code in retry_statuses):
+                        response.raise_for_status()
+                        content = response.content
+                        break
+                
+                retry_after = str(response.headers.get("Retry-After", ""))
+                if retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+                response.close()
+                logger.debug(f"{url} returned {response.status_code}, retrying in {delay:.1f}s")
+            except requests.Timeout as e:
+                if not (retryable and retry_timeouts):
+                    raise
+                logger.debug(f"{url} timed out ({e}), retrying in {delay:.1f}s")
+            
+            attempt += 1
+            self.metrics.increment("retries")
+            time.sleep(delay)
+        latency = time.perf_counter() - start
+        
+        # urllib3 records the connection retries behind a response in its Retry history
+        retries = getattr(getattr(response.raw, "retries", None), "history", ())
+        self.metrics.increment("retries", len(retries))
+        self.metrics.increment("bytes_downloaded", len(content))
+        return response, latency
+    
+    def _base_params(self) -> Dict[str, Any]:
+        """
+        Return the parameters NCBI expects on every E-utilities request.
+        """
+        params: Dict[str, Any] = {
+            "db": "pubmed",
+            "tool": self.tool,
+            "email": self.email
+        }
+        if self.api_key:
+            params["api_key"] = self.api_key
+        return params
         
-    def search(self, query: str, max_results: int = 100) -> List[str]:
+    def search(
+        self,
+        query: str,
+        max_results: int = 100,
+        mindate: Optional[str] = None,
+        maxdate: Optional[str] = None,
+        datetype: str = "edat",
+        use_cache: bool = True
+    ) -> List[str]:
         """
         Search for papers matching the query and return PubMed IDs.
         
+        With a search cache, a search run with the same parameters within the
+        cache's TTL is answered from the cache instead of esearch.
+        
         Args:
             query: The search query in PubMed syntax
             max_results: Maximum number of results to return
+            mindate: Only return records dated on or after this date (YYYY/MM/DD)
+            maxdate: Only return records dated on or before this date (YYYY/MM/DD)
+            datetype: Date field the range applies to, e.g. "edat" (Entrez date,
+                when the record was added) or "mdat" (last modification date)
+            use_cache: False to bypass the search cache lookup; the fresh result
+                still replaces the cached one
             
         Returns:
             List of PubMed IDs matching the query
         """
+        return self.search_page(
+            query, retmax=max_results, mindate=mindate, maxdate=maxdate, datetype=datetype,
+            use_cache=use_cache
+        )[0]
+    
+    def search_page(
+        self,
+        query: str,
+        retstart: int = 0,
+        retmax: int = 100,
+        mindate: Optional[str] = None,
+        maxdate: Optional[str] = None,
+        datetype: str = "edat",
+        use_cache: bool = True
+    ) -> Tuple[List[str], int]:
+        """
+        Return one page of search results and the total number of hits.
+        
+        Args:
+            query: The search query in PubMed syntax
+            retstart: Index of the first result to return
+            retmax: Maximum number of results to return
+            mindate: Only return records dated on or after this date (YYYY/MM/DD)
+            maxdate: Only return records dated on or before this date (YYYY/MM/DD)
+            datetype: Date field the range applies to, "edat" or "mdat"
+            use_cache: False to bypass the search cache lookup
+            
+        Returns:
+            Tuple of (PubMed IDs of the page, total number of hits of the search)
+        """
         logger.debug(f"Searching PubMed with query: {query}")
         
-        params: Dict[str, Any] = {
-            "db": "pubmed",
+        search_params: Dict[str, Any] = {
             "term": query,
-            "retmax": max_results,
-            "retmode": "json",
-            "tool": self.tool,
-            "email": self.email
+            "retmax": retmax,
+            "retmode": "json"
         }
+        if retstart:
+            search_params["retstart"] = retstart
+        
+        if mindate or maxdate:
+            # E-utilities only applies a date range when both ends are given
+            search_params.update({
+                "mindate": mindate or "1800/01/01",
+                "maxdate": maxdate or "3000/12/31",
+                "datetype": datetype
+            })
+        
+        cache_key = None
+        if self.search_cache is not None:
+            cache_key = SearchCache.key({"url": self.SEARCH_URL, **search_params})
+            cached = self.search_cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                self.metrics.increment("search_cache_hits")
+                pmids, count = cached
+                logger.debug(f"Found {len(pmids)} of {count} papers matching the query (cached)")
+                return pmids, count
+            self.metrics.increment("search_cache_misses")
+        
+        params = self._base_params()
+        params.update(search_params)
+        
+        response = self._get(self.SEARCH_URL, params)
+        result = response.json().get("esearchresult", {})
+        
+        pmids = result.get("idlist", [])
+        count = int(result.get("count", retstart + len(pmids)))
+        logger.debug(f"Found {len(pmids)} of {count} papers matching the query")
+        
+        if cache_key is not None:
+            self.search_cache.put(cache_key, pmids, count)
+        
+        return pmids, count
+    
+    def expire_revised_articles(self, query: str, max_results: int = 100) -> int:
+        """
+        Drop the query's cached articles that PubMed has revised since they were cached.
+        
+        Runs one esearch for the query's records modified (mdat) since the oldest
+        cached article was fetched, and expires the cached copies older than that
+        (see ArticleCache.expire_revised), so they are fetched again.
+        
+        Args:
+            query: The search query in PubMed syntax
+            max_results: Maximum number of revised PubMed IDs to look up
+        
+        Returns:
+            Number of cached articles expired
+        """
+        if self.cache is None:
+            return 0
+        
+        since = self.cache.oldest_fetch_date()
+        if since is None:
+            return 0
+        
+        revised = self.search(
+            query, max_results=max_results, mindate=since.strftime("%Y/%m/%d"), datetype="mdat",
+            use_cache=False
+        )
+        expired = self.cache.expire_revised(revised, since)
+        self.metrics.increment("article_cache_expired", expired)
+        return expired
+    
+    def search_history(self, query: str) -> SearchHistory:
+        """
+        Run a search on the NCBI history server instead of returning PubMed IDs.
+        
+        Args:
+            query: The search query in PubMed syntax
+            
+        Returns:
+            SearchHistory handle (WebEnv/query_key) and the total number of hits
+        """
+        logger.debug(f"Searching PubMed history server with query: {query}")
+        
+        params = self._base_params()
+        params.update({
+            "term": query,
+            "usehistory": "y",
+            "retmax": 0,
+            "retmode": "json"
+        })
+        
+        response = self._get(self.SEARCH_URL, params)
+        result = response.json().get("esearchresult", {})
         
-        response = requests.get(self.SEARCH_URL, params=params)
-        response.raise_for_status()
-        data = response.json()
+        history = SearchHistory(
+            webenv=result["webenv"],
+            query_key=result["querykey"],
+            count=int(result.get("count", 0))
+        )
+        logger.debug(f"Found {history.count} papers matching the query")
         
-        pmids = data.get("esearchresult", {}).get("idlist", [])
-        logger.debug(f"Found {len(pmids)} papers matching the query")
+        return history
+    
+    def iter_history_pages(
+        self,
+        history: SearchHistory,
+        page_size: int = 500,
+        max_results: Optional[int] = None
+    ) -> Iterator[List[Paper]]:
+        """
+        Lazily fetch a history server result set page by page.
+        
+        Only one page is held in memory at a time, however many results the query has.
+        
+        Args:
+            history: Handle returned by search_history
+            page_size: Number of papers to request per efetch call
+            max_results: Maximum number of papers to fetch, defaults to all hits
+            
+        Yields:
+            Lists of Paper objects, one per page
+        """
+        total = history.count if max_results is None else min(history.count, max_results)
         
-        return pmids
+        for retstart in range(0, total, page_size):
+            params = self._base_params()
+            params.update({
+                "WebEnv": history.webenv,
+                "query_key": history.query_key,
+                "retstart": retstart,
+                "retmax": min(page_size, total - retstart),
+                "retmode": "xml"
+            })
+            
+            logger.debug(f"Fetching history page at offset {retstart} of {total}")
+            
+            response = self._get(self.FETCH_URL, params)
+            yield self._parse_fetch_response(response.text)
     
     def fetch_papers(self, pmids: List[str]) -> List[Paper]:
         """
@@ -71,167 +464,226 @@ class PubMedAPI:
         Returns:
             List of Paper objects with detailed information
         """
-        if not pmids:
-            return []
-        
-        # Process in batches to avoid large requests
-        batch_size = 50
         all_papers: List[Paper] = []
+        for papers in self.iter_paper_batches(pmids):
+            all_papers.extend(papers)
         
-        for i in range(0, len(pmids), batch_size):
-            batch_pmids = pmids[i:i+batch_size]
+        return all_papers
+    
+    def iter_paper_batches(self, pmids: List[str]) -> Iterator[List[Paper]]:
+        """
+        Lazily fetch papers batch by batch, in PMID order.
+        
+        With max_workers > 1, up to twice that many batches are fetched ahead of the
+        consumer; no more, so memory stays bounded however many PMIDs are requested.
+        Articles in the article cache are not fetched (see iter_fetch_plan).
+        
+        Args:
+            pmids: List of PubMed IDs to fetch
             
-            params: Dict[str, Any] = {
-                "db": "pubmed",
-                "id": ",".join(batch_pmids),
-                "retmode": "xml",
-                "tool": self.tool,
-                "email": self.email
-            }
+        Yields:
+            Lists of Paper objects, one per efetch batch
+        """
+        plan = self.iter_fetch_plan(pmids)
+        
+        if self.max_workers == 1 or len(pmids) <= self.batch_sizer.size:
+            for span, missing, cached in plan:
+                yield self._fetch_planned(span, missing, cached)
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        in_flight: Deque[Future] = deque()
+        try:
+            for item in islice(plan, self.max_workers * 2):
+                in_flight.append(executor.submit(self._fetch_planned, *item))
             
-            logger.debug(f"Fetching details for batch of {len(batch_pmids)} papers")
+            while in_flight:
+                papers = in_flight.popleft().result()
+                for item in islice(plan, 1):
+                    in_flight.append(executor.submit(self._fetch_planned, *item))
+                yield papers
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def iter_fetch_plan(
+        self,
+        pmids: List[str]
+    ) -> Iterator[Tuple[List[str], List[str], Dict[str, Paper]]]:
+        """
+        Lazily split PubMed IDs into efetch batches, skipping cached articles.
+        
+        The article cache is consulted once per CACHE_LOOKUP_CHUNK_SIZE PubMed IDs,
+        and only the missing IDs are cut into batches, so a warm cache costs a few
+        full-size requests for the unseen articles. Batches are cut when they are
+        taken, so later ones use the size adapted to earlier responses.
+        
+        Args:
+            pmids: List of PubMed IDs to fetch
             
-            response = requests.get(self.FETCH_URL, params=params)
-            response.raise_for_status()
+        Yields:
+            Tuples of (consecutive PubMed IDs covered, the missing ones among them
+            to fetch, possibly none, and their cached papers by PubMed ID)
+        """
+        if self.cache is None:
+            for batch in self.batch_sizer.iter_batches(pmids):
+                yield batch, batch, {}
+            return
+        
+        for start in range(0, len(pmids), CACHE_LOOKUP_CHUNK_SIZE):
+            chunk = pmids[start:start+CACHE_LOOKUP_CHUNK_SIZE]
+            cached = self.cache.get_many(chunk)
+            missing = [pmid for pmid in chunk if pmid not in cached]
+            self.metrics.increment("article_cache_hits", len(cached))
+            self.metrics.increment("article_cache_misses", len(missing))
             
-            # Parse XML response
-            papers = self._parse_fetch_response(response.text)
-            all_papers.extend(papers)
+            position = 0
+            for batch in self.batch_sizer.iter_batches(missing):
+                end = chunk.index(batch[-1], position) + 1
+                span = chunk[position:end]
+                yield span, batch, {pmid: cached[pmid] for pmid in span if pmid in cached}
+                position = end
             
-            # Be nice to the API with a small delay between batches
-            if i + batch_size < len(pmids):
-                time.sleep(0.5)
-        
-        return all_papers
+            if position < len(chunk):
+                span = chunk[position:]
+                yield span, [], {pmid: cached[pmid] for pmid in span if pmid in cached}
     
-    def _parse_fetch_response(self, xml_text: str) -> List[Paper]:
+    def _fetch_planned(self, span: List[str], missing: List[str], cached: Dict[str, Paper]) -> List[Paper]:
         """
-        Parse the XML response from efetch to extract paper information.
+        Fetch the missing articles of a planned batch and merge in the cached ones.
         
         Args:
-            xml_text: XML response text from PubMed efetch
+            span: Consecutive PubMed IDs covered by the batch
+            missing: PubMed IDs to send to efetch
+            cached: Cached papers of the span by PubMed ID
             
         Returns:
-            List of Paper objects parsed from the XML
+            List of Paper objects in PMID order
         """
-        soup = BeautifulSoup(xml_text, "xml")
-        papers: List[Paper] = []
+        fetched = self._fetch_batch(missing) if missing else []
+        if self.cache is None:
+            return fetched
         
-        for article_elem in soup.find_all("PubmedArticle"):
-            try:
-                pmid = article_elem.find("PMID").text
-                
-                # Get title
-                title_elem = article_elem.find("ArticleTitle")
-                title = title_elem.text if title_elem else "Unknown Title"
-                
-                # Get publication date
-                pub_date = self._parse_publication_date(article_elem)
-                
-                # Create paper object
-                paper = Paper(
-                    pubmed_id=pmid,
-                    title=title,
-                    publication_date=pub_date
-                )
-                
-                # Parse authors
-                self._parse_authors(article_elem, paper)
-                
-                papers.append(paper)
-            except Exception as e:
-                logger.error(f"Error parsing article: {e}")
-                continue
+        self.cache.put_many(fetched)
+        papers_by_id = dict(cached)
+        papers_by_id.update((paper.pubmed_id, paper) for paper in fetched)
         
+        return [papers_by_id[pmid] for pmid in span if pmid in papers_by_id]
+    
+    def _fetch_batch(self, batch_pmids: List[str]) -> List[Paper]:
+        """
+        Fetch and parse a single efetch batch.
+        
+        Args:
+            batch_pmids: PubMed IDs to fetch in one request
+            
+        Returns:
+            List of Paper objects parsed from the response
+        """
+        logger.debug(f"Fetching details for batch of {len(batch_pmids)} papers")
+        
+        papers: List[Paper] = []
+        for response in self._efetch_with_split(batch_pmids):
+            # Parse XML response
+            papers.extend(self._parse_fetch_response(response.text))
         return papers
     
-    def _parse_publication_date(self, article_elem) -> datetime.date:
+    def fetch_raw(self, batch_pmids: List[str]) -> List[bytes]:
         """
-        Extract publication date from article element.
+        Fetch a single efetch batch without parsing it.
         
         Args:
-            article_elem: BeautifulSoup element for the article
+            batch_pmids: PubMed IDs to fetch in one request
             
         Returns:
-            Date object representing the publication date
+            Raw efetch XML documents in PMID order, e.g. for parsing in another
+            process; more than one if the batch had to be split
         """
-        # Try to find PubDate in PubMedPubDate with PubStatus="pubmed"
-        pub_date_elem = article_elem.find("PubMedPubDate", {"PubStatus": "pubmed"})
+        logger.debug(f"Fetching raw XML for batch of {len(batch_pmids)} papers")
         
-        if not pub_date_elem:
-            # Fallback to ArticleDate or PubDate in Journal
-            pub_date_elem = article_elem.find("ArticleDate") or article_elem.find("PubDate")
+        return [response.content for response in self._efetch_with_split(batch_pmids)]
+    
+    def _efetch_with_split(self, batch_pmids: List[str]) -> List[requests.Response]:
+        """
+        Send an efetch batch, splitting it in half and retrying on overload.
         
-        year = pub_date_elem.find("Year")
-        month = pub_date_elem.find("Month")
-        day = pub_date_elem.find("Day")
+        A batch that fails with a timeout or server error is split in half and
+        retried, down to the batch sizer's minimum size.
         
-        year_val = int(year.text) if year else 1900
-        month_val = int(month.text) if month else 1
-        day_val = int(day.text) if day else 1
+        Args:
+            batch_pmids: PubMed IDs to fetch
+            
+        Returns:
+            The successful responses, in PMID order
+        """
+        try:
+            return [self._efetch(batch_pmids)]
+        except requests.RequestException as e:
+            if len(batch_pmids) <= self.batch_sizer.minimum or not _is_overload_error(e):
+                raise
+            logger.warning(f"efetch of {len(batch_pmids)} papers failed ({e}), retrying in two halves")
+            self.metrics.increment("efetch_batch_splits")
+            half = len(batch_pmids) // 2
+            return self._efetch_with_split(batch_pmids[:half]) + self._efetch_with_split(batch_pmids[half:])
+    
+    def _efetch(self, batch_pmids: List[str]) -> requests.Response:
+        """
+        Send one efetch request and report its outcome to the batch sizer.
+        
+        Args:
+            batch_pmids: PubMed IDs to fetch in one request
+            
+        Returns:
+            The successful response
+        """
+        method = "POST" if len(batch_pmids) > POST_THRESHOLD else "GET"
+        try:
+            # Timeouts and 5xx responses go straight to the split-and-retry in
+            # _efetch_with_split instead of resending the same oversized batch
+            response, latency = self._request(
+                method, self.FETCH_URL, self._fetch_params(batch_pmids), retry_statuses=(429,), retry_timeouts=False
+            )
+        except requests.RequestException as e:
+            if _is_overload_error(e):
+                self.batch_sizer.record_failure(len(batch_pmids))
+            raise
         
-        return datetime(year_val, month_val, day_val).date()
+        self.batch_sizer.record_success(len(batch_pmids), latency, len(response.content))
+        return response
     
-    def _parse_authors(self, article_elem, paper: Paper) -> None:
+    def _fetch_params(self, batch_pmids: List[str]) -> Dict[str, Any]:
         """
-        Extract author information from article element and add to paper.
+        Return the efetch parameters for a batch of PubMed IDs.
+        """
+        params = self._base_params()
+        params.update({
+            "id": ",".join(batch_pmids),
+            "retmode": "xml"
+        })
+        return params
+    
+    def _parse_fetch_response(self, xml_text: str) -> List[Paper]:
+        """
+        Parse the XML response from efetch to extract paper information.
         
         Args:
-            article_elem: BeautifulSoup element for the article
-            paper: Paper object to update with author information
+            xml_text: XML response text from PubMed efetch
+            
+        Returns:
+            List of Paper objects parsed from the XML
         """
-        author_list = article_elem.find("AuthorList")
-        if not author_list:
-            return
+        with self.metrics.stage("parse"):
+            papers = parse_fetch_response(xml_text, parser=self.parser)
         
-        for author_elem in author_list.find_all("Author"):
-            try:
-                # Get author name
-                last_name = author_elem.find("LastName")
-                fore_name = author_elem.find("ForeName")
-                
-                if last_name and fore_name:
-                    name = f"{fore_name.text} {last_name.text}"
-                elif last_name:
-                    name = last_name.text
-                else:
-                    collective_name = author_elem.find("CollectiveName")
-                    if collective_name:
-                        name = collective_name.text
-                    else:
-                        continue  # Skip author with no name
-                
-                # Check if corresponding author
-                is_corresponding = False
-                author_id_list = author_elem.find_all("Identifier")
-                for id_elem in author_id_list:
-                    if id_elem.get("Source") == "CORRESP":
-                        is_corresponding = True
-                
-                # Get affiliation
-                affiliation_text = None
-                affiliation = author_elem.find("Affiliation")
-                if affiliation:
-                    affiliation_text = affiliation.text
-                
-                # Get email (often embedded in affiliation text)
-                email = None
-                if affiliation_text:
-                    # Simple email extraction - could be improved
-                    import re
-                    email_match = re.search(r'[\w.+-]+@[\w-]+\.[\w.-]+', affiliation_text)
-                    if email_match:
-                        email = email_match.group(0)
-                
-                author = Author(
-                    name=name,
-                    affiliation=affiliation_text,
-                    email=email,
-                    is_corresponding=is_corresponding
-                )
-                
-                paper.authors.append(author)
-                
-            except Exception as e:
-                logger.error(f"Error parsing author: {e}")
-                continue
\ No newline at end of file
+        self.metrics.increment("articles_parsed", len(papers))
+        return papers
+
+def _is_overload_error(error: requests.RequestException) -> bool:
+    """
+    Whether a failed request suggests the batch was too large: a timeout or a 5xx
+    response. Connection errors and exhausted 429 retries (rate limiting) say
+    nothing about the batch size, so they are not retried in smaller batches.
+    """
+    if isinstance(error, requests.Timeout):
+        return True
+    response = getattr(error, "response", None)
+    return response is not None and response.status_code >= 500
@@ -0,0 +1,116 @@
+import threading
+from typing import Iterator, List, Optional
+
+# Number of PubMed IDs sent to efetch in the first request
+FETCH_BATCH_SIZE = 50
+
+# Bounds of the adaptive efetch batch size
+MIN_FETCH_BATCH_SIZE = 10
+MAX_FETCH_BATCH_SIZE = 500
+
+
+class AdaptiveBatchSizer:
+    """
+    Thread-safe efetch batch size that adapts to how the server copes.
+
+    Starting from `initial`, the size doubles after each full-size batch answered
+    within `target_latency` seconds and `max_response_bytes`. Slower or larger
+    responses scale it down towards the target, and a timeout or server error
+    halves it, so the number of requests per paper shrinks without provoking
+    failed oversized batches. Use minimum == maximum for a fixed batch size.
+
+    After a failure the size grows additively, by `minimum` IDs per healthy
+    batch, and stays below the smallest size that failed, so it does not swing
+    straight back to a size the server could not handle (AIMD).
+    """
+
+    def __init__(
+        self,
+        initial: int = FETCH_BATCH_SIZE,
+        minimum: int = MIN_FETCH_BATCH_SIZE,
+        maximum: int = MAX_FETCH_BATCH_SIZE,
+        target_latency: float = 5.0,
+        max_response_bytes: int = 32 * 1024 * 1024
+    ):
+        """
+        Initialize the batch sizer.
+
+        Args:
+            initial: Batch size of the first requests
+            minimum: Smallest batch size shrinking goes down to
+            maximum: Largest batch size growing goes up to
+            target_latency: Response time in seconds above which batches shrink
+            max_response_bytes: Response size above which batches shrink
+        """
+        if not 1 <= minimum <= maximum:
+            raise ValueError("batch sizes must satisfy 1 <= minimum <= maximum")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.max_response_bytes = max_response_bytes
+        self._size = min(max(initial, minimum), maximum)
+        # Smallest batch size that failed so far; growth stays below it
+        self._ceiling: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        Current batch size.
+        """
+        return self._size
+
+    def record_success(self, batch_size: int, latency: float, response_bytes: int) -> None:
+        """
+        Adapt the size to a successful efetch response.
+
+        Args:
+            batch_size: Number of PubMed IDs in the request
+            latency: Seconds the request took
+            response_bytes: Size of the response body
+        """
+        with self._lock:
+            if latency > self.target_latency or response_bytes > self.max_response_bytes:
+                # Scale to the size the server would have answered within the limits
+                scale = min(
+                    self.target_latency / latency if latency > 0 else 1.0,
+                    self.max_response_bytes / response_bytes if response_bytes > 0 else 1.0
+                )
+                self._size = min(self._size, max(self.minimum, int(batch_size * scale)))
+            elif batch_size >= self._size:
+                # Only full-size batches say anything about larger ones; batches sent
+                # concurrently at the same size grow it once, not once each
+                if self._ceiling is None:
+                    grown = batch_size * 2
+                else:
+                    grown = min(batch_size + self.minimum, self._ceiling - 1)
+                self._size = max(self._size, min(self.maximum, grown))
+
+    def record_failure(self, batch_size: int) -> None:
+        """
+        Shrink the size after a timeout or server error.
+
+        Args:
+            batch_size: Number of PubMed IDs in the failed request
+        """
+        with self._lock:
+            if batch_size > self.minimum:
+                self._ceiling = batch_size if self._ceiling is None else min(self._ceiling, batch_size)
+            self._size = min(self._size, max(self.minimum, batch_size // 2))
+
+    def iter_batches(self, pmids: List[str]) -> Iterator[List[str]]:
+        """
+        Lazily split PubMed IDs into batches, each sized when it is taken.
+
+        Args:
+            pmids: PubMed IDs to split
+
+        Yields:
+            Consecutive slices of pmids
+        """
+        start = 0
+        while start < len(pmids):
+            size = self._size
+            yield pmids[start:start+size]
+            start += size
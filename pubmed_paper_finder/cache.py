@@ -0,0 +1,397 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .models import Paper
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+_QUERY_CHUNK_SIZE = 500
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+def _parsed_article(paper: Paper) -> Dict[str, Any]:
+    """
+    Return the dictionary of a paper as parsed, without author classifications.
+    """
+    data = paper.to_dict()
+    for author in data["authors"]:
+        author["is_non_academic"] = False
+        author["company_affiliation"] = None
+    return data
+
+class ArticleCache:
+    """
+    Persistent SQLite cache of parsed articles keyed by PubMed ID.
+
+    Entries expire after `ttl` seconds, or earlier when PubMed reports the
+    article as revised after the cached copy (see expire_revised). When the
+    stored articles grow beyond `max_size_bytes`, the least recently used ones
+    are evicted; the total size is tracked as articles are stored and deleted,
+    so a cache file should be written by one ArticleCache at a time.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size_bytes: int = 512 * 1024 * 1024,
+        ttl: Optional[float] = 7 * 24 * 3600
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path of the SQLite database file
+            max_size_bytes: Maximum total size of the stored articles
+            ttl: Seconds after which a cached article is refetched, None to never expire
+        """
+        self.path = path
+        self.max_size_bytes = max_size_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                pmid TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                last_revised TEXT,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_accessed ON articles (accessed_at)")
+        self._conn.commit()
+        self._total_size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()[0]
+
+    def __enter__(self) -> "ArticleCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._conn.close()
+
+    def get_many(self, pmids: Iterable[str]) -> Dict[str, Paper]:
+        """
+        Look up cached articles.
+
+        Args:
+            pmids: PubMed IDs to look up
+
+        Returns:
+            Mapping of PubMed ID to Paper for the unexpired articles found
+        """
+        pmids = list(pmids)
+        now = time.time()
+        found: Dict[str, Paper] = {}
+
+        with self._lock:
+            for i in range(0, len(pmids), _QUERY_CHUNK_SIZE):
+                chunk = pmids[i:i+_QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT pmid, data, fetched_at FROM articles WHERE pmid IN ({placeholders})",
+                    chunk
+                ).fetchall()
+
+                for pmid, data, fetched_at in rows:
+                    if self.ttl is not None and now - fetched_at > self.ttl:
+                        continue
+                    found[pmid] = Paper.from_dict(json.loads(data))
+
+            if found:
+                self._conn.executemany(
+                    "UPDATE articles SET accessed_at = ? WHERE pmid = ?",
+                    [(now, pmid) for pmid in found]
+                )
+                self._conn.commit()
+
+            self.hits += len(found)
+            self.misses += len(pmids) - len(found)
+
+        logger.debug(f"Article cache: {len(found)} hits, {len(pmids) - len(found)} misses")
+        return found
+
+    def put_many(self, papers: Iterable[Paper]) -> None:
+        """
+        Store parsed articles, replacing older copies.
+
+        Author classifications are not stored, so the cache holds the same data
+        whether papers are stored before or after classification.
+
+        Args:
+            papers: Paper objects to store
+        """
+        now = time.time()
+        rows = []
+        for paper in papers:
+            data = json.dumps(_parsed_article(paper))
+            last_revised = paper.last_revised.isoformat() if paper.last_revised else None
+            rows.append((paper.pubmed_id, data, last_revised, len(data), now, now))
+
+        if not rows:
+            return
+
+        with self._lock:
+            # Replaced copies no longer count towards the total
+            self._total_size -= self._sum_sizes([row[0] for row in rows])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO articles "
+                "(pmid, data, last_revised, size, fetched_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._total_size += sum(row[3] for row in rows)
+            self._evict()
+            self._conn.commit()
+
+    def _sum_sizes(self, pmids: List[str]) -> int:
+        """
+        Return the total stored size of the given articles.
+        """
+        total = 0
+        for i in range(0, len(pmids), _QUERY_CHUNK_SIZE):
+            chunk = pmids[i:i+_QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            total += self._conn.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM articles WHERE pmid IN ({placeholders})",
+                chunk
+            ).fetchone()[0]
+        return total
+
+    def _evict(self) -> None:
+        """
+        Delete least recently used articles until the cache fits in max_size_bytes.
+        """
+        total = self._total_size
+        if total <= self.max_size_bytes:
+            return
+
+        to_delete: List[str] = []
+        for pmid, size in self._conn.execute("SELECT pmid, size FROM articles ORDER BY accessed_at"):
+            if total <= self.max_size_bytes:
+                break
+            to_delete.append(pmid)
+            total -= size
+
+        self._conn.executemany("DELETE FROM articles WHERE pmid = ?", [(pmid,) for pmid in to_delete])
+        self._total_size = total
+        logger.debug(f"Article cache: evicted {len(to_delete)} articles")
+
+    def oldest_fetch_date(self) -> Optional[date]:
+        """
+        Return the day the oldest unexpired article was fetched, None if there is none.
+        """
+        cutoff = time.time() - self.ttl if self.ttl is not None else 0
+        with self._lock:
+            oldest = self._conn.execute(
+                "SELECT MIN(fetched_at) FROM articles WHERE fetched_at >= ?", (cutoff,)
+            ).fetchone()[0]
+        return date.fromtimestamp(oldest) if oldest is not None else None
+
+    def expire_revised(self, pmids: Iterable[str], since: date) -> int:
+        """
+        Delete cached articles that PubMed reports as revised since a date.
+
+        `pmids` are the result of an esearch restricted to records modified
+        (mdat) on or after `since`. A cached copy whose last revision is older
+        than `since`, or unknown, predates that modification and is deleted, so
+        the article is fetched again. Copies already revised on or after `since`
+        are kept until they expire.
+
+        Args:
+            pmids: PubMed IDs modified on or after `since`
+            since: Start of the modification date range that was searched
+
+        Returns:
+            Number of articles deleted
+        """
+        pmids = list(pmids)
+        since_text = since.isoformat()
+        deleted = 0
+
+        with self._lock:
+            for i in range(0, len(pmids), _QUERY_CHUNK_SIZE):
+                chunk = pmids[i:i+_QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                condition = f"pmid IN ({placeholders}) AND (last_revised IS NULL OR last_revised < ?)"
+                count, size = self._conn.execute(
+                    f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM articles WHERE {condition}",
+                    (*chunk, since_text)
+                ).fetchone()
+                self._conn.execute(f"DELETE FROM articles WHERE {condition}", (*chunk, since_text))
+                self._total_size -= size
+                deleted += count
+            self._conn.commit()
+
+        logger.debug(f"Article cache: expired {deleted} revised articles")
+        return deleted
+
+    def purge_expired(self) -> int:
+        """
+        Delete all articles older than the TTL.
+
+        Returns:
+            Number of articles deleted
+        """
+        if self.ttl is None:
+            return 0
+
+        with self._lock:
+            cutoff = time.time() - self.ttl
+            self._total_size -= self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM articles WHERE fetched_at < ?", (cutoff,)
+            ).fetchone()[0]
+            cursor = self._conn.execute("DELETE FROM articles WHERE fetched_at < ?", (cutoff,))
+            self._conn.commit()
+            return cursor.rowcount
+
+class SearchCache:
+    """
+    Cache of esearch results (PubMed IDs and total hit count), shared across processes.
+
+    Results are stored as one JSON file per search in a directory, named by the
+    SHA-256 of the normalized query and search parameters and replaced atomically,
+    so concurrent jobs can read and write the same directory. Recently used results
+    are also kept in memory, so repeated searches in one process skip the file read.
+    Entries expire `ttl` seconds after the search ran.
+    """
+
+    def __init__(self, directory: str, ttl: Optional[float] = 3600, max_memory_entries: int = 1024):
+        """
+        Open (or create) the cache directory.
+
+        Args:
+            directory: Directory holding the cached search results
+            ttl: Seconds after which a search is run again, None to never expire
+            max_memory_entries: Maximum number of results kept in memory
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[float, Tuple[str, ...], int]]" = OrderedDict()
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(params: Dict[str, Any]) -> str:
+        """
+        Build the cache key of a search.
+
+        The query's whitespace is normalized; case is kept, since PubMed only treats
+        upper-case AND, OR and NOT as operators.
+
+        Args:
+            params: Search parameters (term, retmax, date range, ...)
+
+        Returns:
+            Hex SHA-256 digest identifying the search
+        """
+        normalized = {
+            name: _WHITESPACE_PATTERN.sub(" ", value).strip() if isinstance(value, str) else value
+            for name, value in params.items()
+        }
+        return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _fresh(self, fetched_at: float) -> bool:
+        return self.ttl is None or time.time() - fetched_at <= self.ttl
+
+    def get(self, key: str) -> Optional[Tuple[List[str], int]]:
+        """
+        Look up a cached search.
+
+        Args:
+            key: Cache key from SearchCache.key
+
+        Returns:
+            Tuple of (PubMed IDs, total hit count), or None if missing or expired
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and self._fresh(entry[0]):
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return list(entry[1]), entry[2]
+
+        try:
+            with open(self._path(key)) as f:
+                data = json.load(f)
+            entry = (data["fetched_at"], tuple(data["pmids"]), data["count"])
+        except (OSError, ValueError, KeyError):
+            entry = None
+
+        with self._lock:
+            if entry is None or not self._fresh(entry[0]):
+                self.misses += 1
+                return None
+            self._remember(key, entry)
+            self.hits += 1
+            return list(entry[1]), entry[2]
+
+    def put(self, key: str, pmids: List[str], count: int) -> None:
+        """
+        Store the result of a search.
+
+        Args:
+            key: Cache key from SearchCache.key
+            pmids: PubMed IDs returned by the search
+            count: Total number of hits reported by esearch
+        """
+        entry = (time.time(), tuple(pmids), count)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"fetched_at": entry[0], "pmids": pmids, "count": count}, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        with self._lock:
+            self._remember(key, entry)
+
+    def _remember(self, key: str, entry: Tuple[float, Tuple[str, ...], int]) -> None:
+        """
+        Keep an entry in the in-memory layer, evicting the least recently used one.
+        """
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Delete all cached searches.
+        """
+        with self._lock:
+            self._memory.clear()
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    os.unlink(os.path.join(self.directory, name))
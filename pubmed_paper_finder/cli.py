@@ -1,10 +1,15 @@
 import argparse
+import json
 import logging
 import sys
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from .module import find_and_export_papers
-from .utils import setup_logging
+from .metrics import Metrics
+from .utils import OUTPUT_FORMATS, read_queries, setup_logging
+
+if TYPE_CHECKING:
+    from .cache import SearchCache
+    from .gazetteer import CompanyGazetteer
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +24,27 @@ def parse_arguments() -> argparse.Namespace:
         description="Fetch research papers from PubMed and identify those with authors from pharma/biotech companies"
     )
     
-    parser.add_argument(
+    # Either a single query or a file of queries run as one deduplicated batch
+    queries = parser.add_mutually_exclusive_group(required=True)
+    
+    queries.add_argument(
         "query",
+        nargs="?",
         help="PubMed search query (supports full PubMed syntax)"
     )
     
+    queries.add_argument(
+        "--queries-file",
+        help="Batch mode: file with one query per line; each paper is fetched once and "
+             "one result file per query is written to --output-dir"
+    )
+    
+    parser.add_argument(
+        "--output-dir",
+        default=".",
+        help="Directory for the per-query result files in batch mode (default: current directory)"
+    )
+    
     parser.add_argument(
         "-d", "--debug",
         action="store_true",
@@ -32,7 +53,14 @@ def parse_arguments() -> argparse.Namespace:
     
     parser.add_argument(
         "-f", "--file",
-        help="Path to save the results (CSV format). If not provided, print to console."
+        help="Path to save the results. If not provided, print to console."
+    )
+    
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="csv",
+        help="Output format (default: csv); parquet requires --file"
     )
     
     parser.add_argument(
@@ -42,7 +70,123 @@ def parse_arguments() -> argparse.Namespace:
         help="Maximum number of results to fetch (default: 100)"
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        "-k", "--api-key",
+        help="NCBI API key, raises the request rate limit from 3 to 10 per second"
+    )
+    
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=1,
+        help="Number of efetch batches to fetch concurrently (default: 1)"
+    )
+    
+    parser.add_argument(
+        "-p", "--processes",
+        type=int,
+        default=0,
+        help="Parse and classify in this many worker processes, with the -w fetch threads "
+             "and the writer as separate pipeline stages (default: 0, single process)"
+    )
+    
+    parser.add_argument(
+        "--use-history",
+        action="store_true",
+        help="Page through results on the NCBI history server (for very large queries)"
+    )
+    
+    parser.add_argument(
+        "--cache",
+        help="Path of a persistent article cache; cached articles are not refetched unless revised"
+    )
+    
+    parser.add_argument(
+        "--classification-cache",
+        help="Path of a JSON file persisting affiliation classifications between runs"
+    )
+    
+    parser.add_argument(
+        "--store",
+        help="Path of a local SQLite paper store; fetched papers are saved to it with their "
+             "classifications, and --offline queries are answered from it"
+    )
+    
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Answer the query from --store without network access; the query is then a "
+             "full-text (SQLite FTS5) query over titles, affiliations and company names"
+    )
+    
+    parser.add_argument(
+        "--search-cache",
+        metavar="DIR",
+        help="Directory caching esearch results (PubMed IDs and hit counts), shared by "
+             "concurrent and later runs"
+    )
+    
+    parser.add_argument(
+        "--search-cache-ttl",
+        type=float,
+        default=3600,
+        metavar="SECONDS",
+        help="Seconds a cached search is reused (default: 3600); 0 always searches again "
+             "and refreshes the cache"
+    )
+    
+    parser.add_argument(
+        "--gazetteer",
+        action="store_true",
+        help="Report companies found in a gazetteer under their canonical names (default "
+             "gazetteer: built-in list of major pharma/biotech companies)"
+    )
+    
+    parser.add_argument(
+        "--gazetteer-file",
+        metavar="FILE",
+        help="Gazetteer to use instead of the built-in one, a JSON list of {name, aliases, "
+             "domains} entries (implies --gazetteer)"
+    )
+    
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print run statistics (per-stage timings, requests, bytes, cache hit rates) "
+             "to stderr after the run"
+    )
+    
+    parser.add_argument(
+        "--stats-format",
+        choices=["json", "prometheus"],
+        default="json",
+        help="Format of the --stats output: JSON or Prometheus text format (default: json)"
+    )
+    
+    # Incremental runs merge with earlier results, so they cannot be streamed
+    run_mode = parser.add_mutually_exclusive_group()
+    
+    run_mode.add_argument(
+        "--state",
+        help="Incremental mode: JSON file recording a watermark per query; only papers "
+             "added or revised since the last run are fetched and merged with earlier results"
+    )
+    
+    run_mode.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write CSV rows as each efetch batch is processed instead of at the end"
+    )
+    
+    args = parser.parse_args()
+    
+    if args.format == "parquet" and not args.file and not args.queries_file:
+        parser.error("--format parquet requires --file")
+    
+    if args.offline and not args.store:
+        parser.error("--offline requires --store")
+    
+    return args
 
 def main() -> None:
     """
@@ -53,18 +197,52 @@ def main() -> None:
     # Set up logging
     setup_logging(args.debug)
     
-    logger.info(f"Searching for papers with query: {args.query}")
+    metrics = Metrics()
     
     try:
+        # Imported after argument parsing so --help and usage errors skip loading
+        # the HTTP client and XML parser stack
+        from .module import find_and_export_papers
+        
+        gazetteer = _load_gazetteer(args)
+        search_cache = _open_search_cache(args)
+        
+        if args.queries_file:
+            _run_batch(args, metrics, gazetteer, search_cache)
+            _print_stats(args, metrics)
+            return
+        
+        logger.info(f"Searching for papers with query: {args.query}")
+        
+        if args.stream and not args.offline:
+            _stream_results(args, metrics, gazetteer, search_cache)
+            _print_stats(args, metrics)
+            return
+        
         # Use the module API to find and export papers
-        csv_output = find_and_export_papers(
+        output_text = find_and_export_papers(
             query=args.query,
             output_file=args.file,
-            max_results=args.max_results
+            max_results=args.max_results,
+            api_key=args.api_key,
+            max_workers=args.workers,
+            use_history=args.use_history,
+            cache_path=args.cache,
+            classification_cache_path=args.classification_cache,
+            output_format=args.format,
+            state_path=args.state,
+            metrics=metrics,
+            processes=args.processes,
+            gazetteer=gazetteer,
+            search_cache=search_cache,
+            store_path=args.store,
+            offline=args.offline
         )
         
-        if csv_output:
-            print(csv_output)
+        if output_text:
+            print(output_text)
+        
+        _print_stats(args, metrics)
             
     except Exception as e:
         logger.error(f"An error occurred: {e}")
@@ -73,5 +251,109 @@ def main() -> None:
             traceback.print_exc()
         sys.exit(1)
 
+def _print_stats(args: argparse.Namespace, metrics: Metrics) -> None:
+    """
+    Write the run statistics to stderr if --stats was given.
+    """
+    if not args.stats:
+        return
+    if args.stats_format == "prometheus":
+        sys.stderr.write(metrics.to_prometheus())
+    else:
+        sys.stderr.write(json.dumps(metrics.report(), indent=2) + "\n")
+
+def _load_gazetteer(args: argparse.Namespace) -> Optional["CompanyGazetteer"]:
+    """
+    Load the company gazetteer selected with --gazetteer or --gazetteer-file, if any.
+    """
+    if not args.gazetteer and not args.gazetteer_file:
+        return None
+    
+    from .gazetteer import CompanyGazetteer
+    
+    if args.gazetteer_file:
+        return CompanyGazetteer.load(args.gazetteer_file)
+    return CompanyGazetteer.default()
+
+def _open_search_cache(args: argparse.Namespace) -> Optional["SearchCache"]:
+    """
+    Open the esearch result cache selected with --search-cache, if any.
+    """
+    if not args.search_cache:
+        return None
+    
+    from .cache import SearchCache
+    
+    return SearchCache(args.search_cache, ttl=args.search_cache_ttl)
+
+def _stream_results(
+    args: argparse.Namespace,
+    metrics: Metrics,
+    gazetteer: Optional["CompanyGazetteer"] = None,
+    search_cache: Optional["SearchCache"] = None
+) -> None:
+    """
+    Write results to the output file (or stdout) batch by batch.
+    """
+    from .module import stream_papers
+    
+    options = dict(
+        max_results=args.max_results,
+        api_key=args.api_key,
+        max_workers=args.workers,
+        use_history=args.use_history,
+        cache_path=args.cache,
+        classification_cache_path=args.classification_cache,
+        metrics=metrics,
+        processes=args.processes,
+        gazetteer=gazetteer,
+        search_cache=search_cache,
+        store_path=args.store
+    )
+    
+    if args.format == "parquet":
+        count = stream_papers(args.query, args.file, args.format, **options)
+        logger.info(f"Exported {count} papers to {args.file}")
+    elif args.file:
+        with open(args.file, "w", newline="", encoding="utf-8") as output:
+            count = stream_papers(args.query, output, args.format, **options)
+        logger.info(f"Exported {count} papers to {args.file}")
+    else:
+        stream_papers(args.query, sys.stdout, args.format, **options)
+
+def _run_batch(
+    args: argparse.Namespace,
+    metrics: Metrics,
+    gazetteer: Optional["CompanyGazetteer"] = None,
+    search_cache: Optional["SearchCache"] = None
+) -> None:
+    """
+    Run every query of the queries file as one deduplicated batch.
+    """
+    from .module import export_papers_for_queries
+    
+    queries = read_queries(args.queries_file)
+    logger.info(f"Running {len(queries)} queries from {args.queries_file}")
+    
+    if args.file or args.stream or args.state or args.use_history or args.offline:
+        logger.warning("--file, --stream, --state, --use-history and --offline are ignored in batch mode")
+    
+    paths = export_papers_for_queries(
+        queries,
+        args.output_dir,
+        output_format=args.format,
+        max_results=args.max_results,
+        api_key=args.api_key,
+        max_workers=args.workers,
+        cache_path=args.cache,
+        classification_cache_path=args.classification_cache,
+        metrics=metrics,
+        gazetteer=gazetteer,
+        search_cache=search_cache,
+        store_path=args.store,
+        processes=args.processes
+    )
+    logger.info(f"Wrote {len(paths)} result files to {args.output_dir}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
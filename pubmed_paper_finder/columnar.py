@@ -0,0 +1,143 @@
+"""
+Classification of authors held in a columnar table.
+
+Applies the same rules as filters.is_non_academic_author and
+filters.extract_company_name to a whole pandas DataFrame at once, one row per
+author, without creating per-author Python objects. The regex rules still run
+in Python, but only once per distinct affiliation and email; the results are
+then mapped back onto the rows with array indexing.
+"""
+
+import warnings
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .filters import (
+    ACADEMIC_EMAIL_PATTERN,
+    ACADEMIC_PATTERN,
+    COMPANY_EMAIL_PATTERN,
+    COMPANY_SUFFIX_PATTERN,
+    GOVERNMENT_PATTERN,
+    PHARMA_BIOTECH_PATTERN,
+    extract_company_name
+)
+from .models import Paper
+
+def papers_to_author_table(papers: List[Paper]) -> pd.DataFrame:
+    """
+    Flatten papers into a table with one row per author.
+
+    Args:
+        papers: List of Paper objects
+
+    Returns:
+        DataFrame with pubmed_id, name, affiliation, email and is_corresponding columns
+    """
+    rows: Dict[str, List[Any]] = {
+        "pubmed_id": [],
+        "name": [],
+        "affiliation": [],
+        "email": [],
+        "is_corresponding": []
+    }
+    for paper in papers:
+        for author in paper.authors:
+            rows["pubmed_id"].append(paper.pubmed_id)
+            rows["name"].append(author.name)
+            rows["affiliation"].append(author.affiliation)
+            rows["email"].append(author.email)
+            rows["is_corresponding"].append(author.is_corresponding)
+
+    return pd.DataFrame(rows)
+
+def _distinct(values: pd.Series) -> Tuple[np.ndarray, pd.Series]:
+    """
+    Split a text column into per-row codes and its distinct values.
+
+    Missing values are treated as empty strings.
+
+    Args:
+        values: Text column
+
+    Returns:
+        Tuple of (code of each row into the distinct values, distinct values)
+    """
+    values = values.astype(object).where(values.notna(), "")
+    codes, uniques = pd.factorize(values)
+    return codes, pd.Series(uniques, dtype=object)
+
+def _contains(values: pd.Series, pattern: Any) -> np.ndarray:
+    """
+    Regex search over distinct values, returning a boolean array.
+    """
+    with warnings.catch_warnings():
+        # The email patterns use groups for alternation, which pandas warns about
+        warnings.simplefilter("ignore", UserWarning)
+        return values.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+
+def classify_author_table(
+    table: Any,
+    affiliation_column: str = "affiliation",
+    email_column: Optional[str] = "email"
+) -> pd.DataFrame:
+    """
+    Classify every author row of a table and add the results as columns.
+
+    Adds an `is_non_academic` boolean column and a `company_affiliation` column
+    (None for academic authors or when no company name was found), with the same
+    decisions as identify_non_academic_authors. Affiliations and emails are
+    deduplicated first, so every rule and every company name extraction runs
+    once per distinct value rather than once per row.
+
+    Args:
+        table: pandas DataFrame (or an object with to_pandas(), such as a pyarrow Table)
+        affiliation_column: Name of the affiliation text column
+        email_column: Name of the email column, None if the table has no emails
+
+    Returns:
+        The DataFrame with the two result columns written into it
+    """
+    if not isinstance(table, pd.DataFrame):
+        table = table.to_pandas()
+
+    # Object dtype keeps matching on Python's re engine, exactly like the per-author rules;
+    # each rule runs once per distinct value and is broadcast to the rows through the codes
+    affiliation_codes, affiliations = _distinct(table[affiliation_column])
+    affiliations_lower = affiliations.str.lower()
+
+    has_pharma_keyword = _contains(affiliations_lower, PHARMA_BIOTECH_PATTERN)
+    has_academic_keyword = _contains(affiliations_lower, ACADEMIC_PATTERN)
+    has_government_keyword = _contains(affiliations_lower, GOVERNMENT_PATTERN)
+    has_company_suffix = _contains(affiliations_lower, COMPANY_SUFFIX_PATTERN)
+    affiliation_flags = (
+        (affiliations.str.len().to_numpy() > 0)
+        & ~(has_academic_keyword & ~has_pharma_keyword)
+        & ~has_government_keyword
+    )[affiliation_codes]
+    affiliation_signal = (has_pharma_keyword | has_company_suffix)[affiliation_codes]
+
+    if email_column is not None and email_column in table:
+        email_codes, emails = _distinct(table[email_column])
+        emails_lower = emails.str.lower()
+        academic_email = _contains(emails_lower, ACADEMIC_EMAIL_PATTERN)[email_codes]
+        company_email = _contains(emails_lower, COMPANY_EMAIL_PATTERN)[email_codes]
+    else:
+        academic_email = company_email = np.zeros(len(table), dtype=bool)
+
+    is_non_academic = (
+        affiliation_flags
+        & ~academic_email
+        & (affiliation_signal | company_email)
+    )
+
+    company_names = np.array([None] * len(affiliations), dtype=object)
+    for code in np.unique(affiliation_codes[is_non_academic]):
+        company_names[code] = extract_company_name(affiliations[code]) or None
+    company_affiliation = np.where(is_non_academic, company_names[affiliation_codes], None)
+
+    table["is_non_academic"] = is_non_academic
+    table["company_affiliation"] = pd.Series(company_affiliation, index=table.index, dtype=object)
+
+    return table
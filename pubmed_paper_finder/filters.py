@@ -1,7 +1,11 @@
+import json
+import os
 import re
-from typing import List, Set, Pattern
+from collections import OrderedDict
+from typing import List, Optional, Set, Pattern, Tuple
 import logging
 
+from .gazetteer import CompanyGazetteer
 from .models import Paper, Author
 
 logger = logging.getLogger(__name__)
@@ -37,35 +41,185 @@ PHARMA_BIOTECH_KEYWORDS: Set[str] = {
     "biologics", "lifesciences", "genetics", "medical"
 }
 
+
+def _keyword_pattern(keywords: Set[str]) -> Pattern:
+    """
+    Compile a set of keywords into one alternation matching any of them as a substring.
+    """
+    return re.compile("|".join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)))
+
+
+# Keyword sets compiled once, so classifying an affiliation is one regex scan per set
+ACADEMIC_PATTERN: Pattern = _keyword_pattern(ACADEMIC_KEYWORDS)
+GOVERNMENT_PATTERN: Pattern = _keyword_pattern(GOVERNMENT_KEYWORDS)
+PHARMA_BIOTECH_PATTERN: Pattern = _keyword_pattern(PHARMA_BIOTECH_KEYWORDS)
+
+# Company suffixes only count as whole words
+_SUFFIX_ALTERNATION = "|".join(re.escape(suffix) for suffix in sorted(COMPANY_SUFFIXES, key=len, reverse=True))
+COMPANY_SUFFIX_PATTERN: Pattern = re.compile(r'\b(?:' + _SUFFIX_ALTERNATION + r')\b')
+COMPANY_SUFFIX_PATTERN_IGNORECASE: Pattern = re.compile(r'\b(?:' + _SUFFIX_ALTERNATION + r')\b', re.IGNORECASE)
+
+# Separators between the parts of an affiliation
+SEGMENT_SEPARATOR_PATTERN: Pattern = re.compile(r'[,;]')
+
 # Compile regex patterns for email domains
 ACADEMIC_EMAIL_PATTERN: Pattern = re.compile(r'@.*\.(edu|ac\.[a-z]{2}|edu\.[a-z]{2})$', re.IGNORECASE)
 COMPANY_EMAIL_PATTERN: Pattern = re.compile(r'@[^.]*\.(com|co|net|io)$', re.IGNORECASE)
 
 
-def identify_non_academic_authors(papers: List[Paper]) -> List[Paper]:
+def identify_non_academic_authors(
+    papers: List[Paper],
+    cache: Optional["AffiliationCache"] = None,
+    gazetteer: Optional[CompanyGazetteer] = None
+) -> List[Paper]:
     """
     Identify authors affiliated with pharmaceutical or biotech companies.
     
     Args:
         papers: List of Paper objects to process
+        cache: Memo cache of classifications, shared across authors and papers
+        gazetteer: Known companies; the company of a non-academic author found in it
+            is reported under its canonical name instead of the extracted one
         
     Returns:
         The same Paper objects with is_non_academic and company_affiliation fields updated
     """
     for paper in papers:
         for author in paper.authors:
-            if is_non_academic_author(author):
+            if cache is not None:
+                is_non_academic, company_name = cache.classify(author.affiliation, author.email)
+            else:
+                is_non_academic, company_name = classify_affiliation(author.affiliation, author.email)
+            
+            if is_non_academic:
                 author.is_non_academic = True
-                
-                # Try to extract the company name if available
-                if author.affiliation:
-                    company_name = extract_company_name(author.affiliation)
-                    if company_name:
-                        author.company_affiliation = company_name
+                if gazetteer is not None:
+                    company_name = gazetteer.resolve(author.affiliation, author.email) or company_name
+                if company_name:
+                    author.company_affiliation = company_name
     
     return papers
 
 
+def classify_affiliation(affiliation: Optional[str], email: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """
+    Classify an affiliation/email pair and extract the company name.
+    
+    Args:
+        affiliation: Affiliation text of the author
+        email: Email address of the author
+        
+    Returns:
+        Tuple of (is non-academic, company name or None)
+    """
+    if not is_non_academic_affiliation(affiliation, email):
+        return False, None
+    
+    # Try to extract the company name if available
+    company_name = extract_company_name(affiliation) if affiliation else ""
+    return True, company_name or None
+
+
+class AffiliationCache:
+    """
+    Bounded LRU memo cache of affiliation classifications.
+    
+    Entries are keyed on the stripped affiliation text and the email domain, which
+    together fully determine the classification and the extracted company name.
+    """
+    
+    def __init__(self, maxsize: int = 100_000, path: Optional[str] = None):
+        """
+        Initialize the cache, loading persisted entries if the file exists.
+        
+        Args:
+            maxsize: Maximum number of entries kept
+            path: JSON file the cache is loaded from and saved to
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, Optional[str]], Tuple[bool, Optional[str]]]" = OrderedDict()
+        
+        if path and os.path.exists(path):
+            self.load(path)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @staticmethod
+    def _key(affiliation: str, email: Optional[str]) -> Tuple[str, Optional[str]]:
+        """
+        Build the cache key; email patterns only look at the part from the first '@'.
+        """
+        email_key = None
+        if email:
+            email_lower = email.lower()
+            at = email_lower.find("@")
+            email_key = email_lower[at:] if at >= 0 else ""
+        return affiliation.strip(), email_key
+    
+    def classify(self, affiliation: Optional[str], email: Optional[str]) -> Tuple[bool, Optional[str]]:
+        """
+        Classify an affiliation/email pair, reusing earlier results.
+        
+        Args:
+            affiliation: Affiliation text of the author
+            email: Email address of the author
+            
+        Returns:
+            Tuple of (is non-academic, company name or None)
+        """
+        if not affiliation:
+            return False, None
+        
+        key = self._key(affiliation, email)
+        result = self._entries.get(key)
+        if result is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return result
+        
+        self.misses += 1
+        result = classify_affiliation(affiliation, email)
+        self._entries[key] = result
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return result
+    
+    def load(self, path: str) -> None:
+        """
+        Load entries from a JSON file written by save.
+        
+        Args:
+            path: Path of the JSON file
+        """
+        with open(path) as f:
+            for affiliation, email_key, is_non_academic, company_name in json.load(f):
+                self._entries[(affiliation, email_key)] = (is_non_academic, company_name)
+        
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Persist the entries to a JSON file, replacing the previous one atomically.
+        
+        Args:
+            path: Path of the JSON file, defaults to the path given at construction
+        """
+        path = path or self.path
+        if not path:
+            raise ValueError("No path to save the affiliation cache to")
+        
+        # An interrupted save must not leave a truncated file for the next run to load
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump([[*key, *value] for key, value in self._entries.items()], f)
+        os.replace(tmp_path, path)
+
+
 def is_non_academic_author(author: Author) -> bool:
     """
     Determine if an author is likely affiliated with a non-academic institution.
@@ -76,41 +230,43 @@ def is_non_academic_author(author: Author) -> bool:
     Returns:
         True if the author is likely affiliated with a pharma/biotech company
     """
-    if not author.affiliation:
+    return is_non_academic_affiliation(author.affiliation, author.email)
+
+
+def is_non_academic_affiliation(affiliation: Optional[str], email: Optional[str]) -> bool:
+    """
+    Determine if an affiliation/email pair likely belongs to a non-academic institution.
+    
+    Args:
+        affiliation: Affiliation text of the author
+        email: Email address of the author
+        
+    Returns:
+        True if the pair likely belongs to a pharma/biotech company
+    """
+    if not affiliation:
         return False
     
-    affiliation_lower = author.affiliation.lower()
+    affiliation_lower = affiliation.lower()
+    has_pharma_keyword = PHARMA_BIOTECH_PATTERN.search(affiliation_lower) is not None
     
-    # Check for academic keywords
-    for keyword in ACADEMIC_KEYWORDS:
-        if keyword in affiliation_lower:
-            # Check if there's a company mention that might override the academic keyword
-            if any(company_kw in affiliation_lower for company_kw in PHARMA_BIOTECH_KEYWORDS):
-                # This could be a company with a research institute or a collaboration
-                continue
-            return False
+    # Check for academic keywords, unless there's a company mention that might
+    # override them (a company with a research institute or a collaboration)
+    if not has_pharma_keyword and ACADEMIC_PATTERN.search(affiliation_lower):
+        return False
     
     # Check for government/public institution keywords
-    for keyword in GOVERNMENT_KEYWORDS:
-        if keyword in affiliation_lower:
-            return False
+    if GOVERNMENT_PATTERN.search(affiliation_lower):
+        return False
     
     # Check for company keywords and suffixes
-    has_company_indicators = False
-    
-    for suffix in COMPANY_SUFFIXES:
-        if re.search(r'\b' + suffix + r'\b', affiliation_lower):
-            has_company_indicators = True
-            break
-    
-    for keyword in PHARMA_BIOTECH_KEYWORDS:
-        if keyword in affiliation_lower:
-            has_company_indicators = True
-            break
+    has_company_indicators = (
+        has_pharma_keyword or COMPANY_SUFFIX_PATTERN.search(affiliation_lower) is not None
+    )
     
     # Check email domain if available
-    if author.email:
-        email_lower = author.email.lower()
+    if email:
+        email_lower = email.lower()
         if ACADEMIC_EMAIL_PATTERN.search(email_lower):
             return False
         if COMPANY_EMAIL_PATTERN.search(email_lower):
@@ -132,38 +288,38 @@ def extract_company_name(affiliation: str) -> str:
     # This is a simplified approach - a more robust solution might use NLP
     # to identify organization names
     
-    affiliation_lower = affiliation.lower()
-    words = affiliation_lower.split()
-    
     # Split by common separators
-    segments = re.split(r'[,;]', affiliation)
+    segments = SEGMENT_SEPARATOR_PATTERN.split(affiliation)
     
-    # Look for segments that contain company indicators
+    # Look for segments that contain company suffixes or pharma/biotech keywords
     for segment in segments:
         segment = segment.strip()
         if not segment:
             continue
-            
-        # Check for company suffixes
-        for suffix in COMPANY_SUFFIXES:
-            suffix_pattern = re.compile(r'\b' + re.escape(suffix) + r'\b', re.IGNORECASE)
-            if suffix_pattern.search(segment):
-                # Return the original case version of this segment
-                original_segment = [s.strip() for s in affiliation.split(',') if segment.lower() in s.lower()]
-                if original_segment:
-                    return original_segment[0]
-                return segment
-        
-        # Check for pharma/biotech keywords
-        for keyword in PHARMA_BIOTECH_KEYWORDS:
-            if keyword in segment.lower():
-                # Return the original case version of this segment
-                original_segment = [s.strip() for s in affiliation.split(',') if segment.lower() in s.lower()]
-                if original_segment:
-                    return original_segment[0]
-                return segment
+        
+        if (COMPANY_SUFFIX_PATTERN_IGNORECASE.search(segment)
+                or PHARMA_BIOTECH_PATTERN.search(segment.lower())):
+            return _original_segment(affiliation, segment)
     
     # If we can't find a specific segment, return first part of affiliation
     # as a fallback
     first_segment = segments[0].strip() if segments else ""
-    return first_segment
\ No newline at end of file
+    return first_segment
+
+
+def _original_segment(affiliation: str, segment: str) -> str:
+    """
+    Return the first comma-separated part of the affiliation containing the segment.
+    
+    Args:
+        affiliation: Full affiliation text
+        segment: Segment of the affiliation that matched a company indicator
+        
+    Returns:
+        The matching part in its original case, or the segment itself
+    """
+    segment_lower = segment.lower()
+    for part in affiliation.split(','):
+        if segment_lower in part.lower():
+            return part.strip()
+    return segment
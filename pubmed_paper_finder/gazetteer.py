@@ -0,0 +1,235 @@
+"""
+Gazetteer of known pharmaceutical/biotech companies for canonical company names.
+
+Names and aliases are compiled into an Aho-Corasick automaton, so an affiliation
+is matched against every alias in a single pass whose cost depends on the length
+of the affiliation, not on the size of the gazetteer. Email domains are resolved
+with dictionary lookups.
+"""
+
+import json
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Built-in gazetteer: canonical name, aliases (matched case-insensitively on word
+# boundaries) and email domains
+DEFAULT_COMPANIES: List[Dict[str, Any]] = [
+    {"name": "Pfizer Inc.", "aliases": ["pfizer"], "domains": ["pfizer.com"]},
+    {"name": "Merck & Co., Inc.", "aliases": ["merck", "merck & co", "merck sharp & dohme", "msd"],
+     "domains": ["merck.com", "msd.com"]},
+    {"name": "Merck KGaA", "aliases": ["merck kgaa", "emd serono"], "domains": ["merckgroup.com", "emdserono.com"]},
+    {"name": "Novartis AG", "aliases": ["novartis"], "domains": ["novartis.com"]},
+    {"name": "F. Hoffmann-La Roche AG", "aliases": ["roche", "hoffmann-la roche", "f. hoffmann-la roche"],
+     "domains": ["roche.com"]},
+    {"name": "Genentech, Inc.", "aliases": ["genentech"], "domains": ["gene.com"]},
+    {"name": "Johnson & Johnson", "aliases": ["johnson & johnson", "janssen"], "domains": ["jnj.com"]},
+    {"name": "AstraZeneca PLC", "aliases": ["astrazeneca", "medimmune"], "domains": ["astrazeneca.com"]},
+    {"name": "GSK plc", "aliases": ["gsk", "glaxosmithkline"], "domains": ["gsk.com"]},
+    {"name": "Sanofi", "aliases": ["sanofi", "sanofi-aventis", "sanofi pasteur", "genzyme"],
+     "domains": ["sanofi.com"]},
+    {"name": "AbbVie Inc.", "aliases": ["abbvie"], "domains": ["abbvie.com"]},
+    {"name": "Bristol-Myers Squibb Company", "aliases": ["bristol-myers squibb", "bristol myers squibb", "celgene"],
+     "domains": ["bms.com"]},
+    {"name": "Eli Lilly and Company", "aliases": ["eli lilly", "lilly research laboratories"],
+     "domains": ["lilly.com"]},
+    {"name": "Amgen Inc.", "aliases": ["amgen"], "domains": ["amgen.com"]},
+    {"name": "Gilead Sciences, Inc.", "aliases": ["gilead", "gilead sciences"], "domains": ["gilead.com"]},
+    {"name": "Bayer AG", "aliases": ["bayer"], "domains": ["bayer.com"]},
+    {"name": "Boehringer Ingelheim", "aliases": ["boehringer ingelheim"], "domains": ["boehringer-ingelheim.com"]},
+    {"name": "Novo Nordisk A/S", "aliases": ["novo nordisk"], "domains": ["novonordisk.com"]},
+    {"name": "Takeda Pharmaceutical Company Limited", "aliases": ["takeda"], "domains": ["takeda.com"]},
+    {"name": "Regeneron Pharmaceuticals, Inc.", "aliases": ["regeneron"], "domains": ["regeneron.com"]},
+    {"name": "Vertex Pharmaceuticals Incorporated", "aliases": ["vertex pharmaceuticals"], "domains": ["vrtx.com"]},
+    {"name": "Biogen Inc.", "aliases": ["biogen"], "domains": ["biogen.com"]},
+    {"name": "Moderna, Inc.", "aliases": ["moderna", "modernatx"], "domains": ["modernatx.com"]},
+    {"name": "BioNTech SE", "aliases": ["biontech"], "domains": ["biontech.de"]},
+    {"name": "Daiichi Sankyo Company, Limited", "aliases": ["daiichi sankyo"], "domains": ["daiichisankyo.co.jp"]},
+    {"name": "Astellas Pharma Inc.", "aliases": ["astellas"], "domains": ["astellas.com"]},
+    {"name": "Eisai Co., Ltd.", "aliases": ["eisai"], "domains": ["eisai.com"]},
+    {"name": "Teva Pharmaceutical Industries Ltd.", "aliases": ["teva"], "domains": ["tevapharm.com"]},
+    {"name": "Alnylam Pharmaceuticals, Inc.", "aliases": ["alnylam"], "domains": ["alnylam.com"]},
+    {"name": "Novavax, Inc.", "aliases": ["novavax"], "domains": ["novavax.com"]}
+]
+
+class CompanyGazetteer:
+    """
+    Resolves affiliations and email addresses to canonical company names.
+
+    Aliases only match on word boundaries; when several aliases match an
+    affiliation, the longest one wins (the leftmost among equally long ones).
+    """
+
+    def __init__(self, companies: Iterable[Dict[str, Any]]):
+        """
+        Compile the gazetteer.
+
+        Args:
+            companies: Entries with a canonical "name" and optional "aliases" and
+                "domains" lists; the name itself is always matched too
+        """
+        self.names: List[str] = []
+        self._domains: Dict[str, int] = {}
+
+        # Aho-Corasick automaton: transitions, failure links, the pattern ending at
+        # each node (company index, length) and the nearest node on the failure
+        # chain that also ends a pattern
+        self._goto: List[Dict[str, int]] = [{}]
+        self._match: List[Optional[Tuple[int, int]]] = [None]
+        self._fail: List[int] = [0]
+        self._output_link: List[int] = [0]
+
+        for entry in companies:
+            index = len(self.names)
+            self.names.append(entry["name"])
+            for alias in [entry["name"], *entry.get("aliases", [])]:
+                self._add_pattern(alias.lower().strip(), index)
+            for domain in entry.get("domains", []):
+                self._domains[domain.lower().lstrip("@")] = index
+
+        self._build_links()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def default(cls) -> "CompanyGazetteer":
+        """
+        Return the built-in gazetteer of major pharmaceutical/biotech companies.
+        """
+        return cls(DEFAULT_COMPANIES)
+
+    @classmethod
+    def load(cls, path: str) -> "CompanyGazetteer":
+        """
+        Load a gazetteer from a JSON file.
+
+        Args:
+            path: JSON file holding a list of {"name", "aliases", "domains"} entries
+
+        Returns:
+            The compiled gazetteer
+        """
+        with open(path, encoding="utf-8") as f:
+            gazetteer = cls(json.load(f))
+        logger.debug(f"Loaded {len(gazetteer)} companies from gazetteer {path}")
+        return gazetteer
+
+    def _add_pattern(self, pattern: str, index: int) -> None:
+        """
+        Insert an alias into the trie.
+        """
+        if not pattern:
+            return
+
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._match.append(None)
+                self._fail.append(0)
+                self._output_link.append(0)
+            node = next_node
+
+        # An alias listed for two companies keeps its first owner
+        if self._match[node] is None:
+            self._match[node] = (index, len(pattern))
+
+    def _build_links(self) -> None:
+        """
+        Compute failure and output links breadth-first.
+        """
+        queue: Deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[child] = target if target != child else 0
+
+                fail_node = self._fail[child]
+                self._output_link[child] = fail_node if self._match[fail_node] else self._output_link[fail_node]
+
+    def match_affiliation(self, affiliation: Optional[str]) -> Optional[str]:
+        """
+        Find the company named in an affiliation, in one pass over the text.
+
+        Args:
+            affiliation: Affiliation text
+
+        Returns:
+            Canonical company name, or None if no alias occurs in the text
+        """
+        if not affiliation:
+            return None
+
+        text = affiliation.lower()
+        best: Optional[Tuple[int, int, int]] = None  # (length, -start, company index)
+        node = 0
+
+        for end, char in enumerate(text, start=1):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+
+            candidate = node if self._match[node] else self._output_link[node]
+            while candidate:
+                index, length = self._match[candidate]
+                start = end - length
+                if self._on_word_boundaries(text, start, end):
+                    key = (length, -start, index)
+                    if best is None or key[:2] > best[:2]:
+                        best = key
+                candidate = self._output_link[candidate]
+
+        return self.names[best[2]] if best else None
+
+    @staticmethod
+    def _on_word_boundaries(text: str, start: int, end: int) -> bool:
+        """
+        Check that a match is not part of a longer word.
+        """
+        return (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum())
+
+    def match_email(self, email: Optional[str]) -> Optional[str]:
+        """
+        Find the company owning an email address's domain or one of its parent domains.
+
+        Args:
+            email: Email address
+
+        Returns:
+            Canonical company name, or None for unknown domains
+        """
+        if not email or "@" not in email:
+            return None
+
+        domain = email.rsplit("@", 1)[1].lower().strip(". ")
+        while domain:
+            index = self._domains.get(domain)
+            if index is not None:
+                return self.names[index]
+            _, _, domain = domain.partition(".")
+        return None
+
+    def resolve(self, affiliation: Optional[str], email: Optional[str] = None) -> Optional[str]:
+        """
+        Resolve an author's company from the affiliation, falling back to the email domain.
+
+        Args:
+            affiliation: Affiliation text
+            email: Email address
+
+        Returns:
+            Canonical company name, or None if the company is not in the gazetteer
+        """
+        return self.match_affiliation(affiliation) or self.match_email(email)
@@ -0,0 +1,107 @@
+"""
+State for incremental ("since last run") searches.
+
+A JSON state file records, per query, the date of the last run, the highest
+PubMed ID seen and the matching papers found so far, so later runs only need to
+fetch records added or revised since then.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .models import Paper
+
+logger = logging.getLogger(__name__)
+
+# Date format of the watermarks, as accepted by esearch mindate/maxdate
+WATERMARK_FORMAT = "%Y/%m/%d"
+
+@dataclass
+class QueryState:
+    """
+    Watermark and accumulated results of one standing query.
+    """
+    last_run: Optional[str] = None
+    max_pmid: int = 0
+    results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    def merge(self, papers: List[Paper]) -> None:
+        """
+        Merge freshly fetched (new or revised) papers into the stored results.
+
+        Papers with non-academic authors replace their earlier version; papers
+        that no longer have any are dropped.
+
+        Args:
+            papers: Classified Paper objects fetched in this run
+        """
+        for paper in papers:
+            if paper.non_academic_authors:
+                self.results[paper.pubmed_id] = paper.to_dict()
+            else:
+                self.results.pop(paper.pubmed_id, None)
+
+            if paper.pubmed_id.isdigit():
+                self.max_pmid = max(self.max_pmid, int(paper.pubmed_id))
+
+    def papers(self) -> List[Paper]:
+        """
+        Return the stored results, newest PubMed ID first.
+        """
+        papers = [Paper.from_dict(data) for data in self.results.values()]
+        papers.sort(key=lambda paper: int(paper.pubmed_id) if paper.pubmed_id.isdigit() else 0, reverse=True)
+        return papers
+
+class IncrementalState:
+    """
+    JSON file holding a QueryState per query string.
+    """
+
+    def __init__(self, path: str):
+        """
+        Load the state file if it exists.
+
+        Args:
+            path: Path of the JSON state file
+        """
+        self.path = path
+        self.queries: Dict[str, QueryState] = {}
+
+        if os.path.exists(path):
+            with open(path) as f:
+                for query, data in json.load(f).items():
+                    self.queries[query] = QueryState(**data)
+
+    def get(self, query: str) -> QueryState:
+        """
+        Return the state of a query, creating an empty one on its first run.
+
+        Args:
+            query: PubMed search query
+
+        Returns:
+            QueryState for the query
+        """
+        return self.queries.setdefault(query, QueryState())
+
+    def save(self) -> None:
+        """
+        Write the state file, replacing the previous one atomically.
+        """
+        data = {
+            query: {
+                "last_run": state.last_run,
+                "max_pmid": state.max_pmid,
+                "results": state.results
+            }
+            for query, state in self.queries.items()
+        }
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+        logger.debug(f"Saved incremental state for {len(data)} queries to {self.path}")
@@ -0,0 +1,152 @@
+"""
+Offline ingestion of PubMed baseline/updatefiles dumps.
+
+Streams local copies of the NCBI `pubmed*.xml.gz` files through the article parser
+and the non-academic author classifier, without touching the E-utilities API.
+"""
+
+import argparse
+import gzip
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from .filters import AffiliationCache, identify_non_academic_authors
+from .parsers import iter_articles
+from .utils import CsvPaperWriter, setup_logging
+
+logger = logging.getLogger(__name__)
+
+def output_path_for(input_path: str, output_dir: str) -> str:
+    """
+    Return the CSV path an input dump file is written to.
+
+    Args:
+        input_path: Path of a baseline/updatefiles dump, e.g. pubmed24n0001.xml.gz
+        output_dir: Directory receiving the results
+
+    Returns:
+        Path of the CSV file, e.g. <output_dir>/pubmed24n0001.csv
+    """
+    name = os.path.basename(input_path)
+    for suffix in (".gz", ".xml"):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    return os.path.join(output_dir, f"{name}.csv")
+
+def ingest_file(input_path: str, output_path: str) -> int:
+    """
+    Classify every article of one dump file and write the matching papers as CSV.
+
+    Articles are parsed, classified and written one at a time, so memory use does
+    not depend on the file size.
+
+    Args:
+        input_path: Path of a .xml or .xml.gz dump file
+        output_path: Path of the CSV file to write
+
+    Returns:
+        Number of papers with at least one non-academic author
+    """
+    opener = gzip.open if input_path.endswith(".gz") else open
+    # Affiliations repeat heavily across a dump, so classify each distinct one once
+    cache = AffiliationCache()
+
+    with opener(input_path, "rb") as source, open(output_path, "w", newline="", encoding="utf-8") as output:
+        writer = CsvPaperWriter(output)
+        for paper in iter_articles(source):
+            writer.write(identify_non_academic_authors([paper], cache))
+
+    logger.debug(f"{input_path}: affiliation cache {cache.hits} hits, {cache.misses} misses")
+    return writer.rows_written
+
+def ingest_baseline_files(
+    input_paths: List[str],
+    output_dir: str,
+    workers: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Classify a set of dump files in parallel, one file per worker process.
+
+    Args:
+        input_paths: Paths of .xml or .xml.gz dump files
+        output_dir: Directory receiving one CSV file per input file
+        workers: Number of worker processes, defaults to the number of CPUs
+
+    Returns:
+        Mapping of input path to the number of papers written for it
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    results: Dict[str, int] = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(ingest_file, path, output_path_for(path, output_dir)): path
+            for path in input_paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            results[path] = future.result()
+            logger.info(f"{path}: {results[path]} papers with company-affiliated authors")
+
+    return results
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(
+        description="Identify papers with pharma/biotech company authors in local PubMed baseline files"
+    )
+
+    parser.add_argument(
+        "files",
+        nargs="+",
+        help="PubMed baseline/updatefiles dumps (.xml.gz or .xml)"
+    )
+
+    parser.add_argument(
+        "-o", "--output-dir",
+        required=True,
+        help="Directory to write one CSV file per input file"
+    )
+
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        help="Number of worker processes (default: number of CPUs)"
+    )
+
+    parser.add_argument(
+        "-d", "--debug",
+        action="store_true",
+        help="Enable debug output"
+    )
+
+    return parser.parse_args()
+
+def main() -> None:
+    """
+    Main entry point for offline ingestion.
+    """
+    args = parse_arguments()
+
+    setup_logging(args.debug)
+
+    try:
+        results = ingest_baseline_files(args.files, args.output_dir, workers=args.workers)
+        logger.info(f"Wrote {sum(results.values())} papers from {len(results)} files to {args.output_dir}")
+    except Exception as e:
+        logger.error(f"An error occurred: {e}")
+        if args.debug:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
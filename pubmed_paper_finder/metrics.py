@@ -0,0 +1,135 @@
+"""
+Per-run timing and counter instrumentation.
+
+A Metrics object is shared by the API client and the module functions of one
+run; it records wall and CPU time per pipeline stage (esearch, efetch, parse,
+classify, export) and counters such as requests, retries, bytes downloaded,
+rate-limit waits and cache hits.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+class Metrics:
+    """
+    Thread-safe stage timers and counters for one run.
+
+    Stage wall times are summed over all calls, so stages that run concurrently
+    (such as efetch with several workers) can add up to more than the elapsed time.
+    CPU times are measured per thread with time.thread_time.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time a block of work as part of a stage.
+
+        Args:
+            name: Stage name, e.g. "efetch" or "parse"
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - wall_start, time.thread_time() - cpu_start)
+
+    def add_time(self, name: str, wall_seconds: float, cpu_seconds: float = 0.0) -> None:
+        """
+        Add one timed call to a stage.
+
+        Args:
+            name: Stage name
+            wall_seconds: Elapsed wall-clock time
+            cpu_seconds: CPU time of the calling thread
+        """
+        with self._lock:
+            stage = self.stages.setdefault(name, {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0})
+            stage["calls"] += 1
+            stage["wall_seconds"] += wall_seconds
+            stage["cpu_seconds"] += cpu_seconds
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: Counter name, e.g. "requests" or "bytes_downloaded"
+            value: Amount to add
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Return a structured, JSON-serializable report of the run so far.
+
+        Returns:
+            Dictionary with elapsed time, per-stage timings, counters and derived rates
+        """
+        with self._lock:
+            elapsed = time.perf_counter() - self.started
+            stages = {
+                name: {
+                    "calls": int(stage["calls"]),
+                    "wall_seconds": round(stage["wall_seconds"], 6),
+                    "cpu_seconds": round(stage["cpu_seconds"], 6)
+                }
+                for name, stage in self.stages.items()
+            }
+            counters = dict(self.counters)
+
+        rates: Dict[str, float] = {}
+        if elapsed > 0:
+            rates["articles_per_sec"] = round(counters.get("articles_parsed", 0) / elapsed, 2)
+        for cache in ("search_cache", "article_cache", "affiliation_cache"):
+            lookups = counters.get(f"{cache}_hits", 0) + counters.get(f"{cache}_misses", 0)
+            if lookups:
+                rates[f"{cache}_hit_rate"] = round(counters[f"{cache}_hits"] / lookups, 4)
+
+        return {
+            "elapsed_seconds": round(elapsed, 6),
+            "stages": stages,
+            "counters": counters,
+            "rates": rates
+        }
+
+    def to_prometheus(self, prefix: str = "pubmed_paper_finder") -> str:
+        """
+        Render the report in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Prometheus text format, one sample per line
+        """
+        report = self.report()
+        lines = [
+            f"# TYPE {prefix}_elapsed_seconds gauge",
+            f"{prefix}_elapsed_seconds {report['elapsed_seconds']}"
+        ]
+
+        for field, metric_type in (("calls", "counter"), ("wall_seconds", "counter"), ("cpu_seconds", "counter")):
+            name = f"{prefix}_stage_{field}"
+            lines.append(f"# TYPE {name} {metric_type}")
+            for stage, values in report["stages"].items():
+                lines.append(f'{name}{{stage="{stage}"}} {values[field]}')
+
+        for counter, value in report["counters"].items():
+            lines.append(f"# TYPE {prefix}_{counter} counter")
+            lines.append(f"{prefix}_{counter} {value}")
+
+        for rate, value in report["rates"].items():
+            lines.append(f"# TYPE {prefix}_{rate} gauge")
+            lines.append(f"{prefix}_{rate} {value}")
+
+        return "\n".join(lines) + "\n"
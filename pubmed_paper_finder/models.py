@@ -1,7 +1,13 @@
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, Hashable, List, Optional, Tuple, TypeVar
 from datetime import date
 
+T = TypeVar("T", bound=Hashable)
+
+# Bumped by every assignment to an Author attribute, so Paper can tell whether
+# its cached derived properties may be stale (see Paper._derive)
+_author_mutations = 0
+
 
 @dataclass
 class Author:
@@ -14,41 +20,201 @@ class Author:
     is_corresponding: bool = False
     is_non_academic: bool = False
     company_affiliation: Optional[str] = None
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        # A Python-level call per assignment (six of them in __init__): the price
+        # of derived properties that never go stale when an author is changed
+        global _author_mutations
+        object.__setattr__(self, name, value)
+        _author_mutations += 1
 
 
 @dataclass
 class Paper:
     """
     Represents a research paper with its metadata.
+    
+    non_academic_authors, company_affiliations and corresponding_author_email
+    are computed in one pass and cached. The cache is refreshed when the author
+    list is replaced or changes length, or when any Author attribute is
+    assigned. Only reordering the author list in place, or replacing an author
+    with one that already existed, goes unnoticed: call invalidate_derived()
+    after doing that.
     """
     pubmed_id: str
     title: str
     publication_date: date
     authors: List[Author] = field(default_factory=list)
+    last_revised: Optional[date] = None
+    
+    def __post_init__(self) -> None:
+        # Derived author data, computed on first access (see _derive). A plain
+        # attribute rather than a field, so fields(), asdict() and comparisons
+        # only see the paper's data
+        self._derived: Optional[Tuple[List[Author], int, int, List[Author], List[str], Optional[str]]] = None
+    
+    def invalidate_derived(self) -> None:
+        """
+        Discards the cached derived properties.
+        
+        Only needed after reordering the author list in place, or replacing an
+        author with an existing Author object; other changes are detected.
+        """
+        self._derived = None
+    
+    def _derive(self) -> Tuple[List[Author], int, int, List[Author], List[str], Optional[str]]:
+        """
+        Computes the non-academic authors, company affiliations and corresponding
+        author email in a single pass over the authors, and caches them.
+        
+        The cache is keyed on the author list object, its length and the Author
+        mutation counter, so checking it costs no pass over the authors.
+        """
+        authors = self.authors
+        derived = self._derived
+        if (
+            derived is None or derived[0] is not authors or derived[1] != len(authors)
+            or derived[2] != _author_mutations
+        ):
+            # Read the counter first, so changes made while computing invalidate the result
+            mutations = _author_mutations
+            non_academic_authors: List[Author] = []
+            companies = set()
+            corresponding_email: Optional[str] = None
+            
+            for author in authors:
+                if author.is_non_academic:
+                    non_academic_authors.append(author)
+                    if author.company_affiliation is not None:
+                        companies.add(author.company_affiliation)
+                if corresponding_email is None and author.is_corresponding and author.email:
+                    corresponding_email = author.email
+            
+            derived = (authors, len(authors), mutations, non_academic_authors, list(companies), corresponding_email)
+            self._derived = derived
+        return derived
     
     @property
     def non_academic_authors(self) -> List[Author]:
         """
         Returns a list of authors affiliated with non-academic institutions.
         """
-        return [author for author in self.authors if author.is_non_academic]
+        return self._derive()[3]
     
     @property
     def company_affiliations(self) -> List[str]:
         """
         Returns a list of unique company affiliations from all authors.
         """
-        return list(set(
-            [author.company_affiliation for author in self.non_academic_authors 
-             if author.company_affiliation is not None]
-        ))
+        return self._derive()[4]
     
     @property
     def corresponding_author_email(self) -> Optional[str]:
         """
         Returns the email of the corresponding author, if available.
         """
-        for author in self.authors:
-            if author.is_corresponding and author.email:
-                return author.email
-        return None
\ No newline at end of file
+        return self._derive()[5]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a JSON-serializable dictionary of the paper and its authors.
+        """
+        return {
+            "pubmed_id": self.pubmed_id,
+            "title": self.title,
+            "publication_date": self.publication_date.isoformat(),
+            "authors": [asdict(author) for author in self.authors],
+            "last_revised": self.last_revised.isoformat() if self.last_revised else None
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Paper":
+        """
+        Creates a paper from a dictionary produced by to_dict.
+        """
+        last_revised = data.get("last_revised")
+        return cls(
+            pubmed_id=data["pubmed_id"],
+            title=data["title"],
+            publication_date=date.fromisoformat(data["publication_date"]),
+            authors=[Author(**author) for author in data.get("authors", [])],
+            last_revised=date.fromisoformat(last_revised) if last_revised else None
+        )
+
+
+def _slotted_copy(cls: type, name: str, extra_slots: Tuple[str, ...] = ()) -> type:
+    """
+    Create a copy of a dataclass that stores its fields (and any extra_slots
+    attributes) in __slots__ instead of a per-instance __dict__
+    (dataclass(slots=True) requires Python 3.10).
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in field_names and key not in ("__dict__", "__weakref__")
+    }
+    cls_dict["__slots__"] = field_names + extra_slots
+    cls_dict["__qualname__"] = name
+    cls_dict["__doc__"] = f"Memory-compact variant of {cls.__name__} using __slots__."
+    return type(name, cls.__bases__, cls_dict)
+
+
+# Compact variants with the same fields and properties as Author and Paper
+CompactAuthor = _slotted_copy(Author, "CompactAuthor")
+CompactPaper = _slotted_copy(Paper, "CompactPaper", ("_derived",))
+
+
+class StringPool:
+    """
+    Interns repeated values so equal strings (and dates) share a single object.
+    """
+    
+    def __init__(self) -> None:
+        self._values: Dict[Hashable, Any] = {}
+    
+    def __len__(self) -> int:
+        return len(self._values)
+    
+    def intern(self, value: T) -> T:
+        """
+        Returns the pooled object equal to value, adding value if it is new.
+        """
+        if value is None:
+            return value
+        return self._values.setdefault(value, value)
+
+
+def compact_papers(papers: List[Paper], pool: Optional[StringPool] = None) -> List[Any]:
+    """
+    Converts papers to CompactPaper/CompactAuthor objects sharing interned strings.
+    
+    Args:
+        papers: List of Paper objects
+        pool: Pool to intern strings into, shared across calls to deduplicate further
+        
+    Returns:
+        List of CompactPaper objects with the same attributes as the input papers
+    """
+    pool = pool if pool is not None else StringPool()
+    intern = pool.intern
+    
+    return [
+        CompactPaper(
+            pubmed_id=paper.pubmed_id,
+            title=paper.title,
+            publication_date=intern(paper.publication_date),
+            authors=[
+                CompactAuthor(
+                    name=intern(author.name),
+                    affiliation=intern(author.affiliation),
+                    email=intern(author.email),
+                    is_corresponding=author.is_corresponding,
+                    is_non_academic=author.is_non_academic,
+                    company_affiliation=intern(author.company_affiliation)
+                )
+                for author in paper.authors
+            ],
+            last_revised=intern(paper.last_revised)
+        )
+        for paper in papers
+    ]
@@ -3,21 +3,39 @@ PubMed Paper Finder Module API - Reusable functions for finding and filtering pa
 pharmaceutical/biotech company affiliated authors
 """
 
-from typing import List, Optional, Dict, Any
+import hashlib
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import List, Optional, Dict, Any, AsyncIterator, Iterator, TextIO, Tuple
 import logging
 
 from .api import PubMedAPI
-from .filters import identify_non_academic_authors
-from .models import Paper
-from .utils import export_to_csv
+from .cache import ArticleCache, SearchCache
+from .filters import AffiliationCache, identify_non_academic_authors
+from .gazetteer import CompanyGazetteer
+from .incremental import WATERMARK_FORMAT, IncrementalState, QueryState
+from .metrics import Metrics
+from .models import Paper, StringPool, compact_papers
+from .pipeline import iter_pipeline_batches
+from .store import PaperStore
+from .utils import export_papers, open_paper_writer
 
 logger = logging.getLogger(__name__)
 
+# esearch cannot page beyond this many results of one search
+ESEARCH_MAX_RESULTS = 10_000
+
+# Options of iter_company_paper_batches that incremental runs do not use
+_NOT_INCREMENTAL_OPTIONS = ("use_history", "cache_path", "processes", "search_cache")
+
 def find_papers_with_company_authors(
-    query: str, 
+    query: str,
     max_results: int = 100,
-    email: str = "your.email@example.com",
-    tool: str = "pubmed-paper-finder"
+    *,
+    compact: bool = False,
+    **kwargs: Any
 ) -> List[Paper]:
     """
     Find papers matching the query and identify those with authors affiliated with
@@ -26,32 +44,458 @@ def find_papers_with_company_authors(
     Args:
         query: PubMed search query (supports full PubMed syntax)
         max_results: Maximum number of results to fetch
-        email: Email to include in API requests (NCBI recommendation)
-        tool: Tool name to include in API requests (NCBI recommendation)
+        compact: Return memory-compact CompactPaper objects with interned strings;
+            each batch is compacted as it arrives, so full Paper objects never pile up
+        **kwargs: Options passed on to iter_company_paper_batches
         
     Returns:
         List of Paper objects with at least one non-academic author
     """
-    # Initialize PubMed API client
-    api = PubMedAPI(email=email, tool=tool)
+    batches = iter_company_paper_batches(query, max_results, **kwargs)
+    
+    if not compact:
+        return [paper for batch in batches for paper in batch]
+    
+    # One pool for every batch, so strings repeated across batches are shared too
+    pool = StringPool()
+    return [paper for batch in batches for paper in compact_papers(batch, pool)]
+
+def iter_papers_with_company_authors(query: str, max_results: int = 100, **kwargs: Any) -> Iterator[Paper]:
+    """
+    Lazily yield papers with authors affiliated with pharmaceutical or biotech
+    companies, as each efetch batch is classified.
+    
+    Args:
+        query: PubMed search query (supports full PubMed syntax)
+        max_results: Maximum number of results to fetch
+        **kwargs: Options passed on to iter_company_paper_batches
+        
+    Yields:
+        Paper objects with at least one non-academic author
+    """
+    for batch in iter_company_paper_batches(query, max_results, **kwargs):
+        yield from batch
+
+def iter_company_paper_batches(
+    query: str,
+    max_results: int = 100,
+    email: str = "your.email@example.com",
+    tool: str = "pubmed-paper-finder",
+    api_key: Optional[str] = None,
+    max_workers: int = 1,
+    use_history: bool = False,
+    cache_path: Optional[str] = None,
+    classification_cache_path: Optional[str] = None,
+    metrics: Optional[Metrics] = None,
+    processes: int = 0,
+    gazetteer: Optional[CompanyGazetteer] = None,
+    search_cache: Optional[SearchCache] = None,
+    store_path: Optional[str] = None
+) -> Iterator[List[Paper]]:
+    """
+    Streaming pipeline from search to filtered results: each efetch batch is
+    parsed, classified and filtered before it is handed to the caller, so memory
+    use does not grow with the number of results.
+    
+    This is the one place the search options are declared and documented; the
+    other search functions of this module pass their **kwargs on to it.
+    
+    Args:
+        query: PubMed search query (supports full PubMed syntax)
+        max_results: Maximum number of results to fetch
+        email: Email to include in API requests (NCBI recommendation)
+        tool: Tool name to include in API requests (NCBI recommendation)
+        api_key: NCBI API key, allows 10 instead of 3 requests per second
+        max_workers: Number of efetch batches to keep in flight at once
+        use_history: Page through the results on the NCBI history server instead of
+            sending every PubMed ID to efetch, for queries with very many hits
+        cache_path: Path of a persistent article cache; cached articles are not refetched
+            unless PubMed has revised them since
+        classification_cache_path: Path of a JSON file persisting affiliation
+            classifications between runs
+        metrics: Metrics collecting stage timings and counters for the run
+        processes: Parse and classify in this many worker processes (staged
+            multi-core pipeline), 0 to do it in this process
+        gazetteer: Known companies, reported under their canonical names
+        search_cache: Cache of esearch results, reused within its TTL
+        store_path: Path of a local paper store; every fetched paper is saved to it
+            with its classification, for offline queries
+        
+    Yields:
+        Lists of Paper objects with at least one non-academic author, one per batch
+    """
+    metrics = metrics if metrics is not None else Metrics()
+    cache = ArticleCache(cache_path) if cache_path else None
+    affiliation_cache = AffiliationCache(path=classification_cache_path)
+    store = PaperStore(store_path) if store_path else None
+    
+    try:
+        # Initialize PubMed API client; the context manager releases pooled connections
+        with PubMedAPI(
+            email=email, tool=tool, api_key=api_key, max_workers=max_workers, cache=cache,
+            metrics=metrics, search_cache=search_cache
+        ) as api:
+            if cache is not None and not use_history:
+                api.expire_revised_articles(query, max_results)
+            
+            if processes > 0:
+                # Staged pipeline: the worker processes have already classified the authors
+                batches = _iter_pipeline_result_batches(
+                    api, query, max_results, use_history, processes, affiliation_cache, gazetteer
+                )
+            else:
+                batches = _iter_classified_batches(
+                    _iter_result_batches(api, query, max_results, use_history),
+                    affiliation_cache, gazetteer, metrics
+                )
+            
+            for batch in batches:
+                _store_papers(store, batch, metrics)
+                # Keep papers with at least one non-academic author
+                yield [p for p in batch if p.non_academic_authors]
+    finally:
+        if cache is not None:
+            cache.close()
+        if store is not None:
+            store.close()
+        _report_affiliation_cache(affiliation_cache, metrics)
+
+def _iter_classified_batches(
+    batches: Iterator[List[Paper]],
+    affiliation_cache: AffiliationCache,
+    gazetteer: Optional[CompanyGazetteer],
+    metrics: Metrics
+) -> Iterator[List[Paper]]:
+    """
+    Identify the non-academic authors of each batch in this process.
+    """
+    for batch in batches:
+        # Yield outside the stage, so the consumer's time is not counted as classifying
+        with metrics.stage("classify"):
+            classified = identify_non_academic_authors(batch, affiliation_cache, gazetteer)
+        yield classified
+
+def _store_papers(store: Optional[PaperStore], papers: List[Paper], metrics: Metrics) -> None:
+    """
+    Save classified papers to the local paper store, if there is one.
+    """
+    if store is None or not papers:
+        return
+    with metrics.stage("store"):
+        store.put_many(papers)
+
+def _iter_result_batches(
+    api: PubMedAPI,
+    query: str,
+    max_results: int,
+    use_history: bool
+) -> Iterator[List[Paper]]:
+    """
+    Search and lazily fetch the matching papers, batch by batch.
+    """
+    if use_history:
+        history = api.search_history(query)
+        
+        if not history.count:
+            logger.info("No papers found matching the query")
+            return
+        
+        yield from api.iter_history_pages(history, max_results=max_results)
+        return
     
     # Search for papers
     pmids = api.search(query, max_results=max_results)
     
     if not pmids:
         logger.info("No papers found matching the query")
-        return []
+        return
     
     # Fetch paper details
-    papers = api.fetch_papers(pmids)
+    yield from api.iter_paper_batches(pmids)
+
+def _iter_pipeline_result_batches(
+    api: PubMedAPI,
+    query: str,
+    max_results: int,
+    use_history: bool,
+    processes: int,
+    affiliation_cache: AffiliationCache,
+    gazetteer: Optional[CompanyGazetteer]
+) -> Iterator[List[Paper]]:
+    """
+    Search and fetch the matching papers through the multi-core staged pipeline.
+    """
+    if use_history:
+        raise ValueError("The multi-process pipeline cannot be combined with use_history")
     
-    # Identify non-academic authors
-    papers = identify_non_academic_authors(papers)
+    pmids = api.search(query, max_results=max_results)
     
-    # Filter papers with at least one non-academic author
-    papers_with_company_authors = [p for p in papers if p.non_academic_authors]
+    if not pmids:
+        logger.info("No papers found matching the query")
+        return
     
-    return papers_with_company_authors
+    yield from iter_pipeline_batches(
+        api, pmids, processes=processes, affiliation_cache=affiliation_cache, gazetteer=gazetteer
+    )
+
+def _report_affiliation_cache(affiliation_cache: AffiliationCache, metrics: Metrics) -> None:
+    """
+    Record the affiliation cache statistics and persist it if it has a path.
+    """
+    metrics.increment("affiliation_cache_hits", affiliation_cache.hits)
+    metrics.increment("affiliation_cache_misses", affiliation_cache.misses)
+    logger.debug(
+        f"Affiliation cache: {affiliation_cache.hits} hits, {affiliation_cache.misses} misses"
+    )
+    if affiliation_cache.path:
+        affiliation_cache.save()
+
+def find_papers_with_company_authors_incremental(
+    query: str,
+    state_path: str,
+    max_results: int = 100,
+    email: str = "your.email@example.com",
+    tool: str = "pubmed-paper-finder",
+    api_key: Optional[str] = None,
+    max_workers: int = 1,
+    classification_cache_path: Optional[str] = None,
+    metrics: Optional[Metrics] = None,
+    gazetteer: Optional[CompanyGazetteer] = None,
+    store_path: Optional[str] = None
+) -> List[Paper]:
+    """
+    Incrementally maintain the papers with company-affiliated authors for a
+    standing query.
+    
+    The first run searches and fetches the full result set. Later runs restrict
+    esearch to records added (edat) or modified (mdat) since the previous run,
+    fetch only those, and merge them into the results recorded in the state file.
+    
+    Args:
+        query: PubMed search query (supports full PubMed syntax)
+        state_path: Path of the JSON file holding the watermark and results per query
+        max_results: Maximum number of results of the first run; later runs page
+            through all changes since the last run in pages of this size
+        email: Email to include in API requests (NCBI recommendation)
+        tool: Tool name to include in API requests (NCBI recommendation)
+        api_key: NCBI API key, allows 10 instead of 3 requests per second
+        max_workers: Number of efetch batches to keep in flight at once
+        classification_cache_path: Path of a JSON file persisting affiliation
+            classifications between runs
+        metrics: Metrics collecting stage timings and counters for the run
+        gazetteer: Known companies, reported under their canonical names
+        store_path: Path of a local paper store; every fetched paper is saved to it
+            with its classification, for offline queries
+        
+    Returns:
+        All papers with at least one non-academic author found so far, newest first
+    """
+    metrics = metrics if metrics is not None else Metrics()
+    state = IncrementalState(state_path)
+    query_state = state.get(query)
+    run_date = date.today().strftime(WATERMARK_FORMAT)
+    affiliation_cache = AffiliationCache(path=classification_cache_path)
+    
+    try:
+        with PubMedAPI(
+            email=email, tool=tool, api_key=api_key, max_workers=max_workers, metrics=metrics
+        ) as api:
+            complete = True
+            if query_state.last_run is None:
+                pmids = api.search(query, max_results=max_results)
+            else:
+                pmids, complete = _search_since(api, query, query_state, max_results)
+            
+            papers = api.fetch_papers(pmids) if pmids else []
+            with metrics.stage("classify"):
+                papers = identify_non_academic_authors(papers, affiliation_cache, gazetteer)
+    finally:
+        _report_affiliation_cache(affiliation_cache, metrics)
+    
+    if store_path:
+        with PaperStore(store_path) as store:
+            _store_papers(store, papers, metrics)
+    
+    previous_max_pmid = query_state.max_pmid
+    query_state.merge(papers)
+    if complete:
+        query_state.last_run = run_date
+    else:
+        # Keep the watermark, so the records that could not be retrieved are
+        # searched for again (and not skipped as already seen) by the next run
+        query_state.max_pmid = previous_max_pmid
+        logger.warning(
+            f"Could not retrieve every paper added or revised since {query_state.last_run}; "
+            "the watermark is not advanced"
+        )
+    state.save()
+    
+    return query_state.papers()
+
+def _search_since(
+    api: PubMedAPI,
+    query: str,
+    query_state: QueryState,
+    page_size: int
+) -> Tuple[List[str], bool]:
+    """
+    Return the PubMed IDs added or revised since the query's last run, and
+    whether all of them could be retrieved.
+    """
+    # The watermark is a day, so the last run's day is searched again; records
+    # added that day which were already seen are skipped by PubMed ID
+    added, added_complete = _search_all(api, query, query_state.last_run, "edat", page_size)
+    revised, revised_complete = _search_all(api, query, query_state.last_run, "mdat", page_size)
+    revised_set = set(revised)
+    
+    pmids = [
+        pmid for pmid in added
+        if pmid in revised_set or not pmid.isdigit() or int(pmid) > query_state.max_pmid
+    ]
+    seen = set(pmids)
+    pmids.extend(pmid for pmid in revised if pmid not in seen)
+    
+    logger.info(f"{len(pmids)} papers added or revised since {query_state.last_run}")
+    return pmids, added_complete and revised_complete
+
+def _search_all(
+    api: PubMedAPI,
+    query: str,
+    mindate: Optional[str],
+    datetype: str,
+    page_size: int
+) -> Tuple[List[str], bool]:
+    """
+    Page through every result of a date-restricted search with retstart.
+    
+    Returns:
+        The PubMed IDs, and False if esearch could not return all of them
+    """
+    page_size = max(1, min(page_size, ESEARCH_MAX_RESULTS))
+    pmids, count = api.search_page(query, retmax=page_size, mindate=mindate, datetype=datetype)
+    
+    while len(pmids) < min(count, ESEARCH_MAX_RESULTS):
+        page, count = api.search_page(
+            query, retstart=len(pmids), retmax=page_size, mindate=mindate, datetype=datetype
+        )
+        if not page:
+            break
+        pmids.extend(page)
+    
+    return pmids, len(pmids) >= count
+
+def find_papers_offline(
+    query: Optional[str],
+    store_path: str,
+    max_results: Optional[int] = 100,
+    company: Optional[str] = None,
+    mindate: Optional[str] = None,
+    maxdate: Optional[str] = None,
+    metrics: Optional[Metrics] = None
+) -> List[Paper]:
+    """
+    Find papers with company-affiliated authors in the local paper store, without
+    network access.
+    
+    Only papers saved to the store by earlier runs (see store_path of the other
+    functions) are searched, with the classifications they were stored with.
+    
+    Args:
+        query: FTS5 query over titles, affiliations and company names, e.g.
+            'cancer AND pfizer' or '"gene therapy"', None for all papers
+        store_path: Path of the paper store
+        max_results: Maximum number of results, None for no limit
+        company: Only papers with an author of this company (case-insensitive)
+        mindate: Only papers published on or after this date (YYYY/MM/DD)
+        maxdate: Only papers published on or before this date (YYYY/MM/DD)
+        metrics: Metrics collecting stage timings and counters for the run
+        
+    Returns:
+        List of Paper objects with at least one non-academic author, newest first
+    """
+    if not os.path.exists(store_path):
+        raise ValueError(f"Paper store {store_path} does not exist")
+    
+    metrics = metrics if metrics is not None else Metrics()
+    with metrics.stage("store_query"), PaperStore(store_path) as store:
+        papers = store.search(
+            query, company=company, mindate=mindate, maxdate=maxdate, max_results=max_results
+        )
+    
+    logger.info(f"Found {len(papers)} papers in the local store")
+    return papers
+
+async def iter_papers_with_company_authors_async(
+    query: str,
+    max_results: int = 100,
+    email: str = "your.email@example.com",
+    tool: str = "pubmed-paper-finder",
+    api_key: Optional[str] = None,
+    max_workers: int = 4,
+    ordered: bool = False
+) -> AsyncIterator[Paper]:
+    """
+    Asynchronously yield papers with authors affiliated with pharmaceutical or
+    biotech companies as soon as each efetch batch has been processed.
+    
+    Requires the optional `aiohttp` dependency.
+    
+    Args:
+        query: PubMed search query (supports full PubMed syntax)
+        max_results: Maximum number of results to fetch
+        email: Email to include in API requests (NCBI recommendation)
+        tool: Tool name to include in API requests (NCBI recommendation)
+        api_key: NCBI API key, allows 10 instead of 3 requests per second
+        max_workers: Number of efetch batches to keep in flight at once
+        ordered: Fetch every batch before yielding, and yield in PMID order
+        
+    Yields:
+        Paper objects with at least one non-academic author
+    """
+    from .aio import AsyncPubMedAPI
+    
+    async with AsyncPubMedAPI(
+        email=email, tool=tool, api_key=api_key, max_concurrency=max_workers
+    ) as api:
+        pmids = await api.search(query, max_results=max_results)
+        
+        if not pmids:
+            logger.info("No papers found matching the query")
+            return
+        
+        affiliation_cache = AffiliationCache()
+        if ordered:
+            papers = identify_non_academic_authors(await api.fetch_papers(pmids), affiliation_cache)
+            for paper in papers:
+                if paper.non_academic_authors:
+                    yield paper
+            return
+        
+        async for paper in api.iter_papers(pmids):
+            identify_non_academic_authors([paper], affiliation_cache)
+            if paper.non_academic_authors:
+                yield paper
+
+async def find_papers_with_company_authors_async(
+    query: str,
+    max_results: int = 100,
+    **kwargs: Any
+) -> List[Paper]:
+    """
+    Asynchronous variant of find_papers_with_company_authors.
+    
+    Requires the optional `aiohttp` dependency.
+    
+    Args:
+        query: PubMed search query (supports full PubMed syntax)
+        max_results: Maximum number of results to fetch
+        **kwargs: Options passed on to iter_papers_with_company_authors_async
+        
+    Returns:
+        List of Paper objects with at least one non-academic author, in PMID order
+    """
+    papers = iter_papers_with_company_authors_async(query, max_results, ordered=True, **kwargs)
+    return [paper async for paper in papers]
 
 def get_papers_as_dict(papers: List[Paper]) -> List[Dict[str, Any]]:
     """
@@ -89,8 +533,12 @@ def find_and_export_papers(
     query: str,
     output_file: Optional[str] = None,
     max_results: int = 100,
-    email: str = "your.email@example.com",
-    tool: str = "pubmed-paper-finder"
+    *,
+    output_format: str = "csv",
+    state_path: Optional[str] = None,
+    offline: bool = False,
+    metrics: Optional[Metrics] = None,
+    **kwargs: Any
 ) -> Optional[str]:
     """
     Find papers matching the query, identify those with authors affiliated with
@@ -100,21 +548,251 @@ def find_and_export_papers(
         query: PubMed search query (supports full PubMed syntax)
         output_file: Path to save the CSV file, if None returns the CSV content as a string
         max_results: Maximum number of results to fetch
-        email: Email to include in API requests (NCBI recommendation)
-        tool: Tool name to include in API requests (NCBI recommendation)
+        output_format: One of "csv", "jsonl" or "parquet" (Parquet requires output_file)
+        state_path: Path of an incremental state file; when given only papers added or
+            revised since the last run are fetched and merged with the earlier results
+            (use_history, cache_path, processes and search_cache are then not used)
+        offline: Answer the query from the paper store at store_path without network
+            access; the query is then an FTS5 query (see find_papers_offline)
+        metrics: Metrics collecting stage timings and counters for the run
+        **kwargs: Options passed on to iter_company_paper_batches
         
     Returns:
-        CSV content as string if output_file is None, else None
+        Output content as string if output_file is None, else None
     """
-    papers = find_papers_with_company_authors(
-        query=query,
-        max_results=max_results,
-        email=email,
-        tool=tool
-    )
+    metrics = metrics if metrics is not None else Metrics()
+    
+    if offline:
+        store_path = kwargs.get("store_path")
+        if not store_path:
+            raise ValueError("Offline queries require a paper store (store_path)")
+        papers = find_papers_offline(query, store_path, max_results=max_results, metrics=metrics)
+    elif state_path:
+        for option in _NOT_INCREMENTAL_OPTIONS:
+            kwargs.pop(option, None)
+        papers = find_papers_with_company_authors_incremental(
+            query=query, state_path=state_path, max_results=max_results, metrics=metrics, **kwargs
+        )
+    else:
+        papers = find_papers_with_company_authors(query, max_results, metrics=metrics, **kwargs)
     
     if not papers:
         logger.info("No papers found with authors from pharmaceutical/biotech companies")
         return None if output_file else ""
     
-    return export_to_csv(papers, output_file)
\ No newline at end of file
+    with metrics.stage("export"):
+        return export_papers(papers, output_file, output_format)
+
+def stream_papers(
+    query: str,
+    sink: Any,
+    output_format: str = "csv",
+    metrics: Optional[Metrics] = None,
+    **kwargs: Any
+) -> int:
+    """
+    Find papers with company-affiliated authors and write each batch of results
+    as soon as it is available.
+    
+    CSV and JSONL streams are flushed after every batch, so the first rows appear
+    long before a large query has finished; Parquet output is written in row groups.
+    
+    Args:
+        query: PubMed search query (supports full PubMed syntax)
+        sink: Text stream for "csv" (opened with newline="") and "jsonl",
+            path or binary stream for "parquet"
+        output_format: One of "csv", "jsonl" or "parquet"
+        metrics: Metrics collecting stage timings and counters for the run
+        **kwargs: Options passed on to iter_company_paper_batches
+        
+    Returns:
+        Number of papers written
+    """
+    metrics = metrics if metrics is not None else Metrics()
+    writer = open_paper_writer(output_format, sink)
+    text_output = output_format != "parquet"
+    
+    try:
+        if text_output:
+            sink.flush()
+        
+        for batch in iter_company_paper_batches(query, metrics=metrics, **kwargs):
+            with metrics.stage("export"):
+                writer.write(batch)
+                if text_output:
+                    sink.flush()
+    finally:
+        with metrics.stage("export"):
+            writer.close()
+    
+    return writer.rows_written
+
+def stream_papers_to_csv(query: str, output: TextIO, **kwargs: Any) -> int:
+    """
+    Find papers with company-affiliated authors and write each batch of results
+    as CSV rows as soon as it is available.
+    
+    Args:
+        query: PubMed search query (supports full PubMed syntax)
+        output: Text stream to write to, opened with newline=""
+        **kwargs: Options passed on to iter_company_paper_batches
+        
+    Returns:
+        Number of papers written
+    """
+    return stream_papers(query, output, "csv", **kwargs)
+
+def find_papers_for_queries(
+    queries: List[str],
+    max_results: int = 100,
+    email: str = "your.email@example.com",
+    tool: str = "pubmed-paper-finder",
+    api_key: Optional[str] = None,
+    max_workers: int = 1,
+    search_workers: int = 4,
+    cache_path: Optional[str] = None,
+    classification_cache_path: Optional[str] = None,
+    metrics: Optional[Metrics] = None,
+    gazetteer: Optional[CompanyGazetteer] = None,
+    search_cache: Optional[SearchCache] = None,
+    store_path: Optional[str] = None,
+    processes: int = 0
+) -> Dict[str, List[Paper]]:
+    """
+    Run many related queries, fetching and classifying each paper only once.
+    
+    The esearches run concurrently, the union of their PubMed IDs is fetched and
+    classified once, and the results are then split back up per query, so efetch
+    volume scales with the number of unique papers rather than the sum of hits.
+    
+    Args:
+        queries: PubMed search queries (duplicates are run once)
+        max_results: Maximum number of results to fetch per query
+        email: Email to include in API requests (NCBI recommendation)
+        tool: Tool name to include in API requests (NCBI recommendation)
+        api_key: NCBI API key, allows 10 instead of 3 requests per second
+        max_workers: Number of efetch batches to keep in flight at once
+        search_workers: Number of esearch requests to run concurrently
+        cache_path: Path of a persistent article cache; cached articles are not refetched
+            unless PubMed has revised them since
+        classification_cache_path: Path of a JSON file persisting affiliation
+            classifications between runs
+        metrics: Metrics collecting stage timings and counters for the run
+        gazetteer: Known companies, reported under their canonical names
+        search_cache: Cache of esearch results, reused within its TTL
+        store_path: Path of a local paper store; every fetched paper is saved to it
+            with its classification, for offline queries
+        processes: Parse and classify in this many worker processes (staged
+            multi-core pipeline), 0 to do it in this process
+        
+    Returns:
+        Mapping of each query to its papers with at least one non-academic author,
+        in search result order
+    """
+    queries = list(dict.fromkeys(queries))
+    metrics = metrics if metrics is not None else Metrics()
+    cache = ArticleCache(cache_path) if cache_path else None
+    affiliation_cache = AffiliationCache(path=classification_cache_path)
+    
+    try:
+        with PubMedAPI(
+            email=email, tool=tool, api_key=api_key, max_workers=max_workers, cache=cache,
+            metrics=metrics, search_cache=search_cache
+        ) as api:
+            # All searches share the client's rate limiter
+            with ThreadPoolExecutor(max_workers=max(1, search_workers)) as executor:
+                pmids_per_query = dict(zip(
+                    queries,
+                    executor.map(lambda query: api.search(query, max_results=max_results), queries)
+                ))
+                if cache is not None:
+                    list(executor.map(lambda query: api.expire_revised_articles(query, max_results), queries))
+            
+            unique_pmids = list(dict.fromkeys(
+                pmid for pmids in pmids_per_query.values() for pmid in pmids
+            ))
+            total = sum(len(pmids) for pmids in pmids_per_query.values())
+            logger.info(f"{len(queries)} queries matched {total} papers, {len(unique_pmids)} unique")
+            
+            if processes > 0:
+                # The worker processes classify the authors
+                papers = [
+                    paper
+                    for batch in iter_pipeline_batches(
+                        api, unique_pmids, processes=processes, affiliation_cache=affiliation_cache,
+                        gazetteer=gazetteer
+                    )
+                    for paper in batch
+                ]
+            else:
+                papers = api.fetch_papers(unique_pmids) if unique_pmids else []
+                with metrics.stage("classify"):
+                    papers = identify_non_academic_authors(papers, affiliation_cache, gazetteer)
+    finally:
+        if cache is not None:
+            cache.close()
+        _report_affiliation_cache(affiliation_cache, metrics)
+    
+    if store_path:
+        with PaperStore(store_path) as store:
+            _store_papers(store, papers, metrics)
+    
+    company_papers = {paper.pubmed_id: paper for paper in papers if paper.non_academic_authors}
+    
+    return {
+        query: [company_papers[pmid] for pmid in pmids if pmid in company_papers]
+        for query, pmids in pmids_per_query.items()
+    }
+
+def export_papers_for_queries(
+    queries: List[str],
+    output_dir: str,
+    output_format: str = "csv",
+    metrics: Optional[Metrics] = None,
+    **kwargs: Any
+) -> Dict[str, str]:
+    """
+    Run many related queries with find_papers_for_queries and write one result
+    file per query.
+    
+    Args:
+        queries: PubMed search queries
+        output_dir: Directory receiving the result files
+        output_format: One of "csv", "jsonl" or "parquet"
+        metrics: Metrics collecting stage timings and counters for the run
+        **kwargs: Options passed on to find_papers_for_queries
+        
+    Returns:
+        Mapping of each query to the path of its result file
+    """
+    metrics = metrics if metrics is not None else Metrics()
+    results = find_papers_for_queries(queries, metrics=metrics, **kwargs)
+    os.makedirs(output_dir, exist_ok=True)
+    
+    paths: Dict[str, str] = {}
+    for query, papers in results.items():
+        paths[query] = output_path_for_query(query, output_dir, output_format)
+        with metrics.stage("export"):
+            export_papers(papers, paths[query], output_format)
+    
+    return paths
+
+def output_path_for_query(query: str, output_dir: str, output_format: str = "csv") -> str:
+    """
+    Return the result file path of a query in batch mode.
+    
+    The name is a readable slug of the query plus a short hash, so distinct
+    queries never share a file.
+    
+    Args:
+        query: PubMed search query
+        output_dir: Directory receiving the result files
+        output_format: Output format, used as the file extension
+        
+    Returns:
+        Path such as <output_dir>/aspirin_AND_cancer-1a2b3c4d.csv
+    """
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", query).strip("_")[:60] or "query"
+    digest = hashlib.sha1(query.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(output_dir, f"{slug}-{digest}.{output_format}")
+
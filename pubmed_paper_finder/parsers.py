@@ -0,0 +1,361 @@
+import io
+import logging
+import re
+from datetime import date, datetime
+from typing import BinaryIO, Iterator, List, Optional, Pattern, Union
+
+from lxml import etree
+
+from .models import Paper, Author
+
+logger = logging.getLogger(__name__)
+
+# Emails are often embedded in the affiliation text
+EMAIL_PATTERN: Pattern = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+
+# Available parser backends
+PARSERS = ("lxml", "bs4")
+
+
+def parse_fetch_response(xml_text: Union[str, bytes], parser: str = "lxml") -> List[Paper]:
+    """
+    Parse the XML response from efetch to extract paper information.
+
+    Args:
+        xml_text: XML response text from PubMed efetch
+        parser: Parser backend, "lxml" (streaming, default) or "bs4" (BeautifulSoup)
+
+    Returns:
+        List of Paper objects parsed from the XML
+    """
+    if parser == "lxml":
+        return list(iter_articles(xml_text))
+    if parser == "bs4":
+        return parse_fetch_response_bs4(xml_text)
+    raise ValueError(f"Unknown parser {parser!r}, expected one of {PARSERS}")
+
+
+def iter_articles(source: Union[str, bytes, BinaryIO]) -> Iterator[Paper]:
+    """
+    Stream Paper objects out of PubMed article XML with lxml iterparse.
+
+    Each PubmedArticle element is converted as soon as its end tag is read and
+    then freed, so memory stays flat however large the document is. The result
+    matches parse_fetch_response_bs4 exactly.
+
+    Args:
+        source: XML text, bytes, or a binary file object (e.g. an open .xml.gz file)
+
+    Yields:
+        Paper objects parsed from the XML
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    context = etree.iterparse(
+        source,
+        events=("end",),
+        tag="PubmedArticle",
+        load_dtd=False,
+        no_network=True,
+        resolve_entities=False,
+        huge_tree=True
+    )
+
+    for _, article_elem in context:
+        paper: Optional[Paper] = None
+        try:
+            paper = _paper_from_element(article_elem)
+        except Exception as e:
+            logger.error(f"Error parsing article: {e}")
+
+        # Free the article and everything parsed before it
+        article_elem.clear(keep_tail=True)
+        while article_elem.getprevious() is not None:
+            del article_elem.getparent()[0]
+
+        if paper is not None:
+            yield paper
+
+
+def _text(elem) -> str:
+    """
+    Return the text of an lxml element including all of its descendants.
+    """
+    return "".join(elem.itertext())
+
+
+def _paper_from_element(article_elem) -> Paper:
+    """
+    Build a Paper from an lxml PubmedArticle element.
+
+    Args:
+        article_elem: lxml element for the article
+
+    Returns:
+        Paper object with its authors
+    """
+    pmid = _text(article_elem.find(".//PMID"))
+
+    title_elem = article_elem.find(".//ArticleTitle")
+    title = _text(title_elem) if title_elem is not None else "Unknown Title"
+
+    revised_elem = article_elem.find(".//DateRevised")
+    last_revised = None
+    if revised_elem is not None:
+        last_revised = _revision_date(*(
+            _text(part) if part is not None else None
+            for part in (revised_elem.find(".//Year"), revised_elem.find(".//Month"), revised_elem.find(".//Day"))
+        ))
+
+    paper = Paper(
+        pubmed_id=pmid,
+        title=title,
+        publication_date=_publication_date_from_element(article_elem),
+        last_revised=last_revised
+    )
+
+    author_list = article_elem.find(".//AuthorList")
+    if author_list is not None:
+        for author_elem in author_list.iterdescendants("Author"):
+            try:
+                author = _author_from_element(author_elem)
+            except Exception as e:
+                logger.error(f"Error parsing author: {e}")
+                continue
+            if author is not None:
+                paper.authors.append(author)
+
+    return paper
+
+
+def _publication_date_from_element(article_elem) -> date:
+    """
+    Extract publication date from an lxml article element.
+
+    Args:
+        article_elem: lxml element for the article
+
+    Returns:
+        Date object representing the publication date
+    """
+    pub_date_elem = article_elem.find(".//PubMedPubDate[@PubStatus='pubmed']")
+
+    if pub_date_elem is None:
+        pub_date_elem = article_elem.find(".//ArticleDate")
+        if pub_date_elem is None:
+            pub_date_elem = article_elem.find(".//PubDate")
+
+    year = pub_date_elem.find(".//Year")
+    month = pub_date_elem.find(".//Month")
+    day = pub_date_elem.find(".//Day")
+
+    year_val = int(_text(year)) if year is not None else 1900
+    month_val = int(_text(month)) if month is not None else 1
+    day_val = int(_text(day)) if day is not None else 1
+
+    return datetime(year_val, month_val, day_val).date()
+
+
+def _revision_date(year: Optional[str], month: Optional[str], day: Optional[str]) -> Optional[date]:
+    """
+    Build the last-revised date of a record, or None if it is incomplete.
+    """
+    try:
+        return date(int(year), int(month), int(day))  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+
+def _author_from_element(author_elem) -> Optional[Author]:
+    """
+    Build an Author from an lxml Author element.
+
+    Args:
+        author_elem: lxml element for the author
+
+    Returns:
+        Author object, or None if the author has no name
+    """
+    last_name = author_elem.find(".//LastName")
+    fore_name = author_elem.find(".//ForeName")
+
+    if last_name is not None and fore_name is not None:
+        name = f"{_text(fore_name)} {_text(last_name)}"
+    elif last_name is not None:
+        name = _text(last_name)
+    else:
+        collective_name = author_elem.find(".//CollectiveName")
+        if collective_name is None:
+            return None
+        name = _text(collective_name)
+
+    is_corresponding = any(
+        id_elem.get("Source") == "CORRESP"
+        for id_elem in author_elem.iterdescendants("Identifier")
+    )
+
+    affiliation = author_elem.find(".//Affiliation")
+    affiliation_text = _text(affiliation) if affiliation is not None else None
+
+    email = None
+    if affiliation_text:
+        email_match = EMAIL_PATTERN.search(affiliation_text)
+        if email_match:
+            email = email_match.group(0)
+
+    return Author(
+        name=name,
+        affiliation=affiliation_text,
+        email=email,
+        is_corresponding=is_corresponding
+    )
+
+
+def parse_fetch_response_bs4(xml_text: Union[str, bytes]) -> List[Paper]:
+    """
+    Parse the XML response from efetch with BeautifulSoup.
+
+    Args:
+        xml_text: XML response text from PubMed efetch
+
+    Returns:
+        List of Paper objects parsed from the XML
+    """
+    # Imported here: BeautifulSoup is only the fallback backend and slow to import
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(xml_text, "xml")
+    papers: List[Paper] = []
+
+    for article_elem in soup.find_all("PubmedArticle"):
+        try:
+            pmid = article_elem.find("PMID").text
+
+            # Get title
+            title_elem = article_elem.find("ArticleTitle")
+            title = title_elem.text if title_elem else "Unknown Title"
+
+            # Get publication date
+            pub_date = _parse_publication_date(article_elem)
+
+            # Get the date the record was last revised
+            revised_elem = article_elem.find("DateRevised")
+            last_revised = None
+            if revised_elem:
+                last_revised = _revision_date(*(
+                    part.text if part else None
+                    for part in (revised_elem.find("Year"), revised_elem.find("Month"), revised_elem.find("Day"))
+                ))
+
+            # Create paper object
+            paper = Paper(
+                pubmed_id=pmid,
+                title=title,
+                publication_date=pub_date,
+                last_revised=last_revised
+            )
+
+            # Parse authors
+            _parse_authors(article_elem, paper)
+
+            papers.append(paper)
+        except Exception as e:
+            logger.error(f"Error parsing article: {e}")
+            continue
+
+    return papers
+
+
+def _parse_publication_date(article_elem) -> date:
+    """
+    Extract publication date from article element.
+
+    Args:
+        article_elem: BeautifulSoup element for the article
+
+    Returns:
+        Date object representing the publication date
+    """
+    # Try to find PubDate in PubMedPubDate with PubStatus="pubmed"
+    pub_date_elem = article_elem.find("PubMedPubDate", {"PubStatus": "pubmed"})
+
+    if not pub_date_elem:
+        # Fallback to ArticleDate or PubDate in Journal
+        pub_date_elem = article_elem.find("ArticleDate") or article_elem.find("PubDate")
+
+    year = pub_date_elem.find("Year")
+    month = pub_date_elem.find("Month")
+    day = pub_date_elem.find("Day")
+
+    year_val = int(year.text) if year else 1900
+    month_val = int(month.text) if month else 1
+    day_val = int(day.text) if day else 1
+
+    return datetime(year_val, month_val, day_val).date()
+
+
+def _parse_authors(article_elem, paper: Paper) -> None:
+    """
+    Extract author information from article element and add to paper.
+
+    Args:
+        article_elem: BeautifulSoup element for the article
+        paper: Paper object to update with author information
+    """
+    author_list = article_elem.find("AuthorList")
+    if not author_list:
+        return
+
+    for author_elem in author_list.find_all("Author"):
+        try:
+            # Get author name
+            last_name = author_elem.find("LastName")
+            fore_name = author_elem.find("ForeName")
+
+            if last_name and fore_name:
+                name = f"{fore_name.text} {last_name.text}"
+            elif last_name:
+                name = last_name.text
+            else:
+                collective_name = author_elem.find("CollectiveName")
+                if collective_name:
+                    name = collective_name.text
+                else:
+                    continue  # Skip author with no name
+
+            # Check if corresponding author
+            is_corresponding = False
+            author_id_list = author_elem.find_all("Identifier")
+            for id_elem in author_id_list:
+                if id_elem.get("Source") == "CORRESP":
+                    is_corresponding = True
+
+            # Get affiliation
+            affiliation_text = None
+            affiliation = author_elem.find("Affiliation")
+            if affiliation:
+                affiliation_text = affiliation.text
+
+            # Get email (often embedded in affiliation text)
+            email = None
+            if affiliation_text:
+                # Simple email extraction - could be improved
+                email_match = EMAIL_PATTERN.search(affiliation_text)
+                if email_match:
+                    email = email_match.group(0)
+
+            author = Author(
+                name=name,
+                affiliation=affiliation_text,
+                email=email,
+                is_corresponding=is_corresponding
+            )
+
+            paper.authors.append(author)
+
+        except Exception as e:
+            logger.error(f"Error parsing author: {e}")
+            continue
@@ -0,0 +1,164 @@
+"""
+Multi-core staged fetch pipeline.
+
+Three stages run concurrently:
+
+1. network fetch workers (threads of the API client) download raw efetch XML,
+2. a process pool parses the XML and classifies the authors, one batch per task,
+3. the consumer of iter_pipeline_batches (a single writer) receives the batches in order.
+
+At most `max_in_flight` batches are between stage 1 and stage 3 at any time, so a
+slow writer or slow parsers hold back the fetchers instead of buffering results.
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+from .api import PubMedAPI
+from .filters import AffiliationCache, identify_non_academic_authors
+from .gazetteer import CompanyGazetteer
+from .models import Paper
+from .parsers import parse_fetch_response
+
+logger = logging.getLogger(__name__)
+
+# Affiliation cache and company gazetteer of each worker process, set by _init_worker
+_worker_cache: Optional[AffiliationCache] = None
+_worker_gazetteer: Optional[CompanyGazetteer] = None
+
+def _init_worker(classification_cache_path: Optional[str], gazetteer: Optional[CompanyGazetteer]) -> None:
+    """
+    Set up the per-process affiliation cache, preloaded from a persisted cache if given.
+    """
+    global _worker_cache, _worker_gazetteer
+    _worker_cache = AffiliationCache(path=classification_cache_path)
+    _worker_gazetteer = gazetteer
+
+def _parse_and_classify(documents: List[bytes], parser: str) -> Tuple[List[Paper], float, float]:
+    """
+    Parse the raw efetch XML of one batch and classify its authors (runs in a worker process).
+
+    Returns:
+        The classified papers, and the wall and CPU seconds spent
+    """
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    papers = [paper for xml in documents for paper in parse_fetch_response(xml, parser=parser)]
+    papers = identify_non_academic_authors(papers, _worker_cache, _worker_gazetteer)
+
+    return papers, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+def _fetch_stage(api: PubMedAPI, missing: List[str]) -> Optional[List[bytes]]:
+    """
+    Download the articles of a planned batch that are not cached, as raw XML.
+
+    Returns:
+        The raw efetch XML documents, or None if every article of the batch was cached
+    """
+    return api.fetch_raw(missing) if missing else None
+
+def iter_pipeline_batches(
+    api: PubMedAPI,
+    pmids: List[str],
+    processes: Optional[int] = None,
+    affiliation_cache: Optional[AffiliationCache] = None,
+    max_in_flight: Optional[int] = None,
+    gazetteer: Optional[CompanyGazetteer] = None
+) -> Iterator[List[Paper]]:
+    """
+    Fetch, parse and classify papers in a staged pipeline, yielding batches in PMID order.
+
+    Parsing and classification run in worker processes, so large jobs scale with
+    the number of cores. Workers keep their own affiliation caches, preloaded from
+    the persisted cache file of `affiliation_cache` if it has one; their new
+    classifications are not written back to it.
+
+    Args:
+        api: API client; its max_workers threads fetch, its cache and metrics are used
+        pmids: PubMed IDs to fetch
+        processes: Number of parse/classify worker processes, defaults to the number of CPUs
+        affiliation_cache: Cache for classifying papers served from the article cache
+        max_in_flight: Maximum number of batches between fetching and the consumer,
+            defaults to twice the number of fetch threads plus worker processes
+        gazetteer: Known companies, reported under their canonical names
+
+    Yields:
+        Lists of classified Paper objects, one per efetch batch
+    """
+    if not pmids:
+        return
+
+    processes = processes or os.cpu_count() or 1
+    # Workers are first started from a fetch thread, and forking a process whose
+    # other threads hold locks (requests, urllib3, logging) can deadlock the
+    # child, so they are spawned instead
+    parse_pool = ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initargs=(affiliation_cache.path if affiliation_cache else None, gazetteer),
+        initializer=_init_worker
+    )
+    fetch_pool = ThreadPoolExecutor(max_workers=api.max_workers)
+    window = max_in_flight or 2 * (api.max_workers + processes)
+
+    def submit(span: List[str], missing: List[str], cached: Dict[str, Paper]) -> Future:
+        # Chain the fetch into the parse stage as soon as the download finishes
+        result: Future = Future()
+
+        def on_fetched(fetched: Future) -> None:
+            try:
+                documents = fetched.result()
+                if documents is None:
+                    result.set_result((span, cached, [], 0.0, 0.0))
+                    return
+                parsed = parse_pool.submit(_parse_and_classify, documents, api.parser)
+            except BaseException as e:
+                result.set_exception(e)
+                return
+
+            def on_parsed(parsed: Future) -> None:
+                try:
+                    papers, wall, cpu = parsed.result()
+                    result.set_result((span, cached, papers, wall, cpu))
+                except BaseException as e:
+                    result.set_exception(e)
+
+            parsed.add_done_callback(on_parsed)
+
+        fetch_pool.submit(_fetch_stage, api, missing).add_done_callback(on_fetched)
+        return result
+
+    in_flight: Deque[Future] = deque()
+    # Only articles missing from the article cache are fetched, in lazily cut batches
+    pending = api.iter_fetch_plan(pmids)
+    try:
+        for item in islice(pending, window):
+            in_flight.append(submit(*item))
+
+        while in_flight:
+            span, cached_by_id, papers, wall, cpu = in_flight.popleft().result()
+            for item in islice(pending, 1):
+                in_flight.append(submit(*item))
+
+            api.metrics.add_time("parse_classify", wall, cpu)
+            api.metrics.increment("articles_parsed", len(papers))
+            if api.cache is not None:
+                api.cache.put_many(papers)
+            cached = list(cached_by_id.values())
+            if cached:
+                with api.metrics.stage("classify"):
+                    cached = identify_non_academic_authors(cached, affiliation_cache, gazetteer)
+
+            papers_by_id = {paper.pubmed_id: paper for paper in cached}
+            papers_by_id.update((paper.pubmed_id, paper) for paper in papers)
+            yield [papers_by_id[pmid] for pmid in span if pmid in papers_by_id]
+    finally:
+        fetch_pool.shutdown(wait=True, cancel_futures=True)
+        parse_pool.shutdown(wait=True, cancel_futures=True)
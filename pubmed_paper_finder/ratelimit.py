@@ -0,0 +1,87 @@
+import threading
+import time
+from typing import Optional
+
+# NCBI E-utilities request limits (requests per second)
+NCBI_RATE_LIMIT = 3.0
+NCBI_RATE_LIMIT_WITH_API_KEY = 10.0
+
+
+def ncbi_rate_limit(api_key: Optional[str] = None) -> float:
+    """
+    Return the number of requests per second NCBI allows for a client.
+
+    Args:
+        api_key: NCBI API key, if one is used
+
+    Returns:
+        Allowed requests per second
+    """
+    return NCBI_RATE_LIMIT_WITH_API_KEY if api_key else NCBI_RATE_LIMIT
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how many requests are issued per second.
+
+    The bucket holds at most `burst` tokens and refills at `rate` tokens per second.
+    Each request consumes one token; callers block until a token is available.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Sustained number of requests allowed per second
+            burst: Maximum number of tokens the bucket can hold (defaults to 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.capacity = burst if burst is not None else 1.0
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Take one token and return how long the caller must wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+
+            # Tokens may go negative: each waiter reserves its own future slot
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be issued.
+
+        Returns:
+            Number of seconds spent waiting
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """
+        Wait without blocking the event loop until a request may be issued.
+
+        Returns:
+            Number of seconds spent waiting
+        """
+        import asyncio
+
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
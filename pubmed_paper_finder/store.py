@@ -0,0 +1,200 @@
+"""
+Local indexed store of classified papers for offline queries.
+
+Papers fetched and classified by earlier runs are kept in SQLite: an FTS5 index
+covers titles, affiliations and company names, and B-tree indexes cover the
+publication date and company, so repeat analyses run without network access.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from typing import Any, Iterable, List, Optional
+
+from .models import Paper
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    id INTEGER PRIMARY KEY,
+    pmid TEXT NOT NULL UNIQUE,
+    publication_date TEXT NOT NULL,
+    has_company INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_papers_date ON papers (has_company, publication_date);
+CREATE TABLE IF NOT EXISTS authors (
+    paper_id INTEGER NOT NULL REFERENCES papers (id),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    affiliation TEXT,
+    email TEXT,
+    is_non_academic INTEGER NOT NULL,
+    company TEXT COLLATE NOCASE,
+    PRIMARY KEY (paper_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_authors_company ON authors (company);
+CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+    title, affiliations, companies, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+class PaperStore:
+    """
+    SQLite store of classified papers with full-text search.
+
+    Papers are stored with their author classifications, so queries return them
+    as they were classified when stored. Storing a paper again replaces it.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (or create) the store database.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def __enter__(self) -> "PaperStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._conn.close()
+
+    def put_many(self, papers: Iterable[Paper]) -> int:
+        """
+        Store classified papers, replacing earlier copies.
+
+        Args:
+            papers: Paper objects, with authors already classified
+
+        Returns:
+            Number of papers stored
+        """
+        count = 0
+        with self._lock:
+            for paper in papers:
+                self._put(paper)
+                count += 1
+            self._conn.commit()
+        return count
+
+    def _put(self, paper: Paper) -> None:
+        """
+        Insert or replace one paper, its authors and its full-text entry.
+        """
+        data = json.dumps(paper.to_dict())
+        publication_date = paper.publication_date.isoformat()
+        has_company = int(bool(paper.non_academic_authors))
+
+        row = self._conn.execute("SELECT id FROM papers WHERE pmid = ?", (paper.pubmed_id,)).fetchone()
+        if row is None:
+            paper_id = self._conn.execute(
+                "INSERT INTO papers (pmid, publication_date, has_company, data) VALUES (?, ?, ?, ?)",
+                (paper.pubmed_id, publication_date, has_company, data)
+            ).lastrowid
+        else:
+            paper_id = row[0]
+            self._conn.execute(
+                "UPDATE papers SET publication_date = ?, has_company = ?, data = ? WHERE id = ?",
+                (publication_date, has_company, data, paper_id)
+            )
+            self._conn.execute("DELETE FROM authors WHERE paper_id = ?", (paper_id,))
+            self._conn.execute("DELETE FROM papers_fts WHERE rowid = ?", (paper_id,))
+
+        self._conn.executemany(
+            "INSERT INTO authors (paper_id, position, name, affiliation, email, is_non_academic, company) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (paper_id, position, author.name, author.affiliation, author.email,
+                 int(author.is_non_academic), author.company_affiliation)
+                for position, author in enumerate(paper.authors)
+            ]
+        )
+        self._conn.execute(
+            "INSERT INTO papers_fts (rowid, title, affiliations, companies) VALUES (?, ?, ?, ?)",
+            (
+                paper_id,
+                paper.title,
+                "\n".join(author.affiliation for author in paper.authors if author.affiliation),
+                "\n".join(paper.company_affiliations)
+            )
+        )
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        company: Optional[str] = None,
+        mindate: Optional[str] = None,
+        maxdate: Optional[str] = None,
+        max_results: Optional[int] = 100,
+        company_only: bool = True
+    ) -> List[Paper]:
+        """
+        Find stored papers, newest first.
+
+        Args:
+            query: FTS5 query over titles, affiliations and company names, e.g.
+                'cancer AND "gene therapy"', None to match every paper
+            company: Only papers with an author of this company (case-insensitive)
+            mindate: Only papers published on or after this date (YYYY-MM-DD or YYYY/MM/DD)
+            maxdate: Only papers published on or before this date
+            max_results: Maximum number of papers returned, None for no limit
+            company_only: Only papers with at least one non-academic author
+
+        Returns:
+            Matching Paper objects with their stored classifications
+        """
+        sql = ["SELECT p.data FROM papers p"]
+        conditions: List[str] = []
+        params: List[Any] = []
+
+        if query:
+            sql.append("JOIN papers_fts f ON f.rowid = p.id")
+            conditions.append("papers_fts MATCH ?")
+            params.append(query)
+        if company_only:
+            conditions.append("p.has_company = 1")
+        if company:
+            conditions.append("p.id IN (SELECT paper_id FROM authors WHERE company = ?)")
+            params.append(company)
+        if mindate:
+            conditions.append("p.publication_date >= ?")
+            params.append(mindate.replace("/", "-"))
+        if maxdate:
+            conditions.append("p.publication_date <= ?")
+            params.append(maxdate.replace("/", "-"))
+
+        if conditions:
+            sql.append("WHERE " + " AND ".join(conditions))
+        sql.append("ORDER BY p.publication_date DESC, p.pmid")
+        if max_results is not None:
+            sql.append("LIMIT ?")
+            params.append(max_results)
+
+        try:
+            with self._lock:
+                rows = self._conn.execute(" ".join(sql), params).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid offline query {query!r}: {e}") from e
+
+        logger.debug(f"Paper store: {len(rows)} papers match {query!r}")
+        return [Paper.from_dict(json.loads(data)) for (data,) in rows]
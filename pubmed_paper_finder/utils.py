@@ -1,13 +1,31 @@
 import csv
+import io
+import json
 import logging
+import os
 import sys
-from typing import List, Optional, TextIO
-import pandas as pd
+from typing import Any, Dict, Iterable, List, Optional, TextIO
 
 from .models import Paper
 
 logger = logging.getLogger(__name__)
 
+# Supported export_to_csv engines
+CSV_ENGINES = ("csv", "pandas")
+
+# Supported output formats
+OUTPUT_FORMATS = ("csv", "jsonl", "parquet")
+
+# Column order of the CSV output
+CSV_COLUMNS: List[str] = [
+    "PubmedID",
+    "Title",
+    "Publication Date",
+    "Non-academic Author(s)",
+    "Company Affiliation(s)",
+    "Corresponding Author Email"
+]
+
 def setup_logging(debug: bool = False) -> None:
     """
     Set up logging configuration.
@@ -22,38 +40,78 @@ def setup_logging(debug: bool = False) -> None:
         stream=sys.stderr
     )
 
-def export_to_csv(papers: List[Paper], file_path: Optional[str] = None) -> Optional[str]:
+def read_queries(path: str) -> List[str]:
+    """
+    Read PubMed queries from a text file, one per line.
+    
+    Blank lines and lines starting with '#' are skipped.
+    
+    Args:
+        path: Path of the queries file
+        
+    Returns:
+        List of queries in file order
+    """
+    with open(path, encoding="utf-8") as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith("#")]
+
+def export_to_csv(
+    papers: List[Paper],
+    file_path: Optional[str] = None,
+    engine: str = "csv"
+) -> Optional[str]:
     """
     Export papers to CSV format.
     
+    The default engine streams rows with the standard csv module; the "pandas"
+    engine builds a DataFrame first and produces byte-identical output.
+    
     Args:
         papers: List of Paper objects to export
         file_path: Path to save the CSV file, if None print to stdout
+        engine: CSV writer to use, "csv" or "pandas"
         
     Returns:
         CSV content as string if file_path is None, else None
     """
-    # Create a list of dictionaries for DataFrame
-    data = []
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unsupported CSV engine: {engine}")
     
-    for paper in papers:
-        # Only include papers with at least one non-academic author
-        if not paper.non_academic_authors:
-            continue
-            
-        non_academic_authors = [author.name for author in paper.non_academic_authors]
-        company_affiliations = paper.company_affiliations
-        
-        row = {
-            "PubmedID": paper.pubmed_id,
-            "Title": paper.title,
-            "Publication Date": paper.publication_date,
-            "Non-academic Author(s)": "; ".join(non_academic_authors),
-            "Company Affiliation(s)": "; ".join(company_affiliations),
-            "Corresponding Author Email": paper.corresponding_author_email or ""
-        }
-        
-        data.append(row)
+    if engine == "pandas":
+        return _export_to_csv_pandas(papers, file_path)
+    
+    if file_path:
+        with open(file_path, "w", newline="", encoding="utf-8") as output:
+            _write_csv(papers, output)
+        logger.info(f"Results saved to {file_path}")
+        return None
+    else:
+        output = io.StringIO(newline="")
+        _write_csv(papers, output)
+        return output.getvalue()
+
+def _write_csv(papers: Iterable[Paper], output: TextIO) -> None:
+    """
+    Write papers with at least one non-academic author to a text stream.
+    """
+    papers = [paper for paper in papers if paper.non_academic_authors]
+    if not papers:
+        # pandas writes an empty frame as a single blank line without a header
+        output.write(os.linesep)
+        return
+    
+    CsvPaperWriter(output).write(papers)
+
+def _export_to_csv_pandas(papers: List[Paper], file_path: Optional[str] = None) -> Optional[str]:
+    """
+    Export papers to CSV format through a pandas DataFrame.
+    """
+    import pandas as pd
+    
+    # Create a list of dictionaries for DataFrame, only including papers
+    # with at least one non-academic author
+    data = [paper_to_row(paper) for paper in papers if paper.non_academic_authors]
     
     # Create DataFrame
     df = pd.DataFrame(data)
@@ -64,4 +122,280 @@ def export_to_csv(papers: List[Paper], file_path: Optional[str] = None) -> Optio
         logger.info(f"Results saved to {file_path}")
         return None
     else:
-        return df.to_csv(index=False)
\ No newline at end of file
+        return df.to_csv(index=False)
+
+def paper_to_row(paper: Paper) -> Dict[str, Any]:
+    """
+    Convert a paper to a CSV output row.
+    
+    Args:
+        paper: Paper object to convert
+        
+    Returns:
+        Dictionary keyed by CSV_COLUMNS
+    """
+    non_academic_authors = [author.name for author in paper.non_academic_authors]
+    company_affiliations = paper.company_affiliations
+    
+    return {
+        "PubmedID": paper.pubmed_id,
+        "Title": paper.title,
+        "Publication Date": paper.publication_date,
+        "Non-academic Author(s)": "; ".join(non_academic_authors),
+        "Company Affiliation(s)": "; ".join(company_affiliations),
+        "Corresponding Author Email": paper.corresponding_author_email or ""
+    }
+
+class CsvPaperWriter:
+    """
+    Incrementally write papers as CSV rows to an open text stream.
+    
+    The output has the same format as export_to_csv, but rows are written as
+    papers arrive instead of after the whole result set has been collected.
+    """
+    
+    def __init__(self, stream: TextIO):
+        """
+        Initialize the writer and write the header row.
+        
+        Args:
+            stream: Text stream to write to, opened with newline=""
+        """
+        self._stream = stream
+        self._writer = csv.DictWriter(stream, fieldnames=CSV_COLUMNS, lineterminator=os.linesep)
+        self._writer.writeheader()
+        self.rows_written = 0
+    
+    def write(self, papers: Iterable[Paper]) -> int:
+        """
+        Write papers with at least one non-academic author.
+        
+        Args:
+            papers: Paper objects to write
+            
+        Returns:
+            Number of rows written
+        """
+        count = 0
+        for paper in papers:
+            if not paper.non_academic_authors:
+                continue
+            self._writer.writerow(paper_to_row(paper))
+            count += 1
+        
+        self.rows_written += count
+        return count
+    
+    def close(self) -> None:
+        """
+        Flush the written rows; the stream itself is left open.
+        """
+        self._stream.flush()
+
+def paper_to_record(paper: Paper) -> Dict[str, Any]:
+    """
+    Convert a paper to a structured output record.
+    
+    Unlike paper_to_row, author names and company affiliations stay lists, so
+    JSONL and Parquet consumers don't have to split them again.
+    
+    Args:
+        paper: Paper object to convert
+        
+    Returns:
+        Dictionary of the output fields, with list-valued author and company columns
+    """
+    return {
+        "pubmed_id": paper.pubmed_id,
+        "title": paper.title,
+        "publication_date": paper.publication_date,
+        "non_academic_authors": [author.name for author in paper.non_academic_authors],
+        "company_affiliations": paper.company_affiliations,
+        "corresponding_author_email": paper.corresponding_author_email
+    }
+
+class JsonlPaperWriter:
+    """
+    Incrementally write papers as newline-delimited JSON records to a text stream.
+    """
+    
+    def __init__(self, stream: TextIO):
+        """
+        Initialize the writer.
+        
+        Args:
+            stream: Text stream to write to
+        """
+        self._stream = stream
+        self.rows_written = 0
+    
+    def write(self, papers: Iterable[Paper]) -> int:
+        """
+        Write papers with at least one non-academic author.
+        
+        Args:
+            papers: Paper objects to write
+            
+        Returns:
+            Number of records written
+        """
+        count = 0
+        for paper in papers:
+            if not paper.non_academic_authors:
+                continue
+            record = paper_to_record(paper)
+            if record["publication_date"] is not None:
+                record["publication_date"] = record["publication_date"].isoformat()
+            self._stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+        
+        self.rows_written += count
+        return count
+    
+    def close(self) -> None:
+        """
+        Flush the written records; the stream itself is left open.
+        """
+        self._stream.flush()
+
+class ParquetPaperWriter:
+    """
+    Incrementally write papers to a compressed Parquet file.
+    
+    Author names and company affiliations are list<string> columns. Rows are
+    buffered and written as a row group whenever `row_group_size` rows have
+    accumulated, so memory use stays bounded while batches stream in.
+    
+    Requires the optional `pyarrow` dependency (`pip install pubmed-paper-finder[parquet]`).
+    """
+    
+    def __init__(self, sink: Any, row_group_size: int = 10_000, compression: str = "zstd"):
+        """
+        Initialize the writer and the Parquet file schema.
+        
+        Args:
+            sink: Path or binary stream to write to
+            row_group_size: Number of rows per row group
+            compression: Parquet compression codec
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        self._pa = pa
+        self.schema = pa.schema([
+            ("pubmed_id", pa.string()),
+            ("title", pa.string()),
+            ("publication_date", pa.date32()),
+            ("non_academic_authors", pa.list_(pa.string())),
+            ("company_affiliations", pa.list_(pa.string())),
+            ("corresponding_author_email", pa.string())
+        ])
+        self.row_group_size = row_group_size
+        self._writer = pq.ParquetWriter(sink, self.schema, compression=compression)
+        self._buffer: List[Dict[str, Any]] = []
+        self.rows_written = 0
+    
+    def __enter__(self) -> "ParquetPaperWriter":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def write(self, papers: Iterable[Paper]) -> int:
+        """
+        Write papers with at least one non-academic author.
+        
+        Args:
+            papers: Paper objects to write
+            
+        Returns:
+            Number of rows written
+        """
+        count = 0
+        for paper in papers:
+            if not paper.non_academic_authors:
+                continue
+            self._buffer.append(paper_to_record(paper))
+            count += 1
+        
+        if len(self._buffer) >= self.row_group_size:
+            self._flush()
+        
+        self.rows_written += count
+        return count
+    
+    def _flush(self) -> None:
+        """
+        Write the buffered rows as one row group.
+        """
+        if self._buffer:
+            table = self._pa.Table.from_pylist(self._buffer, schema=self.schema)
+            self._writer.write_table(table)
+            self._buffer = []
+    
+    def close(self) -> None:
+        """
+        Write any buffered rows and finalize the file.
+        """
+        self._flush()
+        self._writer.close()
+
+def open_paper_writer(output_format: str, sink: Any) -> Any:
+    """
+    Create an incremental writer for an output format.
+    
+    Args:
+        output_format: One of OUTPUT_FORMATS
+        sink: Text stream for "csv" and "jsonl", path or binary stream for "parquet"
+        
+    Returns:
+        Writer with write(papers), close() and rows_written
+    """
+    if output_format == "csv":
+        return CsvPaperWriter(sink)
+    if output_format == "jsonl":
+        return JsonlPaperWriter(sink)
+    if output_format == "parquet":
+        return ParquetPaperWriter(sink)
+    raise ValueError(f"Unsupported output format: {output_format}")
+
+def export_papers(
+    papers: List[Paper],
+    file_path: Optional[str] = None,
+    output_format: str = "csv"
+) -> Optional[str]:
+    """
+    Export papers in the given output format.
+    
+    Args:
+        papers: List of Paper objects to export
+        file_path: Path to save the output, if None return it as a string
+            (not supported for Parquet)
+        output_format: One of OUTPUT_FORMATS
+        
+    Returns:
+        Output content as string if file_path is None, else None
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    
+    if output_format == "csv":
+        return export_to_csv(papers, file_path)
+    
+    if output_format == "parquet":
+        if not file_path:
+            raise ValueError("Parquet output requires a file path")
+        with ParquetPaperWriter(file_path) as writer:
+            writer.write(papers)
+        logger.info(f"Results saved to {file_path}")
+        return None
+    
+    if file_path:
+        with open(file_path, "w", encoding="utf-8") as output:
+            open_paper_writer(output_format, output).write(papers)
+        logger.info(f"Results saved to {file_path}")
+        return None
+    
+    output = io.StringIO()
+    open_paper_writer(output_format, output).write(papers)
+    return output.getvalue()
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import MagicMock
+
+try:
+    import aiohttp
+    from pubmed_paper_finder.aio import AsyncPubMedAPI
+except ImportError:  # aiohttp is an optional dependency
+    AsyncPubMedAPI = None
+
+
+class FakeResponse:
+    
+    def __init__(self, text, status=200):
+        self._text = text
+        self.status = status
+        self.headers = {}
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(MagicMock(), (), status=self.status)
+    
+    async def text(self):
+        return self._text
+
+
+class FakeSession:
+    """Minimal stand-in for aiohttp.ClientSession serving canned E-utilities responses."""
+    
+    def __init__(self, failures=0):
+        self.calls = []
+        self.failures = failures
+    
+    def get(self, url, params, timeout=None):
+        self.calls.append((url, params))
+        self.timeout = timeout
+        if len(self.calls) <= self.failures:
+            return FakeResponse("", status=503)
+        if url.endswith("esearch.fcgi"):
+            return FakeResponse(json.dumps({"esearchresult": {"idlist": ["1", "2"]}}))
+        articles = "".join(
+            f"<PubmedArticle><PMID>{pmid}</PMID><ArticleTitle>Paper {pmid}</ArticleTitle>"
+            f"<PubDate><Year>2023</Year></PubDate></PubmedArticle>"
+            for pmid in params["id"].split(",")
+        )
+        return FakeResponse(f"<PubmedArticleSet>{articles}</PubmedArticleSet>")
+
+
+@unittest.skipIf(AsyncPubMedAPI is None, "aiohttp is not installed")
+class TestAsyncPubMedAPI(unittest.TestCase):
+    
+    def setUp(self):
+        self.session = FakeSession()
+        self.api = AsyncPubMedAPI(
+            email="test@example.com",
+            session=self.session,
+            rate_limiter=MagicMock(acquire_async=MagicMock(side_effect=self._no_wait))
+        )
+    
+    @staticmethod
+    async def _no_wait():
+        return 0.0
+    
+    def test_search(self):
+        """Test the async search method."""
+        result = asyncio.run(self.api.search("test query"))
+        
+        self.assertEqual(result, ["1", "2"])
+        url, params = self.session.calls[0]
+        self.assertEqual(url, AsyncPubMedAPI.SEARCH_URL)
+        self.assertEqual(params["term"], "test query")
+        self.assertEqual(params["email"], "test@example.com")
+    
+    def test_fetch_papers_preserves_order(self):
+        """Test that concurrently fetched batches come back in PMID order."""
+        pmids = [str(i) for i in range(1, 121)]
+        
+        result = asyncio.run(self.api.fetch_papers(pmids))
+        
+        self.assertEqual([paper.pubmed_id for paper in result], pmids)
+        self.assertEqual(len(self.session.calls), 3)
+    
+    def test_iter_papers_streams_all_papers(self):
+        """Test that iter_papers yields every fetched paper."""
+        pmids = [str(i) for i in range(1, 121)]
+        
+        async def collect():
+            return [paper.pubmed_id async for paper in self.api.iter_papers(pmids)]
+        
+        result = asyncio.run(collect())
+        
+        self.assertEqual(sorted(result, key=int), pmids)
+    
+    def test_base_url_and_timeout(self):
+        """Test that requests go to the configured base URL with the request timeout."""
+        api = AsyncPubMedAPI(
+            session=self.session,
+            rate_limiter=self.api.rate_limiter,
+            timeout=5.0,
+            base_url="http://localhost:8080/eutils/"
+        )
+        
+        asyncio.run(api.search("test query"))
+        
+        self.assertEqual(self.session.calls[0][0], "http://localhost:8080/eutils/esearch.fcgi")
+        self.assertEqual(self.session.timeout.total, 5.0)
+    
+    def test_iter_papers_bounds_scheduled_batches(self):
+        """Test that iter_papers schedules new batches only as earlier ones are consumed."""
+        api = AsyncPubMedAPI(session=self.session, rate_limiter=self.api.rate_limiter, max_concurrency=1)
+        pmids = [str(i) for i in range(1, 501)]
+        
+        async def first_paper():
+            papers = api.iter_papers(pmids)
+            await papers.__anext__()
+            await asyncio.sleep(0.01)
+            requested = len(self.session.calls)
+            await papers.aclose()
+            return requested
+        
+        self.assertLessEqual(asyncio.run(first_paper()), 3)
+    
+    def test_transient_errors_are_retried(self):
+        """Test that 5xx responses are retried, each attempt going through the rate limiter."""
+        session = FakeSession(failures=2)
+        api = AsyncPubMedAPI(session=session, rate_limiter=self.api.rate_limiter, backoff_factor=0)
+        
+        self.assertEqual(asyncio.run(api.search("test query")), ["1", "2"])
+        self.assertEqual(len(session.calls), 3)
+        self.assertEqual(api.rate_limiter.acquire_async.call_count, 3)
+        
+        session = FakeSession(failures=10)
+        api = AsyncPubMedAPI(session=session, rate_limiter=self.api.rate_limiter, max_retries=1, backoff_factor=0)
+        with self.assertRaises(aiohttp.ClientResponseError):
+            asyncio.run(api.search("test query"))
+        self.assertEqual(len(session.calls), 2)
@@ -1,10 +1,13 @@
 import unittest
 from unittest.mock import patch, MagicMock
+
+import requests
 from datetime import date
 import xml.etree.ElementTree as ET
 from io import StringIO
 
-from pubmed_paper_finder.api import PubMedAPI
+from pubmed_paper_finder.api import PubMedAPI, _is_overload_error
+from pubmed_paper_finder.batching import AdaptiveBatchSizer
 from pubmed_paper_finder.models import Paper, Author
 
 class TestPubMedAPI(unittest.TestCase):
@@ -12,7 +15,7 @@ class TestPubMedAPI(unittest.TestCase):
     def setUp(self):
         self.api = PubMedAPI(email="test@example.com", tool="test-tool")
     
-    @patch('pubmed_paper_finder.api.requests.get')
+    @patch('pubmed_paper_finder.api.requests.Session.get')
     def test_search(self, mock_get):
         """Test the search method of PubMedAPI."""
         # Mock response
@@ -38,8 +41,28 @@ class TestPubMedAPI(unittest.TestCase):
         self.assertEqual(call_args, self.api.SEARCH_URL)
         self.assertEqual(call_kwargs['params']['term'], "test query")
         self.assertEqual(call_kwargs['params']['email'], "test@example.com")
+    
+    def test_base_url(self):
+        """Test that a custom base URL redirects all E-utilities endpoints."""
+        api = PubMedAPI(base_url="http://127.0.0.1:8765/entrez/eutils/")
+        
+        self.assertEqual(api.SEARCH_URL, "http://127.0.0.1:8765/entrez/eutils/esearch.fcgi")
+        self.assertEqual(api.FETCH_URL, "http://127.0.0.1:8765/entrez/eutils/efetch.fcgi")
+        self.assertEqual(PubMedAPI.SEARCH_URL, f"{PubMedAPI.BASE_URL}/esearch.fcgi")
+    
+    @patch('pubmed_paper_finder.api.requests.Session.get')
+    def test_search_date_range(self, mock_get):
+        """Test that a mindate restricts esearch to a complete date range."""
+        mock_get.return_value.json.return_value = {"esearchresult": {"idlist": []}}
         
-    @patch('pubmed_paper_finder.api.requests.get')
+        self.api.search("test query", mindate="2024/01/02", datetype="mdat")
+        
+        params = mock_get.call_args[1]['params']
+        self.assertEqual(params['mindate'], "2024/01/02")
+        self.assertEqual(params['maxdate'], "3000/12/31")
+        self.assertEqual(params['datetype'], "mdat")
+        
+    @patch('pubmed_paper_finder.api.requests.Session.get')
     def test_fetch_papers(self, mock_get):
         """Test the fetch_papers method of PubMedAPI."""
         # Sample XML response
@@ -109,4 +132,159 @@ class TestPubMedAPI(unittest.TestCase):
         call_args = mock_get.call_args[0][0]
         call_kwargs = mock_get.call_args[1]
         self.assertEqual(call_args, self.api.FETCH_URL)
-        self.assertEqual(call_kwargs['params']['id'], "12345")
\ No newline at end of file
+        self.assertEqual(call_kwargs['params']['id'], "12345")
+    
+    @patch('pubmed_paper_finder.api.requests.Session.get')
+    def test_fetch_papers_concurrent_preserves_order(self, mock_get):
+        """Test that concurrent batch fetching returns papers in PMID order."""
+        def respond(url, params, timeout):
+            articles = "".join(
+                f"<PubmedArticle><PMID>{pmid}</PMID><ArticleTitle>Paper {pmid}</ArticleTitle>"
+                f"<PubDate><Year>2023</Year></PubDate></PubmedArticle>"
+                for pmid in params['id'].split(",")
+            )
+            response = MagicMock()
+            response.text = f"<PubmedArticleSet>{articles}</PubmedArticleSet>"
+            return response
+        
+        mock_get.side_effect = respond
+        api = PubMedAPI(
+            max_workers=4, rate_limiter=MagicMock(), batch_sizer=AdaptiveBatchSizer(minimum=50, maximum=50)
+        )
+        pmids = [str(i) for i in range(1, 161)]
+        
+        result = api.fetch_papers(pmids)
+        
+        self.assertEqual([paper.pubmed_id for paper in result], pmids)
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(api.rate_limiter.acquire.call_count, 4)
+    
+    @patch('pubmed_paper_finder.api.requests.Session.post')
+    @patch('pubmed_paper_finder.api.requests.Session.get')
+    def test_fetch_papers_adaptive_batches(self, mock_get, mock_post):
+        """Test that batches grow after healthy responses and large ones are POSTed."""
+        def respond(url, timeout, params=None, data=None):
+            ids = (params or data)['id'].split(",")
+            response = MagicMock()
+            response.text = "<PubmedArticleSet>" + "".join(
+                f"<PubmedArticle><PMID>{pmid}</PMID><ArticleTitle>Paper {pmid}</ArticleTitle>"
+                f"<PubDate><Year>2023</Year></PubDate></PubmedArticle>"
+                for pmid in ids
+            ) + "</PubmedArticleSet>"
+            return response
+        
+        mock_get.side_effect = respond
+        mock_post.side_effect = respond
+        api = PubMedAPI(rate_limiter=MagicMock())
+        pmids = [str(i) for i in range(1, 1001)]
+        
+        result = api.fetch_papers(pmids)
+        
+        self.assertEqual([paper.pubmed_id for paper in result], pmids)
+        sizes = [len(call[1]['params']['id'].split(",")) for call in mock_get.call_args_list]
+        sizes += [len(call[1]['data']['id'].split(",")) for call in mock_post.call_args_list]
+        self.assertEqual(sizes, [50, 100, 200, 400, 250])
+        self.assertEqual(mock_post.call_count, 2)
+    
+    @patch('pubmed_paper_finder.api.requests.Session.get')
+    def test_fetch_papers_splits_failed_batch(self, mock_get):
+        """Test that a batch failing with a server error is retried in halves and shrinks later batches."""
+        def respond(url, params, timeout):
+            ids = params['id'].split(",")
+            response = MagicMock()
+            if len(ids) > 25:
+                error_response = MagicMock(status_code=503)
+                response.raise_for_status.side_effect = requests.HTTPError(response=error_response)
+            response.text = "<PubmedArticleSet>" + "".join(
+                f"<PubmedArticle><PMID>{pmid}</PMID><ArticleTitle>Paper {pmid}</ArticleTitle>"
+                f"<PubDate><Year>2023</Year></PubDate></PubmedArticle>"
+                for pmid in ids
+            ) + "</PubmedArticleSet>"
+            return response
+        
+        mock_get.side_effect = respond
+        api = PubMedAPI(rate_limiter=MagicMock())
+        pmids = [str(i) for i in range(1, 76)]
+        
+        result = api.fetch_papers(pmids)
+        
+        self.assertEqual([paper.pubmed_id for paper in result], pmids)
+        sizes = [len(call[1]['params']['id'].split(",")) for call in mock_get.call_args_list]
+        self.assertEqual(sizes, [50, 25, 25, 25])
+        self.assertEqual(api.metrics.counters["efetch_batch_splits"], 1)
+    
+    def test_overload_errors(self):
+        """Test that only timeouts and server errors count as an oversized batch."""
+        self.assertTrue(_is_overload_error(requests.ReadTimeout()))
+        self.assertTrue(_is_overload_error(requests.HTTPError(response=MagicMock(status_code=503))))
+        self.assertFalse(_is_overload_error(requests.HTTPError(response=MagicMock(status_code=429))))
+        self.assertFalse(_is_overload_error(requests.exceptions.RetryError("too many 429 error responses")))
+        self.assertFalse(_is_overload_error(requests.ConnectionError()))
+    
+    def test_session_pooling_and_retries(self):
+        """Test that the pooled session only retries connection attempts itself."""
+        api = PubMedAPI(pool_size=8, max_retries=5)
+        adapter = api.session.get_adapter(api.BASE_URL)
+        
+        self.assertEqual(adapter._pool_maxsize, 8)
+        self.assertEqual(adapter.max_retries.total, 5)
+        self.assertFalse(adapter.max_retries.read)
+        self.assertFalse(adapter.max_retries.status_forcelist)
+        self.assertIn("gzip", api.session.headers["Accept-Encoding"])
+    
+    @patch('pubmed_paper_finder.api.requests.Session.get')
+    def test_retries_go_through_rate_limiter(self, mock_get):
+        """Test that 429/5xx responses are retried, each attempt acquiring the rate limiter."""
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "0"})
+        ok = MagicMock(status_code=200, content=b'{"esearchresult": {"idlist": ["1"]}}')
+        ok.json.return_value = {"esearchresult": {"idlist": ["1"]}}
+        mock_get.side_effect = [throttled, MagicMock(status_code=503, headers={}), ok]
+        api = PubMedAPI(rate_limiter=MagicMock(acquire=MagicMock(return_value=0.0)), backoff_factor=0)
+        
+        self.assertEqual(api.search("test query"), ["1"])
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(api.rate_limiter.acquire.call_count, 3)
+        self.assertEqual(api.metrics.counters["retries"], 2)
+    
+    @patch('pubmed_paper_finder.api.requests.Session.get')
+    def test_efetch_does_not_retry_overload(self, mock_get):
+        """Test that efetch leaves timeouts and server errors to the split-and-retry."""
+        mock_get.side_effect = requests.ReadTimeout()
+        api = PubMedAPI(rate_limiter=MagicMock(), batch_sizer=AdaptiveBatchSizer(minimum=10, maximum=10))
+        
+        with self.assertRaises(requests.ReadTimeout):
+            api.fetch_papers([str(i) for i in range(10)])
+        self.assertEqual(mock_get.call_count, 1)
+    
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the session."""
+        session = MagicMock()
+        with PubMedAPI(session=session) as api:
+            self.assertIs(api.session, session)
+        session.close.assert_called_once()
+    
+    @patch('pubmed_paper_finder.api.requests.Session.get')
+    def test_history_paging(self, mock_get):
+        """Test that history server results are fetched lazily by retstart/retmax."""
+        search_response = MagicMock()
+        search_response.json.return_value = {
+            "esearchresult": {"count": "250", "webenv": "WEBENV_1", "querykey": "1"}
+        }
+        page_response = MagicMock()
+        page_response.text = "<PubmedArticleSet></PubmedArticleSet>"
+        mock_get.side_effect = [search_response, page_response, page_response, page_response]
+        api = PubMedAPI(rate_limiter=MagicMock())
+        
+        history = api.search_history("broad query")
+        self.assertEqual(history.count, 250)
+        self.assertEqual(mock_get.call_args[1]['params']['usehistory'], "y")
+        
+        pages = api.iter_history_pages(history, page_size=100)
+        self.assertEqual(mock_get.call_count, 1)  # nothing fetched until iterated
+        self.assertEqual(len(list(pages)), 3)
+        
+        page_params = [call[1]['params'] for call in mock_get.call_args_list[1:]]
+        self.assertEqual([p['retstart'] for p in page_params], [0, 100, 200])
+        self.assertEqual([p['retmax'] for p in page_params], [100, 100, 50])
+        self.assertTrue(all(p['WebEnv'] == "WEBENV_1" and p['query_key'] == "1" for p in page_params))
+        self.assertNotIn('id', page_params[0])
@@ -0,0 +1,67 @@
+import unittest
+
+from pubmed_paper_finder.batching import AdaptiveBatchSizer
+
+class TestAdaptiveBatchSizer(unittest.TestCase):
+    
+    def test_grows_after_healthy_batches(self):
+        """Test that full-size healthy batches double the size, up to the maximum."""
+        sizer = AdaptiveBatchSizer(initial=50, maximum=150)
+        
+        sizer.record_success(50, latency=0.5, response_bytes=1000)
+        self.assertEqual(sizer.size, 100)
+        sizer.record_success(50, latency=0.5, response_bytes=1000)  # concurrent batch of the old size
+        self.assertEqual(sizer.size, 100)
+        sizer.record_success(100, latency=0.5, response_bytes=1000)
+        self.assertEqual(sizer.size, 150)
+    
+    def test_shrinks_after_slow_or_failed_batches(self):
+        """Test that slow, large or failed batches shrink the size, down to the minimum."""
+        sizer = AdaptiveBatchSizer(initial=200, minimum=10, target_latency=2.0, max_response_bytes=1000)
+        
+        sizer.record_success(200, latency=4.0, response_bytes=100)
+        self.assertEqual(sizer.size, 100)
+        sizer.record_success(100, latency=1.0, response_bytes=4000)
+        self.assertEqual(sizer.size, 25)
+        sizer.record_failure(25)
+        self.assertEqual(sizer.size, 12)
+        sizer.record_failure(12)
+        self.assertEqual(sizer.size, 10)
+    
+    def test_grows_additively_below_failed_size(self):
+        """Test that after a failure the size grows additively and never back to the failed size."""
+        sizer = AdaptiveBatchSizer(initial=500, minimum=10, maximum=500)
+        
+        sizer.record_failure(500)
+        self.assertEqual(sizer.size, 250)
+        sizer.record_success(250, latency=0.5, response_bytes=1000)
+        self.assertEqual(sizer.size, 260)
+        for _ in range(30):
+            sizer.record_success(sizer.size, latency=0.5, response_bytes=1000)
+        self.assertEqual(sizer.size, 499)
+    
+    def test_iter_batches_uses_current_size(self):
+        """Test that batches are cut with the size current when each is taken."""
+        sizer = AdaptiveBatchSizer(initial=10, minimum=10)
+        pmids = [str(i) for i in range(45)]
+        batches = sizer.iter_batches(pmids)
+        
+        first = next(batches)
+        sizer.record_success(len(first), latency=0.1, response_bytes=100)
+        rest = list(batches)
+        
+        self.assertEqual([len(batch) for batch in [first, *rest]], [10, 20, 15])
+        self.assertEqual([pmid for batch in [first, *rest] for pmid in batch], pmids)
+    
+    def test_fixed_size(self):
+        """Test that minimum == maximum keeps the size fixed."""
+        sizer = AdaptiveBatchSizer(minimum=50, maximum=50)
+        sizer.record_success(50, latency=0.1, response_bytes=100)
+        sizer.record_failure(50)
+        self.assertEqual(sizer.size, 50)
+        
+        with self.assertRaises(ValueError):
+            AdaptiveBatchSizer(minimum=0)
+
+if __name__ == '__main__':
+    unittest.main()
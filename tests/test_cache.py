@@ -0,0 +1,200 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+from pubmed_paper_finder.api import PubMedAPI
+from pubmed_paper_finder.cache import ArticleCache, SearchCache
+from pubmed_paper_finder.models import Paper, Author
+
+def make_paper(pmid):
+    return Paper(
+        pubmed_id=pmid,
+        title=f"Paper {pmid}",
+        publication_date=date(2023, 5, 15),
+        authors=[Author(name="John Smith", affiliation="Pfizer Inc., New York, NY, USA")],
+        last_revised=date(2024, 1, 2)
+    )
+
+class TestArticleCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "articles.db")
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_round_trip(self):
+        """Test that cached papers come back unchanged, and persist across instances."""
+        with ArticleCache(self.path) as cache:
+            cache.put_many([make_paper("1")])
+        
+        with ArticleCache(self.path) as cache:
+            found = cache.get_many(["1", "2"])
+            self.assertEqual(found, {"1": make_paper("1")})
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+    
+    @patch('pubmed_paper_finder.cache.time.time')
+    def test_ttl_expiry(self, mock_time):
+        """Test that entries older than the TTL are treated as misses."""
+        mock_time.return_value = 1000.0
+        with ArticleCache(self.path, ttl=60) as cache:
+            cache.put_many([make_paper("1")])
+            
+            mock_time.return_value = 1030.0
+            self.assertIn("1", cache.get_many(["1"]))
+            
+            mock_time.return_value = 1100.0
+            self.assertEqual(cache.get_many(["1"]), {})
+            self.assertEqual(cache.purge_expired(), 1)
+    
+    @patch('pubmed_paper_finder.cache.time.time')
+    def test_lru_eviction(self, mock_time):
+        """Test that the least recently used articles are evicted first."""
+        entry_size = len(json.dumps(make_paper("1").to_dict()))
+        with ArticleCache(self.path, max_size_bytes=entry_size * 2) as cache:
+            mock_time.return_value = 1.0
+            cache.put_many([make_paper("1")])
+            mock_time.return_value = 2.0
+            cache.put_many([make_paper("2")])
+            mock_time.return_value = 3.0
+            cache.get_many(["1"])  # "2" is now least recently used
+            mock_time.return_value = 4.0
+            cache.put_many([make_paper("3")])
+            
+            self.assertEqual(sorted(cache.get_many(["1", "2", "3"])), ["1", "3"])
+    
+    def test_replacing_does_not_grow_total_size(self):
+        """Test that storing an article again replaces its size instead of adding to it."""
+        entry_size = len(json.dumps(make_paper("1").to_dict()))
+        with ArticleCache(self.path, max_size_bytes=entry_size * 2) as cache:
+            cache.put_many([make_paper("1"), make_paper("2")])
+            for _ in range(5):
+                cache.put_many([make_paper("1")])
+            
+            self.assertEqual(sorted(cache.get_many(["1", "2"])), ["1", "2"])
+        
+        with ArticleCache(self.path, max_size_bytes=entry_size * 2) as cache:
+            cache.put_many([make_paper("3")])
+            self.assertEqual(len(cache.get_many(["1", "2", "3"])), 2)
+    
+    def test_expire_revised(self):
+        """Test that only copies older than the revision window are expired."""
+        with ArticleCache(self.path) as cache:
+            cache.put_many([make_paper("1"), make_paper("2"), make_paper("3")])
+            
+            # Cached copies were last revised on 2024-01-02
+            self.assertEqual(cache.expire_revised(["1", "4"], date(2024, 3, 1)), 1)
+            self.assertEqual(cache.expire_revised(["2"], date(2024, 1, 2)), 0)
+            self.assertEqual(sorted(cache.get_many(["1", "2", "3"])), ["2", "3"])
+    
+    @patch('pubmed_paper_finder.cache.time.time')
+    def test_expire_revised_articles_searches_mdat(self, mock_time):
+        """Test that PubMedAPI searches modifications since the oldest cached fetch."""
+        mock_time.return_value = datetime(2024, 3, 1, 12).timestamp()
+        with ArticleCache(self.path, ttl=None) as cache:
+            cache.put_many([make_paper("1"), make_paper("2")])
+            api = PubMedAPI(cache=cache)
+            api.search = MagicMock(return_value=["2"])
+            
+            self.assertEqual(api.expire_revised_articles("cancer", max_results=50), 1)
+            
+            api.search.assert_called_once_with(
+                "cancer", max_results=50, mindate="2024/03/01", datetype="mdat", use_cache=False
+            )
+            self.assertEqual(sorted(cache.get_many(["1", "2"])), ["1"])
+            self.assertEqual(api.metrics.counters["article_cache_expired"], 1)
+    
+    def test_fetch_papers_only_fetches_missing(self):
+        """Test that PubMedAPI only sends uncached PMIDs to efetch."""
+        with ArticleCache(self.path) as cache:
+            cache.put_many([make_paper("1")])
+            api = PubMedAPI(cache=cache)
+            api._fetch_batch = MagicMock(return_value=[make_paper("2")])
+            
+            result = api.fetch_papers(["2", "1"])
+            
+            api._fetch_batch.assert_called_once_with(["2"])
+            self.assertEqual([p.pubmed_id for p in result], ["2", "1"])
+            self.assertIn("2", cache.get_many(["2"]))
+
+    def test_warm_cache_fetches_full_batches(self):
+        """Test that the missing PMIDs are fetched in full batches, not one small batch per 50 PMIDs."""
+        pmids = [str(i) for i in range(1000)]
+        with ArticleCache(self.path) as cache:
+            cache.put_many([make_paper(pmid) for pmid in pmids if int(pmid) % 10])
+            api = PubMedAPI(cache=cache, rate_limiter=MagicMock())
+            api._fetch_batch = MagicMock(side_effect=lambda batch: [make_paper(pmid) for pmid in batch])
+            
+            result = api.fetch_papers(pmids)
+            
+            self.assertEqual([len(call[0][0]) for call in api._fetch_batch.call_args_list], [50, 50])
+            self.assertEqual([p.pubmed_id for p in result], pmids)
+            self.assertEqual(api.metrics.counters["article_cache_hits"], 900)
+
+class TestSearchCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmpdir.name, "searches")
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_key_normalizes_whitespace(self):
+        """Test that queries differing only in whitespace share a key, but not case or retmax."""
+        key = SearchCache.key({"term": "cancer AND  pfizer", "retmax": 10})
+        
+        self.assertEqual(key, SearchCache.key({"term": " cancer AND\tpfizer ", "retmax": 10}))
+        self.assertNotEqual(key, SearchCache.key({"term": "cancer and pfizer", "retmax": 10}))
+        self.assertNotEqual(key, SearchCache.key({"term": "cancer AND pfizer", "retmax": 20}))
+    
+    def test_shared_across_instances(self):
+        """Test that results written by one instance are read by another."""
+        key = SearchCache.key({"term": "cancer"})
+        SearchCache(self.directory).put(key, ["1", "2"], 42)
+        
+        cache = SearchCache(self.directory)
+        self.assertEqual(cache.get(key), (["1", "2"], 42))
+        self.assertIsNone(cache.get(SearchCache.key({"term": "diabetes"})))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual([name for name in os.listdir(self.directory) if name.endswith(".tmp")], [])
+    
+    @patch('pubmed_paper_finder.cache.time.time')
+    def test_ttl_expiry(self, mock_time):
+        """Test that results older than the TTL are misses, in memory and on disk."""
+        key = SearchCache.key({"term": "cancer"})
+        mock_time.return_value = 1000.0
+        cache = SearchCache(self.directory, ttl=60)
+        cache.put(key, ["1"], 1)
+        
+        mock_time.return_value = 1030.0
+        self.assertEqual(cache.get(key), (["1"], 1))
+        
+        mock_time.return_value = 1100.0
+        self.assertIsNone(cache.get(key))
+        self.assertIsNone(SearchCache(self.directory, ttl=60).get(key))
+    
+    @patch('pubmed_paper_finder.api.requests.Session.get')
+    def test_search_uses_cache(self, mock_get):
+        """Test that PubMedAPI.search reuses cached results unless bypassed."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"esearchresult": {"count": "250", "idlist": ["1", "2"]}}
+        mock_get.return_value = mock_response
+        api = PubMedAPI(search_cache=SearchCache(self.directory))
+        
+        self.assertEqual(api.search("cancer", max_results=2), ["1", "2"])
+        self.assertEqual(api.search("cancer ", max_results=2), ["1", "2"])
+        self.assertEqual(mock_get.call_count, 1)
+        
+        api.search("cancer", max_results=5)
+        api.search("cancer", max_results=2, use_cache=False)
+        self.assertEqual(mock_get.call_count, 3)
+        
+        self.assertEqual(api.metrics.counters["search_cache_hits"], 1)
+        self.assertEqual(api.search_cache.get(SearchCache.key({
+            "url": api.SEARCH_URL, "term": "cancer", "retmax": 2, "retmode": "json"
+        })), (["1", "2"], 250))
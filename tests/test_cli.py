@@ -1,3 +1,5 @@
+import json
+import subprocess
 import unittest
 from unittest.mock import patch, MagicMock
 import sys
@@ -108,4 +110,36 @@ class TestCLI(unittest.TestCase):
         self.assertEqual(args.query, "cancer immunotherapy")
         self.assertTrue(args.debug)
         self.assertEqual(args.file, "output.csv")
-        self.assertEqual(args.max_results, 50)
\ No newline at end of file
+        self.assertEqual(args.max_results, 50)
+    
+    def test_gazetteer_flag_keeps_query(self):
+        """Test that --gazetteer does not take the query as its file."""
+        with patch('sys.argv', ["get-papers-list", "--gazetteer", "cancer"]):
+            args = parse_arguments()
+        
+        self.assertEqual(args.query, "cancer")
+        self.assertTrue(args.gazetteer)
+        self.assertIsNone(args.gazetteer_file)
+    
+    def test_stats_flag_keeps_query(self):
+        """Test that --stats does not take the query as its format."""
+        with patch('sys.argv', ["get-papers-list", "--stats", "--stats-format", "prometheus", "cancer"]):
+            args = parse_arguments()
+        
+        self.assertEqual(args.query, "cancer")
+        self.assertTrue(args.stats)
+        self.assertEqual(args.stats_format, "prometheus")
+    
+    def test_cli_import_is_lazy(self):
+        """Test that importing the CLI does not load the HTTP, XML or dataframe stacks."""
+        heavy = ["requests", "lxml", "bs4", "pandas", "pyarrow", "aiohttp"]
+        snippet = (
+            "import json, sys\n"
+            "import pubmed_paper_finder.cli\n"
+            f"print(json.dumps([name for name in {heavy!r} if name in sys.modules]))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", snippet], check=True, capture_output=True, text=True
+        ).stdout
+        
+        self.assertEqual(json.loads(output), [])
@@ -0,0 +1,66 @@
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+import pandas as pd
+
+from pubmed_paper_finder.columnar import classify_author_table, papers_to_author_table
+from pubmed_paper_finder.filters import classify_affiliation
+from pubmed_paper_finder.models import Author, Paper
+
+AFFILIATIONS = [
+    ("Pfizer Inc., New York, NY, USA", "john.smith@pfizer.com"),
+    ("Department of Biology, Stanford University, CA, USA", "alice@stanford.edu"),
+    ("National Institutes of Health, Bethesda, MD, USA", "bob@nih.gov"),
+    ("Novartis Institutes for BioMedical Research, Research Institute, Basel", None),
+    ("Acme Widgets, Berlin", "info@acme.com"),
+    ("Acme Widgets, Berlin", "info@acme.edu"),
+    ("Incline Village, Nevada", None),
+    ("Oncology Unit; Genentech Biotech Research, South San Francisco", None),
+    ("", "x@pfizer.com"),
+    (None, None),
+]
+
+class TestColumnar(unittest.TestCase):
+    
+    def test_matches_per_author_classification(self):
+        """Test that table classification makes the per-author decisions."""
+        table = pd.DataFrame(AFFILIATIONS, columns=["affiliation", "email"])
+        
+        result = classify_author_table(table)
+        
+        expected = [classify_affiliation(affiliation, email) for affiliation, email in AFFILIATIONS]
+        actual = list(zip(result["is_non_academic"], result["company_affiliation"]))
+        self.assertEqual(actual, expected)
+    
+    def test_classifies_each_distinct_affiliation_once(self):
+        """Test that repeated affiliations are classified once and mapped back to every row."""
+        table = pd.DataFrame(AFFILIATIONS * 50, columns=["affiliation", "email"])
+        
+        with patch("pubmed_paper_finder.columnar.extract_company_name", return_value="Name") as extract:
+            result = classify_author_table(table)
+        
+        self.assertEqual(extract.call_count, 4)
+        self.assertEqual(len(result), len(AFFILIATIONS) * 50)
+        expected = [classify_affiliation(affiliation, email)[0] for affiliation, email in AFFILIATIONS] * 50
+        self.assertEqual(list(result["is_non_academic"]), expected)
+    
+    def test_papers_to_author_table(self):
+        """Test flattening papers into one row per author."""
+        papers = [
+            Paper(
+                pubmed_id="12345",
+                title="Test Paper",
+                publication_date=date(2023, 5, 15),
+                authors=[
+                    Author(name="John Smith", affiliation="Pfizer Inc., New York, NY, USA"),
+                    Author(name="Alice Johnson", affiliation="Stanford University", is_corresponding=True)
+                ]
+            )
+        ]
+        
+        table = classify_author_table(papers_to_author_table(papers))
+        
+        self.assertEqual(list(table["name"]), ["John Smith", "Alice Johnson"])
+        self.assertEqual(list(table["is_non_academic"]), [True, False])
+        self.assertEqual(table["company_affiliation"][0], "Pfizer Inc.")
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 from datetime import date
 
@@ -5,7 +7,8 @@ from pubmed_paper_finder.models import Author, Paper
 from pubmed_paper_finder.filters import (
     is_non_academic_author,
     extract_company_name,
-    identify_non_academic_authors
+    identify_non_academic_authors,
+    AffiliationCache
 )
 
 class TestFilters(unittest.TestCase):
@@ -44,4 +47,70 @@ class TestFilters(unittest.TestCase):
             affiliation="National Institutes of Health, Bethesda, MD, USA",
             email="bob.williams@nih.gov"
         )
-        self.assertFalse(is_non_academic_author(author))
\ No newline at end of file
+        self.assertFalse(is_non_academic_author(author))
+    
+    def test_is_non_academic_author_academic_with_pharma_keyword(self):
+        """Test that a pharma keyword overrides an academic keyword."""
+        author = Author(
+            name="Carol White",
+            affiliation="Novartis Institutes for BioMedical Research, Research Institute, Basel"
+        )
+        self.assertTrue(is_non_academic_author(author))
+    
+    def test_company_suffix_must_be_whole_word(self):
+        """Test that company suffixes only match as whole words."""
+        self.assertFalse(is_non_academic_author(Author(name="A", affiliation="Incline Village, Nevada")))
+        self.assertTrue(is_non_academic_author(Author(name="B", affiliation="Acme Ltd, Leeds")))
+    
+    def test_extract_company_name(self):
+        """Test extraction of the company segment from an affiliation."""
+        self.assertEqual(extract_company_name("Pfizer Inc., New York, NY, USA"), "Pfizer Inc.")
+        self.assertEqual(
+            extract_company_name("Oncology Unit, Genentech Biotech Research, South San Francisco"),
+            "Genentech Biotech Research"
+        )
+        self.assertEqual(extract_company_name("Acme Widgets, Berlin"), "Acme Widgets")
+    
+    def test_affiliation_cache_reuses_classifications(self):
+        """Test that repeated affiliations are classified once and give the same results."""
+        papers = [
+            Paper(
+                pubmed_id=str(i),
+                title="Test",
+                publication_date=date(2023, 1, 1),
+                authors=[
+                    Author(name="A", affiliation="Pfizer Inc., New York, NY, USA", email="a@pfizer.com"),
+                    Author(name="B", affiliation="  Pfizer Inc., New York, NY, USA", email="b@pfizer.com"),
+                    Author(name="C", affiliation="Stanford University, CA, USA")
+                ]
+            )
+            for i in range(3)
+        ]
+        cache = AffiliationCache()
+        
+        identify_non_academic_authors(papers, cache)
+        
+        self.assertEqual((cache.misses, cache.hits), (2, 7))
+        for paper in papers:
+            self.assertEqual([a.is_non_academic for a in paper.authors], [True, True, False])
+            self.assertEqual(paper.authors[1].company_affiliation, "Pfizer Inc.")
+    
+    def test_affiliation_cache_is_bounded_and_persistent(self):
+        """Test LRU eviction and saving/loading the cache."""
+        cache = AffiliationCache(maxsize=2)
+        cache.classify("Acme Ltd, Leeds", None)
+        cache.classify("Pfizer Inc., New York", None)
+        cache.classify("Acme Ltd, Leeds", None)
+        cache.classify("Stanford University", None)
+        self.assertEqual(len(cache), 2)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "affiliations.json")
+            cache.save(path)
+            self.assertEqual(os.listdir(tmpdir), ["affiliations.json"])
+            
+            loaded = AffiliationCache(path=path)
+            self.assertEqual(loaded.classify("Acme Ltd, Leeds", None), (True, "Acme Ltd"))
+            self.assertEqual((loaded.hits, loaded.misses), (1, 0))
+            loaded.classify("Pfizer Inc., New York", None)
+            self.assertEqual(loaded.misses, 1)
@@ -0,0 +1,87 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import date
+
+from pubmed_paper_finder.filters import AffiliationCache, identify_non_academic_authors
+from pubmed_paper_finder.gazetteer import CompanyGazetteer
+from pubmed_paper_finder.models import Author, Paper
+
+class TestCompanyGazetteer(unittest.TestCase):
+
+    def setUp(self):
+        self.gazetteer = CompanyGazetteer([
+            {"name": "Merck & Co., Inc.", "aliases": ["merck", "merck sharp & dohme"], "domains": ["merck.com"]},
+            {"name": "Merck KGaA", "aliases": ["merck kgaa"], "domains": ["merckgroup.com"]},
+            {"name": "F. Hoffmann-La Roche AG", "aliases": ["roche"], "domains": ["roche.com"]}
+        ])
+
+    def test_match_affiliation(self):
+        """Test alias matching on word boundaries, preferring the longest alias."""
+        self.assertEqual(self.gazetteer.match_affiliation("Merck KGaA, Darmstadt, Germany"), "Merck KGaA")
+        self.assertEqual(
+            self.gazetteer.match_affiliation("Merck Sharp & Dohme LLC, Rahway, NJ"), "Merck & Co., Inc."
+        )
+        self.assertEqual(self.gazetteer.match_affiliation("ROCHE Diagnostics GmbH"), "F. Hoffmann-La Roche AG")
+        self.assertIsNone(self.gazetteer.match_affiliation("University of Rochester, NY, USA"))
+        self.assertIsNone(self.gazetteer.match_affiliation(None))
+
+    def test_match_email(self):
+        """Test email domain lookup, including subdomains."""
+        self.assertEqual(self.gazetteer.match_email("jane.doe@us.merck.com"), "Merck & Co., Inc.")
+        self.assertEqual(self.gazetteer.match_email("x@MerckGroup.com"), "Merck KGaA")
+        self.assertIsNone(self.gazetteer.match_email("someone@gmail.com"))
+        self.assertIsNone(self.gazetteer.match_email("not-an-email"))
+
+    def test_resolve_prefers_affiliation(self):
+        """Test that the affiliation wins over the email domain."""
+        self.assertEqual(self.gazetteer.resolve("Merck KGaA, Darmstadt", "a@merck.com"), "Merck KGaA")
+        self.assertEqual(self.gazetteer.resolve("Acme Labs Inc.", "a@roche.com"), "F. Hoffmann-La Roche AG")
+
+    def test_load(self):
+        """Test loading a gazetteer from a JSON file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "companies.json")
+            with open(path, "w") as f:
+                json.dump([{"name": "Acme Biotherapeutics Ltd", "aliases": ["acme bio"]}], f)
+
+            gazetteer = CompanyGazetteer.load(path)
+
+        self.assertEqual(len(gazetteer), 1)
+        self.assertEqual(gazetteer.match_affiliation("Acme Bio, London"), "Acme Biotherapeutics Ltd")
+        self.assertEqual(
+            gazetteer.match_affiliation("Acme Biotherapeutics Ltd, London"), "Acme Biotherapeutics Ltd"
+        )
+
+    def test_default(self):
+        """Test the built-in gazetteer."""
+        gazetteer = CompanyGazetteer.default()
+
+        self.assertEqual(gazetteer.match_affiliation("Pfizer Inc., New York, NY, USA"), "Pfizer Inc.")
+        self.assertEqual(gazetteer.match_affiliation("Janssen Research & Development"), "Johnson & Johnson")
+
+    def test_identify_non_academic_authors(self):
+        """Test that classification reports canonical names, with and without a cache."""
+        def make_paper():
+            return Paper(
+                pubmed_id="1",
+                title="Test",
+                publication_date=date(2023, 1, 1),
+                authors=[
+                    Author(name="A", affiliation="Research Labs, Merck Sharp & Dohme LLC, Rahway, NJ"),
+                    Author(name="B", affiliation="Acme Therapeutics Inc., Boston, MA"),
+                    Author(name="C", affiliation="Stanford University, CA, USA")
+                ]
+            )
+
+        for cache in (None, AffiliationCache()):
+            paper = identify_non_academic_authors([make_paper()], cache, self.gazetteer)[0]
+
+            self.assertEqual(paper.authors[0].company_affiliation, "Merck & Co., Inc.")
+            self.assertEqual(paper.authors[1].company_affiliation, "Acme Therapeutics Inc.")
+            self.assertFalse(paper.authors[2].is_non_academic)
+            self.assertIsNone(paper.authors[2].company_affiliation)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from pubmed_paper_finder.incremental import IncrementalState
+from pubmed_paper_finder.models import Paper, Author
+from pubmed_paper_finder.module import find_papers_with_company_authors_incremental
+
+def make_paper(pmid, affiliation="Pfizer Inc., New York, NY, USA"):
+    return Paper(
+        pubmed_id=pmid,
+        title=f"Paper {pmid}",
+        publication_date=date(2023, 5, 15),
+        authors=[Author(name="John Smith", affiliation=affiliation)]
+    )
+
+class TestIncrementalSearch(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.state_path = os.path.join(self.tmpdir.name, "state.json")
+        
+        self.api = MagicMock()
+        self.api.__enter__.return_value = self.api
+        self.api.fetch_papers.side_effect = lambda pmids: [self.papers[pmid] for pmid in pmids]
+        patcher = patch('pubmed_paper_finder.module.PubMedAPI', return_value=self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_first_run_then_delta(self):
+        """Test that a later run fetches only new or revised papers and merges them."""
+        self.papers = {"10": make_paper("10"), "11": make_paper("11")}
+        self.api.search.return_value = ["11", "10"]
+        
+        papers = find_papers_with_company_authors_incremental("cancer", self.state_path)
+        self.assertEqual([paper.pubmed_id for paper in papers], ["11", "10"])
+        self.api.search.assert_called_once_with("cancer", max_results=100)
+        
+        state = IncrementalState(self.state_path).get("cancer")
+        self.assertEqual(state.max_pmid, 11)
+        self.assertIsNotNone(state.last_run)
+        
+        # Next run: 12 is new, 10 was revised and lost its company author,
+        # 11 reappears from the overlapping watermark day but is unchanged
+        self.papers = {"10": make_paper("10", "Harvard University"), "12": make_paper("12")}
+        self.api.search_page.side_effect = lambda query, retmax, mindate, datetype: (
+            (["12", "11"], 2) if datetype == "edat" else (["10"], 1)
+        )
+        
+        papers = find_papers_with_company_authors_incremental("cancer", self.state_path)
+        
+        self.assertEqual(self.api.fetch_papers.call_args[0][0], ["12", "10"])
+        self.assertEqual(self.api.search_page.call_args.kwargs["mindate"], state.last_run)
+        self.assertEqual([paper.pubmed_id for paper in papers], ["12", "11"])
+        self.assertTrue(all(paper.non_academic_authors for paper in papers))
+    
+    def _seed_state(self, last_run="2024/01/01", max_pmid=100):
+        state = IncrementalState(self.state_path)
+        state.get("cancer").last_run = last_run
+        state.get("cancer").max_pmid = max_pmid
+        state.save()
+    
+    def test_delta_larger_than_max_results_is_paged(self):
+        """Test that a delta larger than max_results is paged through completely."""
+        self._seed_state()
+        added = [str(pmid) for pmid in range(250, 100, -1)]
+        self.papers = {pmid: make_paper(pmid) for pmid in added}
+        
+        def search_page(query, retmax, mindate, datetype, retstart=0):
+            hits = added if datetype == "edat" else []
+            return hits[retstart:retstart + retmax], len(hits)
+        
+        self.api.search_page.side_effect = search_page
+        
+        papers = find_papers_with_company_authors_incremental("cancer", self.state_path, max_results=100)
+        
+        self.assertEqual(self.api.fetch_papers.call_args[0][0], added)
+        self.assertEqual(len(papers), 150)
+        state = IncrementalState(self.state_path).get("cancer")
+        self.assertNotEqual(state.last_run, "2024/01/01")
+        self.assertEqual(state.max_pmid, 250)
+    
+    def test_incomplete_delta_keeps_watermark(self):
+        """Test that the watermark does not advance when esearch returns fewer IDs than it counts."""
+        self._seed_state()
+        self.papers = {"101": make_paper("101")}
+        self.api.search_page.side_effect = lambda query, retmax, mindate, datetype, retstart=0: (
+            (["101"], 5) if datetype == "edat" and not retstart else ([], 5 if datetype == "edat" else 0)
+        )
+        
+        with self.assertLogs("pubmed_paper_finder.module", level="WARNING"):
+            papers = find_papers_with_company_authors_incremental("cancer", self.state_path)
+        
+        self.assertEqual([paper.pubmed_id for paper in papers], ["101"])
+        state = IncrementalState(self.state_path).get("cancer")
+        self.assertEqual((state.last_run, state.max_pmid), ("2024/01/01", 100))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import csv
+import gzip
+import os
+import tempfile
+import unittest
+
+from pubmed_paper_finder.ingest import ingest_baseline_files, ingest_file, output_path_for
+from tests.test_parsers import SAMPLE_XML
+
+class TestIngest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.tmpdir.name, "pubmed24n0001.xml.gz")
+        with gzip.open(self.input_path, "wt", encoding="utf-8") as f:
+            f.write(SAMPLE_XML)
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+    
+    def test_output_path_for(self):
+        """Test the naming of per-file outputs."""
+        self.assertEqual(output_path_for("/data/pubmed24n0001.xml.gz", "/out"), "/out/pubmed24n0001.csv")
+    
+    def test_ingest_file(self):
+        """Test that a gzip dump is parsed, classified and written as CSV."""
+        output_path = os.path.join(self.tmpdir.name, "out.csv")
+        
+        count = ingest_file(self.input_path, output_path)
+        
+        with open(output_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(count, 1)
+        self.assertEqual(rows[0]["PubmedID"], "111")
+        self.assertEqual(rows[0]["Non-academic Author(s)"], "John Smith")
+        self.assertEqual(rows[0]["Corresponding Author Email"], "john.smith@pfizer.com")
+    
+    def test_ingest_baseline_files(self):
+        """Test ingesting files through the process pool."""
+        output_dir = os.path.join(self.tmpdir.name, "results")
+        
+        results = ingest_baseline_files([self.input_path], output_dir, workers=1)
+        
+        self.assertEqual(results, {self.input_path: 1})
+        self.assertTrue(os.path.exists(os.path.join(output_dir, "pubmed24n0001.csv")))
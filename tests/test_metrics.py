@@ -0,0 +1,73 @@
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pubmed_paper_finder.api import PubMedAPI
+from pubmed_paper_finder.filters import AffiliationCache
+from pubmed_paper_finder.metrics import Metrics
+from pubmed_paper_finder.module import _iter_classified_batches
+from pubmed_paper_finder.ratelimit import RateLimiter
+
+class TestMetrics(unittest.TestCase):
+    
+    def test_report(self):
+        """Test that stage timings, counters and derived rates are reported."""
+        metrics = Metrics()
+        with metrics.stage("parse"):
+            pass
+        metrics.add_time("parse", 0.5, 0.25)
+        metrics.increment("articles_parsed", 10)
+        metrics.increment("affiliation_cache_hits", 3)
+        metrics.increment("affiliation_cache_misses", 1)
+        
+        report = metrics.report()
+        
+        self.assertEqual(report["stages"]["parse"]["calls"], 2)
+        self.assertGreaterEqual(report["stages"]["parse"]["wall_seconds"], 0.5)
+        self.assertEqual(report["counters"]["articles_parsed"], 10)
+        self.assertEqual(report["rates"]["affiliation_cache_hit_rate"], 0.75)
+        self.assertIn("articles_per_sec", report["rates"])
+    
+    def test_to_prometheus(self):
+        """Test the Prometheus text exposition output."""
+        metrics = Metrics()
+        metrics.add_time("efetch", 1.5, 0.1)
+        metrics.increment("requests", 2)
+        
+        text = metrics.to_prometheus(prefix="pf")
+        
+        self.assertIn('pf_stage_wall_seconds{stage="efetch"} 1.5\n', text)
+        self.assertIn("# TYPE pf_requests counter\npf_requests 2\n", text)
+    
+    @patch('pubmed_paper_finder.api.requests.Session.get')
+    def test_api_records_requests(self, mock_get):
+        """Test that the API client records requests, bytes, retries and stage timings."""
+        mock_response = MagicMock()
+        mock_response.content = b'{"esearchresult": {"idlist": ["1"]}}'
+        mock_response.json.return_value = {"esearchresult": {"idlist": ["1"]}}
+        mock_response.raw.retries.history = ("first attempt",)
+        mock_get.return_value = mock_response
+        
+        metrics = Metrics()
+        api = PubMedAPI(rate_limiter=RateLimiter(1000.0), metrics=metrics)
+        api.search("test query")
+        
+        report = metrics.report()
+        self.assertEqual(report["counters"]["requests"], 1)
+        self.assertEqual(report["counters"]["retries"], 1)
+        self.assertEqual(report["counters"]["bytes_downloaded"], len(mock_response.content))
+        self.assertEqual(report["stages"]["esearch"]["calls"], 1)
+
+    def test_classify_stage_excludes_consumer(self):
+        """Test that time spent by the consumer of classified batches is not timed as classifying."""
+        metrics = Metrics()
+        
+        for _ in _iter_classified_batches(iter([[], []]), AffiliationCache(), None, metrics):
+            time.sleep(0.1)
+        
+        stage = metrics.report()["stages"]["classify"]
+        self.assertEqual(stage["calls"], 2)
+        self.assertLess(stage["wall_seconds"], 0.1)
+
+if __name__ == '__main__':
+    unittest.main()
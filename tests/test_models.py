@@ -0,0 +1,91 @@
+import pickle
+import unittest
+from dataclasses import asdict, fields
+from datetime import date
+
+from pubmed_paper_finder.models import Author, Paper, CompactPaper, StringPool, compact_papers
+
+class TestModels(unittest.TestCase):
+    
+    def setUp(self):
+        self.papers = [
+            Paper(
+                pubmed_id=str(i),
+                title=f"Paper {i}",
+                publication_date=date(2023, 5, 15),
+                authors=[
+                    Author(
+                        name="John Smith",
+                        affiliation="".join(["Pfizer Inc.", ", New York, NY, USA"]),
+                        email="john.smith@pfizer.com",
+                        is_non_academic=True,
+                        company_affiliation="Pfizer Inc."
+                    ),
+                    Author(name="Alice Johnson", affiliation="Stanford University", is_corresponding=True)
+                ]
+            )
+            for i in range(3)
+        ]
+    
+    def test_paper_dict_round_trip(self):
+        """Test serializing a paper to a dictionary and back."""
+        paper = self.papers[0]
+        self.assertEqual(Paper.from_dict(paper.to_dict()), paper)
+    
+    def test_compact_papers_keep_public_attributes(self):
+        """Test that compact papers expose the same data and derived properties."""
+        compact = compact_papers(self.papers)
+        
+        for original, paper in zip(self.papers, compact):
+            self.assertIsInstance(paper, CompactPaper)
+            self.assertFalse(hasattr(paper, "__dict__"))
+            self.assertEqual(paper.to_dict(), original.to_dict())
+            self.assertEqual([a.name for a in paper.non_academic_authors], ["John Smith"])
+            self.assertEqual(paper.company_affiliations, ["Pfizer Inc."])
+            self.assertIsNone(paper.corresponding_author_email)
+        
+        self.assertEqual(pickle.loads(pickle.dumps(compact[0])), compact[0])
+    
+    def test_compact_papers_intern_repeated_strings(self):
+        """Test that repeated affiliations share one string object."""
+        pool = StringPool()
+        compact = compact_papers(self.papers, pool)
+        
+        affiliations = {id(paper.authors[0].affiliation) for paper in compact}
+        self.assertEqual(len(affiliations), 1)
+        self.assertIs(compact[0].publication_date, compact[2].publication_date)
+    
+    def test_derived_properties_are_cached_and_invalidated(self):
+        """Test that derived properties are computed once and refreshed when authors change."""
+        paper = self.papers[0]
+        first = paper.non_academic_authors
+        self.assertIs(paper.non_academic_authors, first)
+        
+        # Authors changed in place, without invalidate_derived()
+        paper.authors[1].is_non_academic = True
+        paper.authors[1].company_affiliation = "Stanford Spin-off Ltd"
+        self.assertEqual(len(paper.non_academic_authors), 2)
+        self.assertEqual(sorted(paper.company_affiliations), ["Pfizer Inc.", "Stanford Spin-off Ltd"])
+        
+        paper.authors = [Author(name="Bob", email="bob@example.com", is_corresponding=True)]
+        self.assertEqual(paper.non_academic_authors, [])
+        self.assertEqual(paper.corresponding_author_email, "bob@example.com")
+        
+        paper.authors.append(Author(name="Eve", is_non_academic=True, company_affiliation="Acme Ltd"))
+        self.assertEqual(paper.company_affiliations, ["Acme Ltd"])
+        
+        compact = compact_papers([paper])[0]
+        self.assertEqual(compact.company_affiliations, ["Acme Ltd"])
+        compact.authors[0].is_non_academic = True
+        self.assertEqual(len(compact.non_academic_authors), 2)
+    
+    def test_derived_cache_is_not_a_field(self):
+        """Test that the derived-property cache stays out of fields, asdict and comparisons."""
+        for paper in (self.papers[0], compact_papers(self.papers)[0]):
+            paper.non_academic_authors
+            self.assertNotIn("_derived", [f.name for f in fields(paper)])
+            self.assertNotIn("_derived", asdict(paper))
+        
+        copy = Paper.from_dict(self.papers[0].to_dict())
+        self.papers[0].non_academic_authors
+        self.assertEqual(copy, self.papers[0])
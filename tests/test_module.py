@@ -0,0 +1,161 @@
+import csv
+import io
+import os
+import tempfile
+import unittest
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from pubmed_paper_finder.filters import identify_non_academic_authors
+from pubmed_paper_finder.models import Author, CompactPaper, Paper, compact_papers
+from pubmed_paper_finder.module import (
+    export_papers_for_queries,
+    find_and_export_papers,
+    find_papers_for_queries,
+    find_papers_offline,
+    find_papers_with_company_authors,
+    stream_papers_to_csv
+)
+
+def make_paper(pmid, affiliation):
+    return Paper(
+        pubmed_id=pmid,
+        title=f"Paper {pmid}",
+        publication_date=date(2023, 5, 15),
+        authors=[Author(name="John Smith", affiliation=affiliation)]
+    )
+
+class TestStreamingPipeline(unittest.TestCase):
+    
+    def setUp(self):
+        self.output = io.StringIO()
+        self.batches = [
+            [make_paper("1", "Pfizer Inc., New York, NY, USA"), make_paper("2", "Harvard University")],
+            [make_paper("3", "Genentech, Inc., South San Francisco, CA")]
+        ]
+        
+        api = MagicMock()
+        api.__enter__.return_value = api
+        api.search.return_value = ["1", "2", "3"]
+        api.iter_paper_batches.side_effect = self._iter_batches
+        patcher = patch('pubmed_paper_finder.module.PubMedAPI', return_value=api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def _iter_batches(self, pmids):
+        for batch in self.batches:
+            # Every earlier batch must already be on the output when the next one arrives
+            self.rows_before_batch = self.output.getvalue().count("\n")
+            yield batch
+    
+    def test_stream_papers_to_csv(self):
+        """Test that each batch is written out before the next one is fetched."""
+        count = stream_papers_to_csv("cancer", self.output)
+        
+        self.assertEqual(count, 2)
+        # Header plus the company paper of the first batch
+        self.assertEqual(self.rows_before_batch, 2)
+        
+        rows = list(csv.DictReader(io.StringIO(self.output.getvalue())))
+        self.assertEqual([row["PubmedID"] for row in rows], ["1", "3"])
+    
+    def test_find_papers_matches_stream(self):
+        """Test that the collected results equal the streamed ones."""
+        papers = find_papers_with_company_authors("cancer")
+        self.assertEqual([paper.pubmed_id for paper in papers], ["1", "3"])
+    
+    def test_find_papers_compacts_each_batch(self):
+        """Test that compact results are built batch by batch with one shared string pool."""
+        self.batches[1][0].authors[0].affiliation = "Pfizer Inc., New York, NY, USA"
+        
+        with patch('pubmed_paper_finder.module.compact_papers', wraps=compact_papers) as mock_compact:
+            papers = find_papers_with_company_authors("cancer", compact=True)
+        
+        self.assertEqual([paper.pubmed_id for paper in papers], ["1", "3"])
+        self.assertIsInstance(papers[0], CompactPaper)
+        self.assertEqual(mock_compact.call_count, 2)
+        self.assertIs(papers[0].authors[0].affiliation, papers[1].authors[0].affiliation)
+    
+    def test_export_passes_options_through(self):
+        """Test that find_and_export_papers hands its options to the search functions."""
+        with patch('pubmed_paper_finder.module.iter_company_paper_batches', return_value=iter([])) as mock_iter:
+            find_and_export_papers("cancer", None, 50, max_workers=2, use_history=True)
+        
+        self.assertEqual(mock_iter.call_args[0], ("cancer", 50))
+        self.assertEqual(mock_iter.call_args[1]["max_workers"], 2)
+        self.assertTrue(mock_iter.call_args[1]["use_history"])
+        
+        # Incremental runs drop the options they do not support
+        with patch('pubmed_paper_finder.module.find_papers_with_company_authors_incremental',
+                   return_value=[]) as mock_incremental:
+            find_and_export_papers("cancer", state_path="state.json", use_history=True, max_workers=2)
+        
+        self.assertNotIn("use_history", mock_incremental.call_args[1])
+        self.assertEqual(mock_incremental.call_args[1]["max_workers"], 2)
+    
+    def test_store_and_query_offline(self):
+        """Test that fetched papers are stored and can be queried without the API."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store_path = os.path.join(tmpdir, "papers.db")
+            find_papers_with_company_authors("cancer", store_path=store_path)
+            
+            papers = find_papers_offline("paper", store_path)
+            
+            self.assertEqual([paper.pubmed_id for paper in papers], ["1", "3"])
+            self.assertEqual(papers[0].company_affiliations, ["Pfizer Inc."])
+            self.assertEqual(find_papers_offline("genentech", store_path)[0].pubmed_id, "3")
+
+class TestBatchQueries(unittest.TestCase):
+    
+    def setUp(self):
+        self.papers = {
+            "1": make_paper("1", "Pfizer Inc., New York, NY, USA"),
+            "2": make_paper("2", "Harvard University"),
+            "3": make_paper("3", "Genentech, Inc., South San Francisco, CA")
+        }
+        hits = {"aspirin": ["1", "2"], "ibuprofen": ["2", "3", "1"]}
+        
+        self.api = MagicMock()
+        self.api.__enter__.return_value = self.api
+        self.api.search.side_effect = lambda query, max_results: hits[query]
+        self.api.fetch_papers.side_effect = lambda pmids: [self.papers[pmid] for pmid in pmids]
+        patcher = patch('pubmed_paper_finder.module.PubMedAPI', return_value=self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_each_paper_fetched_once(self):
+        """Test that overlapping queries fetch the union of their PMIDs once."""
+        results = find_papers_for_queries(["aspirin", "ibuprofen", "aspirin"])
+        
+        self.api.fetch_papers.assert_called_once_with(["1", "2", "3"])
+        self.assertEqual(
+            {query: [paper.pubmed_id for paper in papers] for query, papers in results.items()},
+            {"aspirin": ["1"], "ibuprofen": ["3", "1"]}
+        )
+    
+    def test_processes_use_pipeline(self):
+        """Test that batch runs with worker processes fetch the union through the pipeline."""
+        with patch('pubmed_paper_finder.module.iter_pipeline_batches') as mock_pipeline:
+            mock_pipeline.side_effect = lambda api, pmids, **kwargs: iter([
+                identify_non_academic_authors([self.papers[pmid] for pmid in pmids])
+            ])
+            results = find_papers_for_queries(["aspirin", "ibuprofen"], processes=2)
+        
+        self.assertEqual(mock_pipeline.call_args[0][1], ["1", "2", "3"])
+        self.assertEqual(mock_pipeline.call_args[1]["processes"], 2)
+        self.api.fetch_papers.assert_not_called()
+        self.assertEqual([paper.pubmed_id for paper in results["ibuprofen"]], ["3", "1"])
+    
+    def test_export_one_file_per_query(self):
+        """Test that batch export writes a result file per query."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = export_papers_for_queries(["aspirin", "ibuprofen"], tmpdir)
+            
+            self.assertEqual(len(set(paths.values())), 2)
+            with open(paths["ibuprofen"], newline="") as f:
+                rows = list(csv.DictReader(f))
+        
+        self.assertEqual([row["PubmedID"] for row in rows], ["3", "1"])
+
+if __name__ == '__main__':
+    unittest.main()
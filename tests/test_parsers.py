@@ -0,0 +1,103 @@
+import unittest
+from datetime import date
+
+from pubmed_paper_finder.parsers import iter_articles, parse_fetch_response
+
+SAMPLE_XML = """<?xml version="1.0" ?>
+<!DOCTYPE PubmedArticleSet PUBLIC "-//NLM//DTD PubMedArticle, 1st January 2019//EN" "https://dtd.nlm.nih.gov/ncbi/pubmed/out/pubmed_190101.dtd">
+<PubmedArticleSet>
+    <PubmedArticle>
+        <MedlineCitation Status="MEDLINE" Owner="NLM">
+            <PMID Version="1">111</PMID>
+            <DateRevised><Year>2022</Year><Month>08</Month><Day>14</Day></DateRevised>
+            <Article PubModel="Print">
+                <Journal>
+                    <JournalIssue CitedMedium="Internet">
+                        <PubDate><Year>2021</Year><Month>02</Month></PubDate>
+                    </JournalIssue>
+                </Journal>
+                <ArticleTitle>Effects of <i>in vivo</i> dosing &amp; response</ArticleTitle>
+                <AuthorList CompleteYN="Y">
+                    <Author ValidYN="Y">
+                        <LastName>Smith</LastName>
+                        <ForeName>John</ForeName>
+                        <Identifier Source="CORRESP">yes</Identifier>
+                        <AffiliationInfo>
+                            <Affiliation>Pfizer Inc., New York, NY, USA. john.smith@pfizer.com</Affiliation>
+                        </AffiliationInfo>
+                    </Author>
+                    <Author ValidYN="Y">
+                        <LastName>Curie</LastName>
+                    </Author>
+                    <Author ValidYN="Y">
+                        <CollectiveName>COVID Study Group</CollectiveName>
+                    </Author>
+                    <Author ValidYN="Y">
+                        <Initials>X</Initials>
+                    </Author>
+                </AuthorList>
+            </Article>
+        </MedlineCitation>
+        <PubmedData>
+            <History>
+                <PubMedPubDate PubStatus="received"><Year>2020</Year><Month>11</Month><Day>3</Day></PubMedPubDate>
+                <PubMedPubDate PubStatus="pubmed"><Year>2021</Year><Month>3</Month><Day>9</Day></PubMedPubDate>
+            </History>
+        </PubmedData>
+    </PubmedArticle>
+    <PubmedArticle>
+        <MedlineCitation>
+            <PMID Version="1">222</PMID>
+            <Article>
+                <ArticleDate DateType="Electronic"><Year>2019</Year></ArticleDate>
+            </Article>
+        </MedlineCitation>
+    </PubmedArticle>
+    <PubmedArticle>
+        <MedlineCitation>
+            <PMID Version="1">333</PMID>
+            <Article>
+                <ArticleTitle>Unparseable month</ArticleTitle>
+                <Journal><JournalIssue><PubDate><Year>2020</Year><Month>May</Month></PubDate></JournalIssue></Journal>
+            </Article>
+        </MedlineCitation>
+    </PubmedArticle>
+</PubmedArticleSet>
+"""
+
+class TestParsers(unittest.TestCase):
+    
+    def test_lxml_matches_beautifulsoup(self):
+        """Test that the lxml backend produces exactly the BeautifulSoup output."""
+        self.assertEqual(
+            parse_fetch_response(SAMPLE_XML, parser="lxml"),
+            parse_fetch_response(SAMPLE_XML, parser="bs4")
+        )
+    
+    def test_lxml_parsing(self):
+        """Test the fields extracted by the streaming lxml backend."""
+        papers = list(iter_articles(SAMPLE_XML.encode("utf-8")))
+        
+        # The article with a non-numeric month is skipped, as with BeautifulSoup
+        self.assertEqual([p.pubmed_id for p in papers], ["111", "222"])
+        
+        paper = papers[0]
+        self.assertEqual(paper.title, "Effects of in vivo dosing & response")
+        self.assertEqual(paper.publication_date, date(2021, 3, 9))
+        self.assertEqual(paper.last_revised, date(2022, 8, 14))
+        self.assertEqual(
+            [a.name for a in paper.authors],
+            ["John Smith", "Curie", "COVID Study Group"]
+        )
+        self.assertTrue(paper.authors[0].is_corresponding)
+        self.assertEqual(paper.authors[0].email, "john.smith@pfizer.com")
+        self.assertIsNone(paper.authors[1].affiliation)
+        
+        self.assertEqual(papers[1].title, "Unknown Title")
+        self.assertEqual(papers[1].publication_date, date(2019, 1, 1))
+        self.assertIsNone(papers[1].last_revised)
+    
+    def test_unknown_parser(self):
+        """Test that an unknown parser backend is rejected."""
+        with self.assertRaises(ValueError):
+            parse_fetch_response(SAMPLE_XML, parser="html")
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from pubmed_paper_finder.api import FETCH_BATCH_SIZE, PubMedAPI
+from pubmed_paper_finder.cache import ArticleCache
+from pubmed_paper_finder.parsers import parse_fetch_response
+from pubmed_paper_finder.pipeline import iter_pipeline_batches
+from pubmed_paper_finder.ratelimit import RateLimiter
+
+AFFILIATIONS = ["Pfizer Inc., New York, NY, USA", "Harvard University, Boston, MA, USA"]
+
+def efetch_xml(pmids):
+    articles = "".join(
+        f"""<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>
+        <Journal><JournalIssue><PubDate><Year>2023</Year></PubDate></JournalIssue></Journal>
+        <ArticleTitle>Paper {pmid}</ArticleTitle><AuthorList><Author>
+        <LastName>Smith</LastName><ForeName>John</ForeName>
+        <AffiliationInfo><Affiliation>{AFFILIATIONS[int(pmid) % 2]}</Affiliation></AffiliationInfo>
+        </Author></AuthorList></Article></MedlineCitation></PubmedArticle>"""
+        for pmid in pmids
+    )
+    return f"<PubmedArticleSet>{articles}</PubmedArticleSet>".encode("utf-8")
+
+def fetch_raw(pmids):
+    return [efetch_xml(pmids)]
+
+class TestPipeline(unittest.TestCase):
+    
+    def setUp(self):
+        self.api = PubMedAPI(max_workers=2, rate_limiter=RateLimiter(1000.0))
+        self.addCleanup(self.api.close)
+    
+    def test_batches_parsed_and_classified_in_order(self):
+        """Test that worker processes parse and classify every batch, yielded in PMID order."""
+        pmids = [str(i) for i in range(FETCH_BATCH_SIZE * 3 + 7)]
+        
+        with patch.object(self.api, 'fetch_raw', side_effect=fetch_raw) as mock_fetch_raw:
+            batches = list(iter_pipeline_batches(self.api, pmids, processes=2, max_in_flight=2))
+        
+        self.assertEqual(mock_fetch_raw.call_count, 4)
+        self.assertEqual([paper.pubmed_id for batch in batches for paper in batch], pmids)
+        for batch in batches:
+            for paper in batch:
+                self.assertEqual(bool(paper.non_academic_authors), int(paper.pubmed_id) % 2 == 0)
+        self.assertEqual(self.api.metrics.report()["counters"]["articles_parsed"], len(pmids))
+    
+    def test_only_uncached_articles_fetched(self):
+        """Test that cached articles are skipped and merged back in PMID order."""
+        pmids = [str(i) for i in range(200)]
+        with tempfile.TemporaryDirectory() as tmpdir, ArticleCache(os.path.join(tmpdir, "a.db")) as cache:
+            cache.put_many(parse_fetch_response(efetch_xml([pmid for pmid in pmids if int(pmid) % 4])))
+            self.api.cache = cache
+            
+            with patch.object(self.api, 'fetch_raw', side_effect=fetch_raw) as mock_fetch_raw:
+                batches = list(iter_pipeline_batches(self.api, pmids, processes=1))
+            
+            # Papers classified by the workers are cached as parsed
+            self.assertFalse(any(
+                author.is_non_academic or author.company_affiliation
+                for paper in cache.get_many(pmids).values() for author in paper.authors
+            ))
+        
+        self.assertEqual([len(call[0][0]) for call in mock_fetch_raw.call_args_list], [FETCH_BATCH_SIZE])
+        self.assertEqual([paper.pubmed_id for batch in batches for paper in batch], pmids)
+        self.assertTrue(batches[0][0].non_academic_authors)
+    
+    def test_failed_batch_split(self):
+        """Test that a batch failing with a server error is fetched in halves and parsed as one."""
+        def respond(method, url, params, **kwargs):
+            ids = params['id'].split(",")
+            if len(ids) > 25:
+                raise requests.HTTPError(response=MagicMock(status_code=503))
+            return MagicMock(content=efetch_xml(ids)), 0.1
+        
+        pmids = [str(i) for i in range(FETCH_BATCH_SIZE)]
+        with patch.object(self.api, '_request', side_effect=respond) as mock_request:
+            batches = list(iter_pipeline_batches(self.api, pmids, processes=1))
+        
+        self.assertEqual([len(call[0][2]['id'].split(",")) for call in mock_request.call_args_list], [50, 25, 25])
+        self.assertEqual([paper.pubmed_id for paper in batches[0]], pmids)
+        self.assertEqual(self.api.metrics.report()["counters"]["efetch_batch_splits"], 1)
+    
+    @patch('pubmed_paper_finder.api.requests.Session.get')
+    def test_connection_error_not_split(self, mock_get):
+        """Test that a connection error is raised without splitting the batch."""
+        mock_get.side_effect = requests.ConnectionError("refused")
+        
+        with self.assertRaises(requests.ConnectionError):
+            list(iter_pipeline_batches(self.api, [str(i) for i in range(FETCH_BATCH_SIZE)], processes=1))
+        self.assertEqual(mock_get.call_count, 1)
+    
+    def test_workers_are_spawned(self):
+        """Test that worker processes are spawned, not forked from the threaded parent."""
+        with patch('pubmed_paper_finder.pipeline.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as mock_pool, \
+                patch.object(self.api, 'fetch_raw', side_effect=fetch_raw):
+            list(iter_pipeline_batches(self.api, ["1", "2"], processes=1))
+        
+        self.assertEqual(mock_pool.call_args[1]["mp_context"].get_start_method(), "spawn")
+    
+    def test_fetch_error_propagates(self):
+        """Test that a failed fetch is raised to the consumer."""
+        with patch.object(self.api, 'fetch_raw', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                list(iter_pipeline_batches(self.api, ["1", "2"], processes=1))
+
+if __name__ == '__main__':
+    unittest.main()
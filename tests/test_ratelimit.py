@@ -0,0 +1,33 @@
+import unittest
+from unittest.mock import patch
+
+from pubmed_paper_finder.ratelimit import RateLimiter, ncbi_rate_limit
+
+class TestRateLimiter(unittest.TestCase):
+    
+    def test_ncbi_rate_limit(self):
+        """Test the NCBI limits with and without an API key."""
+        self.assertEqual(ncbi_rate_limit(), 3.0)
+        self.assertEqual(ncbi_rate_limit("secret"), 10.0)
+    
+    def test_first_request_does_not_wait(self):
+        """Test that a full bucket lets the first request through immediately."""
+        limiter = RateLimiter(rate=3.0)
+        self.assertEqual(limiter.acquire(), 0.0)
+    
+    @patch('pubmed_paper_finder.ratelimit.time.sleep')
+    @patch('pubmed_paper_finder.ratelimit.time.monotonic')
+    def test_waits_are_spaced_by_rate(self, mock_monotonic, mock_sleep):
+        """Test that back-to-back requests reserve consecutive slots."""
+        mock_monotonic.return_value = 100.0
+        limiter = RateLimiter(rate=4.0)
+        
+        waits = [limiter.acquire() for _ in range(3)]
+        
+        self.assertEqual(waits, [0.0, 0.25, 0.5])
+        self.assertEqual(mock_sleep.call_count, 2)
+    
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
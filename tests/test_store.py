@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+
+from pubmed_paper_finder.filters import identify_non_academic_authors
+from pubmed_paper_finder.models import Author, Paper
+from pubmed_paper_finder.store import PaperStore
+
+def make_paper(pmid, title, affiliation, published=date(2023, 5, 15)):
+    return Paper(
+        pubmed_id=pmid,
+        title=title,
+        publication_date=published,
+        authors=[
+            Author(name="John Smith", affiliation=affiliation),
+            Author(name="Alice Johnson", affiliation="Stanford University, CA, USA")
+        ]
+    )
+
+class TestPaperStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "papers.db")
+        self.papers = identify_non_academic_authors([
+            make_paper("1", "Gene therapy for cancer", "Pfizer Inc., New York, NY, USA", date(2021, 1, 1)),
+            make_paper("2", "Cancer screening outcomes", "Harvard University"),
+            make_paper("3", "Antibody therapy in cancer", "Genentech, Inc., South San Francisco, CA", date(2024, 3, 1)),
+            make_paper("4", "Vaccine adjuvants", "Pfizer Inc., New York, NY, USA")
+        ])
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_search(self):
+        """Test full-text queries, newest first, restricted to company-affiliated papers."""
+        with PaperStore(self.path) as store:
+            self.assertEqual(store.put_many(self.papers), 4)
+
+        with PaperStore(self.path) as store:
+            papers = store.search("cancer")
+            self.assertEqual([paper.pubmed_id for paper in papers], ["3", "1"])
+            self.assertEqual(papers[1], self.papers[0])
+
+            self.assertEqual([p.pubmed_id for p in store.search("pfizer")], ["4", "1"])
+            self.assertEqual([p.pubmed_id for p in store.search('"gene therapy"')], ["1"])
+            self.assertEqual(
+                [p.pubmed_id for p in store.search("cancer", company_only=False)], ["3", "2", "1"]
+            )
+
+    def test_filters(self):
+        """Test the company, date and limit filters."""
+        with PaperStore(self.path) as store:
+            store.put_many(self.papers)
+
+            self.assertEqual([p.pubmed_id for p in store.search(company="pfizer inc.")], ["4", "1"])
+            self.assertEqual([p.pubmed_id for p in store.search(mindate="2023/01/01")], ["3", "4"])
+            self.assertEqual([p.pubmed_id for p in store.search(maxdate="2022-12-31")], ["1"])
+            self.assertEqual(len(store.search(max_results=1)), 1)
+
+    def test_put_replaces(self):
+        """Test that storing a paper again replaces its text and classification."""
+        with PaperStore(self.path) as store:
+            store.put_many(self.papers)
+            store.put_many(identify_non_academic_authors([
+                make_paper("1", "Vaccine trial", "Harvard University")
+            ]))
+
+            self.assertEqual(len(store), 4)
+            self.assertEqual([p.pubmed_id for p in store.search("cancer")], ["3"])
+            self.assertEqual([p.pubmed_id for p in store.search("vaccine", company_only=False)], ["1", "4"])
+
+    def test_invalid_query(self):
+        """Test that malformed full-text queries raise ValueError."""
+        with PaperStore(self.path) as store:
+            with self.assertRaises(ValueError):
+                store.search('"unbalanced')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,22 @@
 import unittest
 from unittest.mock import patch, MagicMock
 import io
+import json
+import os
 import sys
+import tempfile
 import logging
 from datetime import date
 
 import pandas as pd
 
 from pubmed_paper_finder.models import Paper, Author
-from pubmed_paper_finder.utils import setup_logging, export_to_csv
+from pubmed_paper_finder.utils import setup_logging, export_to_csv, export_papers, CsvPaperWriter
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
 
 class TestUtils(unittest.TestCase):
     
@@ -67,10 +75,10 @@ class TestUtils(unittest.TestCase):
         call_kwargs = mock_basicConfig.call_args[1]
         self.assertEqual(call_kwargs['level'], logging.INFO)
     
-    @patch('pubmed_paper_finder.utils.pd.DataFrame.to_csv')
+    @patch('pandas.DataFrame.to_csv')
     def test_export_to_csv_with_file(self, mock_to_csv):
         """Test export_to_csv with a file path."""
-        result = export_to_csv(self.sample_papers, "test_output.csv")
+        result = export_to_csv(self.sample_papers, "test_output.csv", engine="pandas")
         
         # Check that to_csv was called with the right parameters
         mock_to_csv.assert_called_once()
@@ -95,4 +103,75 @@ class TestUtils(unittest.TestCase):
         
         # Should not contain paper without non-academic authors
         self.assertNotIn("67890", result)
-        self.assertNotIn("Test Paper 2", result)
\ No newline at end of file
+        self.assertNotIn("Test Paper 2", result)
+    
+    def test_csv_paper_writer_matches_export(self):
+        """Test that the incremental writer produces the export_to_csv output."""
+        stream = io.StringIO(newline="")
+        writer = CsvPaperWriter(stream)
+        
+        self.assertEqual(writer.write(self.sample_papers), 1)
+        self.assertEqual(stream.getvalue(), export_to_csv(self.sample_papers))
+    
+    def test_export_to_csv_engines_identical(self):
+        """Test that the csv and pandas engines produce byte-identical output."""
+        tricky = Paper(
+            pubmed_id="11111",
+            title='Quotes "here", commas, and\nnewlines',
+            publication_date=None,
+            authors=[Author(name="Bob, Jr.", affiliation="Genentech, Inc., South San Francisco, CA")]
+        )
+        papers = self.sample_papers + [tricky]
+        
+        self.assertEqual(export_to_csv(papers), export_to_csv(papers, engine="pandas"))
+        self.assertEqual(export_to_csv([]), export_to_csv([], engine="pandas"))
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = os.path.join(tmpdir, "csv.csv")
+            pandas_path = os.path.join(tmpdir, "pandas.csv")
+            self.assertIsNone(export_to_csv(papers, csv_path))
+            export_to_csv(papers, pandas_path, engine="pandas")
+            
+            with open(csv_path, "rb") as f1, open(pandas_path, "rb") as f2:
+                self.assertEqual(f1.read(), f2.read())
+    
+    def test_export_to_csv_unknown_engine(self):
+        """Test that an unknown engine is rejected."""
+        with self.assertRaises(ValueError):
+            export_to_csv(self.sample_papers, engine="polars")
+    
+    def test_export_papers_jsonl(self):
+        """Test that JSONL records keep authors and affiliations as lists."""
+        result = export_papers(self.sample_papers, output_format="jsonl")
+        
+        records = [json.loads(line) for line in result.splitlines()]
+        self.assertEqual(records, [{
+            "pubmed_id": "12345",
+            "title": "Test Paper 1",
+            "publication_date": "2023-05-15",
+            "non_academic_authors": ["John Smith"],
+            "company_affiliations": ["Pfizer Inc."],
+            "corresponding_author_email": "alice@stanford.edu"
+        }])
+    
+    def test_export_papers_parquet_requires_file(self):
+        """Test that Parquet output cannot be returned as a string."""
+        with self.assertRaises(ValueError):
+            export_papers(self.sample_papers, output_format="parquet")
+    
+    @unittest.skipIf(pq is None, "pyarrow is not installed")
+    def test_export_papers_parquet(self):
+        """Test that Parquet output has list-typed columns."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "results.parquet")
+            export_papers(self.sample_papers, path, output_format="parquet")
+            
+            rows = pq.read_table(path).to_pylist()
+        
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["non_academic_authors"], ["John Smith"])
+        self.assertEqual(rows[0]["company_affiliations"], ["Pfizer Inc."])
+        self.assertEqual(rows[0]["publication_date"], date(2023, 5, 15))
+
+if __name__ == '__main__':
+    unittest.main()